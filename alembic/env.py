@@ -20,6 +20,7 @@ from app.core.database import Base
 from app.models.user import User
 from app.models.incident import Incident
 from app.models.vehicle import DetectedVehicle, LicensePlate
+from app.models.upload import UploadSession
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,24 @@
+"""Add composite location index on incidents
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index used by the nearby-incidents bounding-box prefilter
+    op.create_index('ix_incidents_latitude_longitude', 'incidents', ['latitude', 'longitude'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_incidents_latitude_longitude', 'incidents')
@@ -0,0 +1,37 @@
+"""Add upload_sessions table for resumable uploads
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'upload_sessions',
+        sa.Column('upload_id', sa.String(36), primary_key=True),
+        sa.Column('user_id', sa.String(36), sa.ForeignKey('users.user_id'), nullable=False),
+        sa.Column('incident_id', sa.String(36), nullable=False),
+        sa.Column('content_type', sa.String(100), nullable=False),
+        sa.Column('total_size', sa.BigInteger(), nullable=False),
+        sa.Column('received_size', sa.BigInteger(), nullable=False),
+        sa.Column('part_path', sa.String(500), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_upload_sessions_upload_id', 'upload_sessions', ['upload_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_upload_sessions_upload_id', 'upload_sessions')
+    op.drop_table('upload_sessions')
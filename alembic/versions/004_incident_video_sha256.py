@@ -0,0 +1,27 @@
+"""Add content hash column to incidents
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Content-addressed video storage and detection reuse look incidents up by hash
+    op.add_column('incidents', sa.Column('video_sha256', sa.String(64), nullable=True))
+    op.create_index('ix_incidents_video_sha256', 'incidents', ['video_sha256'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_incidents_video_sha256', 'incidents')
+    op.drop_column('incidents', 'video_sha256')
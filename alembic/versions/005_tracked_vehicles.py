@@ -0,0 +1,29 @@
+"""Add track aggregation columns to detected_vehicles
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per tracked vehicle instead of one per sampled frame
+    op.add_column('detected_vehicles', sa.Column('first_timestamp', sa.Float(), nullable=True))
+    op.add_column('detected_vehicles', sa.Column('last_timestamp', sa.Float(), nullable=True))
+    op.add_column('detected_vehicles', sa.Column('frame_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('detected_vehicles', 'frame_count')
+    op.drop_column('detected_vehicles', 'last_timestamp')
+    op.drop_column('detected_vehicles', 'first_timestamp')
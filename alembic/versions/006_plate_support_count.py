@@ -0,0 +1,25 @@
+"""Add support count to license_plates
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Plates are stored once per consensus, with the number of agreeing readings
+    op.add_column('license_plates', sa.Column('support_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('license_plates', 'support_count')
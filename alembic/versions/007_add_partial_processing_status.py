@@ -0,0 +1,31 @@
+"""Add partial processing status
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+OLD_STATUSES = sa.Enum('pending', 'processing', 'completed', 'failed', name='processingstatus')
+NEW_STATUSES = sa.Enum('pending', 'processing', 'partial', 'completed', 'failed', name='processingstatus')
+
+
+def upgrade() -> None:
+    # Event-first processing marks incidents partial once the event window is done
+    op.alter_column('incidents', 'processing_status', existing_type=OLD_STATUSES, type_=NEW_STATUSES,
+                    existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.execute("UPDATE incidents SET processing_status = 'processing' WHERE processing_status = 'partial'")
+    op.alter_column('incidents', 'processing_status', existing_type=NEW_STATUSES, type_=OLD_STATUSES,
+                    existing_nullable=False)
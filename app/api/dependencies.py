@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.security import decode_token
+from app.core.user_cache import user_cache, user_from_cache, user_to_cache
 from app.models.user import User
 
 # HTTP Bearer token security scheme
@@ -60,8 +61,15 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Query user from database
-    user = db.query(User).filter(User.user_id == user_id).first()
+    # Use the cached user row when fresh, otherwise query the database
+    cached_values = user_cache.get(user_id)
+    if cached_values is not None:
+        user = db.merge(user_from_cache(cached_values), load=False)
+    else:
+        user = db.query(User).filter(User.user_id == user_id).first()
+        if user is not None:
+            user_cache.set(user_id, user_to_cache(user))
+    
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -7,8 +7,15 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
+from app.core.security import (
+    hash_password_pooled,
+    verify_password_pooled,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+)
 from app.core.config import settings
+from app.core.user_cache import user_cache
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin, Token, TokenRefresh, UserResponse
 from app.api.dependencies import get_current_user
@@ -52,7 +59,7 @@ def register(user_data: UserRegister, db: Session = Depends(get_db)):
         user_id=str(uuid.uuid4()),
         email=user_data.email,
         username=user_data.username,
-        password_hash=hash_password(user_data.password),
+        password_hash=hash_password_pooled(user_data.password),
         created_at=datetime.utcnow(),
         is_active=True
     )
@@ -88,7 +95,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
     
     # Verify password
-    if not verify_password(user_data.password, user.password_hash):
+    if not verify_password_pooled(user_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
@@ -104,6 +111,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
     # Update last login timestamp
     user.last_login = datetime.utcnow()
     db.commit()
+    user_cache.invalidate(user.user_id)
     
     # Create tokens
     access_token = create_access_token(data={"sub": user.user_id})
@@ -1,12 +1,13 @@
 """
 Incident API endpoints.
 """
-import os
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional
-from math import radians, cos, sin, asin, sqrt
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from typing import List, Optional, Tuple
+from math import radians, degrees, cos, sin, asin, sqrt
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -16,10 +17,22 @@ from app.models.incident import Incident, IncidentType, ProcessingStatus
 from app.models.vehicle import DetectedVehicle, LicensePlate
 from app.schemas.incident import IncidentCreate, IncidentResponse, IncidentList
 from app.api.dependencies import get_current_user
-from app.tasks.celery_tasks import process_incident_video
+from app.services.video_storage import (
+    UploadTooLargeError,
+    remove_video,
+    restore_video,
+    save_upload,
+    staging_path,
+    store_object,
+    trash_video,
+)
+from app.tasks.signatures import process_incident_video
 
 router = APIRouter()
 
+# Radius of Earth in kilometers
+EARTH_RADIUS_KM = 6371
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -41,10 +54,102 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
     c = 2 * asin(sqrt(a))
     
-    # Radius of Earth in kilometers
-    r = 6371
+    return c * EARTH_RADIUS_KM
+
+
+def haversine_distances(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized great circle distance from one point to many points (in kilometers).
+    
+    Args:
+        latitude, longitude: Latitude and longitude of the reference point
+        latitudes, longitudes: Arrays of latitudes and longitudes
+        
+    Returns:
+        Array of distances in kilometers, aligned with the input arrays
+    """
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(longitudes, dtype=np.float64)) - np.radians(longitude)
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # Clip guards against rounding pushing a marginally above 1
+    c = 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
     
-    return c * r
+    return c * EARTH_RADIUS_KM
+
+
+def nearest_indices(distances: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    Get indices of the k smallest distances in ascending order.
+    
+    Uses a partial sort (argpartition) so only the selected k values are
+    fully sorted.
+    
+    Args:
+        distances: Array of distances
+        k: Number of nearest entries to keep (all when None)
+        
+    Returns:
+        Array of indices into distances, nearest first
+    """
+    if k is None or k >= len(distances):
+        return np.argsort(distances, kind="stable")
+    
+    nearest = np.argpartition(distances, k - 1)[:k]
+    return nearest[np.argsort(distances[nearest], kind="stable")]
+
+
+def bounding_box(
+    latitude: float,
+    longitude: float,
+    radius_km: float
+) -> Tuple[float, float, Optional[List[Tuple[float, float]]]]:
+    """
+    Calculate the latitude/longitude box enclosing a circle on Earth.
+    
+    Every point within radius_km of the center lies inside the box, so it can
+    be used as an index-friendly SQL prefilter before exact distance checks.
+    
+    Args:
+        latitude: Center point latitude
+        longitude: Center point longitude
+        radius_km: Circle radius in kilometers
+        
+    Returns:
+        Tuple of (min_lat, max_lat, lon_ranges); lon_ranges is a list of
+        (min_lon, max_lon) pairs (two when the box crosses the antimeridian)
+        or None when every longitude qualifies (circle covers a pole)
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    delta_lat = degrees(angular_radius)
+    min_lat = latitude - delta_lat
+    max_lat = latitude + delta_lat
+    
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), None
+    
+    sin_ratio = sin(angular_radius) / cos(radians(latitude))
+    if sin_ratio >= 1:
+        return min_lat, max_lat, None
+    
+    delta_lon = degrees(asin(sin_ratio))
+    min_lon = longitude - delta_lon
+    max_lon = longitude + delta_lon
+    
+    # Split ranges that wrap around the antimeridian
+    if min_lon < -180:
+        return min_lat, max_lat, [(min_lon + 360, 180.0), (-180.0, max_lon)]
+    if max_lon > 180:
+        return min_lat, max_lat, [(min_lon, 180.0), (-180.0, max_lon - 360)]
+    
+    return min_lat, max_lat, [(min_lon, max_lon)]
 
 
 @router.post("/report", response_model=IncidentResponse, status_code=status.HTTP_201_CREATED)
@@ -109,27 +214,24 @@ async def report_incident(
     # Generate incident ID
     incident_id = str(uuid.uuid4())
     
-    # Create storage directory
-    storage_dir = os.path.join(settings.VIDEO_STORAGE_PATH, current_user.user_id, incident_id)
-    os.makedirs(storage_dir, exist_ok=True)
-    
-    # Save video file
-    video_path = os.path.join(storage_dir, "raw.mp4")
-    
-    # Read and save video
-    video_content = await video.read()
-    video_size = len(video_content)
-    
-    # Check video size (max 500MB)
+    # Stream video to a staging file, enforcing the size limit as it arrives
+    upload_path = staging_path(incident_id)
     max_size_bytes = settings.MAX_VIDEO_SIZE_MB * 1024 * 1024
-    if video_size > max_size_bytes:
+    try:
+        video_size, video_sha256 = await save_upload(
+            video,
+            upload_path,
+            max_bytes=max_size_bytes,
+            chunk_size=settings.UPLOAD_CHUNK_SIZE_KB * 1024
+        )
+    except UploadTooLargeError:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"Video size exceeds maximum allowed size of {settings.MAX_VIDEO_SIZE_MB}MB"
         )
     
-    with open(video_path, "wb") as f:
-        f.write(video_content)
+    # Store by content hash; a re-submitted clip shares the existing file
+    video_path = store_object(upload_path, video_sha256)
     
     # Create incident record
     incident = Incident(
@@ -144,6 +246,7 @@ async def report_incident(
         description=description,
         video_path=video_path,
         video_size=video_size,
+        video_sha256=video_sha256,
         processing_status=ProcessingStatus.PENDING,
         created_at=datetime.utcnow()
     )
@@ -152,40 +255,11 @@ async def report_incident(
     db.commit()
     db.refresh(incident)
     
-    # Queue Celery task for video processing
-    process_incident_video.delay(incident_id)
+    # A concurrent delete may have trashed the shared object after store_object found it
+    restore_video(video_sha256)
     
-    return incident
-
-
-@router.get("/{incident_id}", response_model=IncidentResponse)
-def get_incident(
-    incident_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Get detailed information about a specific incident.
-    
-    Args:
-        incident_id: UUID of the incident
-        current_user: Authenticated user
-        db: Database session
-        
-    Returns:
-        Incident details including processing status and detections
-        
-    Raises:
-        HTTPException: If incident not found
-    """
-    # Query incident
-    incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
-    
-    if not incident:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Incident not found"
-        )
+    # Queue Celery task for video processing
+    process_incident_video(incident_id).delay()
     
     return incident
 
@@ -197,6 +271,7 @@ def get_nearby_incidents(
     radius_km: float = 5.0,
     time_window_hours: int = 24,
     types: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -209,6 +284,7 @@ def get_nearby_incidents(
         radius_km: Search radius in kilometers (default: 5)
         time_window_hours: Time window in hours (default: 24)
         types: Comma-separated incident types to filter (optional)
+        limit: Maximum number of nearest incidents to return (optional)
         current_user: Authenticated user
         db: Database session
         
@@ -218,8 +294,15 @@ def get_nearby_incidents(
     # Calculate time threshold
     time_threshold = datetime.utcnow() - timedelta(hours=time_window_hours)
     
-    # Build query
-    query = db.query(Incident).filter(Incident.timestamp >= time_threshold)
+    # Build query (columns only, no ORM entities for the candidates)
+    query = db.query(
+        Incident.incident_id,
+        Incident.type,
+        Incident.latitude,
+        Incident.longitude,
+        Incident.timestamp,
+        Incident.processing_status
+    ).filter(Incident.timestamp >= time_threshold)
     
     # Filter by types if provided
     if types:
@@ -233,28 +316,72 @@ def get_nearby_incidents(
                 detail=f"Invalid incident type. Must be one of: {', '.join([t.value for t in IncidentType])}"
             )
     
-    # Get all incidents (we'll filter by distance in Python)
-    incidents = query.all()
-    
-    # Calculate distances and filter by radius
-    nearby_incidents = []
-    for incident in incidents:
-        distance = haversine_distance(latitude, longitude, incident.latitude, incident.longitude)
-        if distance <= radius_km:
-            nearby_incidents.append({
-                "incident_id": incident.incident_id,
-                "type": incident.type,
-                "latitude": incident.latitude,
-                "longitude": incident.longitude,
-                "timestamp": incident.timestamp,
-                "distance_km": distance,
-                "processing_status": incident.processing_status
-            })
-    
-    # Sort by distance
-    nearby_incidents.sort(key=lambda x: x["distance_km"])
-    
-    return [IncidentList(**inc) for inc in nearby_incidents]
+    # Prefilter candidates to the bounding box of the search circle in SQL
+    min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius_km)
+    query = query.filter(Incident.latitude.between(min_lat, max_lat))
+    if lon_ranges is not None:
+        query = query.filter(or_(*[
+            Incident.longitude.between(min_lon, max_lon) for min_lon, max_lon in lon_ranges
+        ]))
+    
+    candidates = query.all()
+    if not candidates:
+        return []
+    
+    # Calculate exact distances for all candidates at once and filter by radius
+    latitudes = np.fromiter((c.latitude for c in candidates), dtype=np.float64, count=len(candidates))
+    longitudes = np.fromiter((c.longitude for c in candidates), dtype=np.float64, count=len(candidates))
+    distances = haversine_distances(latitude, longitude, latitudes, longitudes)
+    
+    within_radius = np.flatnonzero(distances <= radius_km)
+    
+    # Sort by distance, keeping only the nearest limit incidents
+    order = within_radius[nearest_indices(distances[within_radius], limit)]
+    
+    return [
+        IncidentList(
+            incident_id=candidates[i].incident_id,
+            type=candidates[i].type,
+            latitude=candidates[i].latitude,
+            longitude=candidates[i].longitude,
+            timestamp=candidates[i].timestamp,
+            distance_km=float(distances[i]),
+            processing_status=candidates[i].processing_status
+        )
+        for i in order.tolist()
+    ]
+
+
+@router.get("/{incident_id}", response_model=IncidentResponse)
+def get_incident(
+    incident_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get detailed information about a specific incident.
+    
+    Args:
+        incident_id: UUID of the incident
+        current_user: Authenticated user
+        db: Database session
+        
+    Returns:
+        Incident details including processing status and detections
+        
+    Raises:
+        HTTPException: If incident not found
+    """
+    # Query incident
+    incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
+    
+    if not incident:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Incident not found"
+        )
+    
+    return incident
 
 
 @router.delete("/{incident_id}", status_code=status.HTTP_200_OK)
@@ -293,22 +420,32 @@ def delete_incident(
             detail="You can only delete your own incidents"
         )
     
-    # Delete video file
-    if os.path.exists(incident.video_path):
-        try:
-            # Delete the video file
-            os.remove(incident.video_path)
-            
-            # Try to remove the directory if empty
-            video_dir = os.path.dirname(incident.video_path)
-            if os.path.exists(video_dir) and not os.listdir(video_dir):
-                os.rmdir(video_dir)
-        except Exception as e:
-            # Log error but continue with database deletion
-            print(f"Error deleting video file: {e}")
+    video_path = incident.video_path
+    video_sha256 = incident.video_sha256
     
     # Delete incident from database (cascade will delete related records)
     db.delete(incident)
+    db.flush()
+    
+    # Content-addressed videos are shared; count the incidents still using this one
+    references = 0
+    if video_sha256:
+        references = db.query(Incident).filter(Incident.video_sha256 == video_sha256).count()
+    
     db.commit()
     
+    # Trash the video once nothing references it; purge_video_trash deletes it later
+    if references == 0:
+        try:
+            if video_sha256:
+                trash_video(video_path)
+                # A report committed since the count keeps the video
+                if db.query(Incident).filter(Incident.video_sha256 == video_sha256).count():
+                    restore_video(video_sha256)
+            else:
+                remove_video(video_path)
+        except Exception as e:
+            # Log error; the incident is already deleted
+            print(f"Error deleting video file: {e}")
+    
     return {"message": "Incident deleted successfully"}
@@ -0,0 +1,356 @@
+"""
+Resumable video upload API endpoints.
+
+Protocol:
+    1. POST /uploads with the total size creates a session.
+    2. PUT /uploads/{upload_id} with a Content-Range header appends bytes
+       starting at the current offset; a dropped connection keeps the bytes
+       that arrived.
+    3. GET /uploads/{upload_id} returns the offset to resume from.
+    4. POST /uploads/{upload_id}/complete with the incident details creates
+       the incident once every byte has been received.
+
+Sessions without activity for UPLOAD_SESSION_EXPIRE_HOURS expire; the
+cleanup_expired_uploads task deletes them and their partial files.
+"""
+import os
+import re
+import uuid
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Header
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.config import settings
+from app.models.user import User
+from app.models.incident import Incident, ProcessingStatus
+from app.models.upload import UploadSession
+from app.schemas.incident import IncidentCreate, IncidentResponse
+from app.schemas.upload import UploadSessionCreate, UploadSessionResponse
+from app.api.dependencies import get_current_user
+from app.services.video_storage import (
+    UploadTooLargeError,
+    file_sha256,
+    incident_storage_dir,
+    restore_video,
+    store_object,
+    write_range,
+)
+from app.tasks.signatures import process_incident_video
+
+router = APIRouter()
+
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+def get_upload_session(upload_id: str, current_user: User, db: Session, for_update: bool = False) -> UploadSession:
+    """
+    Load an upload session owned by the current user.
+    
+    Args:
+        upload_id: UUID of the upload session
+        current_user: Authenticated user
+        db: Database session
+        for_update: Lock the session row until the transaction ends
+        
+    Returns:
+        Upload session
+        
+    Raises:
+        HTTPException: If the session does not exist, belongs to another user
+            or has expired
+    """
+    query = db.query(UploadSession).filter(UploadSession.upload_id == upload_id)
+    if for_update:
+        query = query.with_for_update()
+    
+    upload = query.first()
+    
+    if not upload or upload.user_id != current_user.user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    
+    if upload.updated_at < datetime.utcnow() - timedelta(hours=settings.UPLOAD_SESSION_EXPIRE_HOURS):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Upload expired"
+        )
+    
+    return upload
+
+
+def advance_upload_offset(db: Session, upload_id: str, start: int, end: int) -> bool:
+    """
+    Move an upload's offset from start to end if it is still at start.
+    
+    The compare-and-set replaces a row lock held across the body upload:
+    of two requests writing the same range, only one advances the offset.
+    
+    Args:
+        db: Database session
+        upload_id: UUID of the upload session
+        start: Offset the range was written at
+        end: Offset after the range
+        
+    Returns:
+        True if the offset was advanced
+    """
+    updated = db.query(UploadSession).filter(
+        UploadSession.upload_id == upload_id,
+        UploadSession.received_size == start
+    ).update(
+        {UploadSession.received_size: end, UploadSession.updated_at: datetime.utcnow()},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated == 1
+
+
+def upload_state(upload: UploadSession) -> UploadSessionResponse:
+    """
+    Build the response describing an upload session.
+    
+    Args:
+        upload: Upload session
+        
+    Returns:
+        Upload session state
+    """
+    return UploadSessionResponse(
+        upload_id=upload.upload_id,
+        total_size=upload.total_size,
+        offset=upload.received_size,
+        complete=upload.received_size == upload.total_size
+    )
+
+
+@router.post("", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+def create_upload(
+    upload_data: UploadSessionCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Start a resumable video upload.
+    
+    Args:
+        upload_data: Total size and content type of the video
+        current_user: Authenticated user
+        db: Database session
+        
+    Returns:
+        New upload session state (offset 0)
+        
+    Raises:
+        HTTPException: If the video is too large or not a video
+    """
+    if not upload_data.content_type.startswith("video/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be a video"
+        )
+    
+    if upload_data.total_size > settings.MAX_VIDEO_SIZE_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Video size exceeds maximum allowed size of {settings.MAX_VIDEO_SIZE_MB}MB"
+        )
+    
+    # Reserve the incident ID so parts land in the incident's storage directory
+    incident_id = str(uuid.uuid4())
+    storage_dir = incident_storage_dir(current_user.user_id, incident_id)
+    part_path = os.path.join(storage_dir, "raw.mp4.part")
+    
+    # Preallocate the file so ranges can be written in place
+    with open(part_path, "wb") as f:
+        f.truncate(upload_data.total_size)
+    
+    upload = UploadSession(
+        upload_id=str(uuid.uuid4()),
+        user_id=current_user.user_id,
+        incident_id=incident_id,
+        content_type=upload_data.content_type,
+        total_size=upload_data.total_size,
+        received_size=0,
+        part_path=part_path,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+    
+    db.add(upload)
+    db.commit()
+    db.refresh(upload)
+    
+    return upload_state(upload)
+
+
+@router.get("/{upload_id}", response_model=UploadSessionResponse)
+def get_upload(
+    upload_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the offset a resumable upload should continue from.
+    
+    Args:
+        upload_id: UUID of the upload session
+        current_user: Authenticated user
+        db: Database session
+        
+    Returns:
+        Upload session state
+    """
+    return upload_state(get_upload_session(upload_id, current_user, db))
+
+
+@router.put("/{upload_id}", response_model=UploadSessionResponse)
+async def upload_range(
+    upload_id: str,
+    request: Request,
+    content_range: str = Header(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload the next byte range of a video.
+    
+    The range must start at the current offset. Bytes that arrive before a
+    dropped connection are kept, so the client resumes from the returned
+    (or queried) offset.
+    
+    No lock or transaction is held while the body streams: the range is
+    written in place first and the offset is then advanced with a
+    conditional update, so a request that lost a race gets 409. Database
+    calls run in the threadpool to keep them off the event loop.
+    
+    Args:
+        upload_id: UUID of the upload session
+        request: Incoming request whose body is the byte range
+        content_range: Content-Range header, e.g. "bytes 0-1048575/5242880"
+        current_user: Authenticated user
+        db: Database session
+        
+    Returns:
+        Upload session state after the write
+        
+    Raises:
+        HTTPException: If the range is malformed or does not start at the current offset
+    """
+    match = CONTENT_RANGE_PATTERN.match(content_range.strip())
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Content-Range header. Use 'bytes start-end/total'."
+        )
+    start, end, total = (int(value) for value in match.groups())
+    
+    upload = await run_in_threadpool(get_upload_session, upload_id, current_user, db)
+    part_path, total_size, received_size = upload.part_path, upload.total_size, upload.received_size
+    # End the read transaction before streaming the body
+    await run_in_threadpool(db.rollback)
+    
+    if total != total_size or end < start or end >= total_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Content-Range does not fit an upload of {total_size} bytes"
+        )
+    
+    if start != received_size:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Range must start at current offset {received_size}"
+        )
+    
+    try:
+        written = await write_range(part_path, start, request.stream(), end - start + 1)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body is longer than the Content-Range"
+        )
+    
+    if written and not await run_in_threadpool(advance_upload_offset, db, upload_id, start, start + written):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Range was already uploaded by another request"
+        )
+    
+    return UploadSessionResponse(
+        upload_id=upload_id,
+        total_size=total_size,
+        offset=start + written,
+        complete=start + written == total_size
+    )
+
+
+@router.post("/{upload_id}/complete", response_model=IncidentResponse, status_code=status.HTTP_201_CREATED)
+def complete_upload(
+    upload_id: str,
+    incident_data: IncidentCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Finish a resumable upload and report the incident.
+    
+    Args:
+        upload_id: UUID of the upload session
+        incident_data: Incident details
+        current_user: Authenticated user
+        db: Database session
+        
+    Returns:
+        Created incident information
+        
+    Raises:
+        HTTPException: If bytes are still missing
+    """
+    upload = get_upload_session(upload_id, current_user, db, for_update=True)
+    
+    if upload.received_size != upload.total_size:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload incomplete: {upload.received_size} of {upload.total_size} bytes received"
+        )
+    
+    # Parts were written in place; hash the assembled file and store it by content
+    video_sha256 = file_sha256(upload.part_path, chunk_size=settings.UPLOAD_CHUNK_SIZE_KB * 1024)
+    video_path = store_object(upload.part_path, video_sha256)
+    
+    upload_dir = os.path.dirname(upload.part_path)
+    if os.path.exists(upload_dir) and not os.listdir(upload_dir):
+        os.rmdir(upload_dir)
+    
+    incident = Incident(
+        incident_id=upload.incident_id,
+        user_id=current_user.user_id,
+        type=incident_data.type,
+        latitude=incident_data.latitude,
+        longitude=incident_data.longitude,
+        timestamp=incident_data.timestamp,
+        speed=incident_data.speed,
+        heading=incident_data.heading,
+        description=incident_data.description,
+        video_path=video_path,
+        video_size=upload.total_size,
+        video_sha256=video_sha256,
+        processing_status=ProcessingStatus.PENDING,
+        created_at=datetime.utcnow()
+    )
+    
+    db.add(incident)
+    db.delete(upload)
+    db.commit()
+    db.refresh(incident)
+    
+    # A concurrent delete may have trashed the shared object after store_object found it
+    restore_video(video_sha256)
+    
+    # Queue Celery task for video processing
+    process_incident_video(incident.incident_id).delay()
+    
+    return incident
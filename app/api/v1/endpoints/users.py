@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.core.database import get_db
+from app.core.user_cache import user_cache
 from app.models.user import User
 from app.models.incident import Incident, IncidentType
 from app.schemas.user import UserUpdate, UserStats, UserProfile
@@ -112,6 +113,9 @@ def update_user_profile(
     db.commit()
     db.refresh(current_user)
     
+    # Drop the stale cached copy used by get_current_user
+    user_cache.invalidate(current_user.user_id)
+    
     return current_user
 
 
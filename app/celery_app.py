@@ -23,4 +23,28 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,  # 1 hour max per task
     task_soft_time_limit=3300,  # 55 minutes soft limit
+    # Child processes load ML models in worker_process_init before reporting ready
+    worker_proc_alive_timeout=settings.WORKER_PROC_ALIVE_TIMEOUT,
+    # Honour per-message priorities on Redis, which emulates them with one list
+    # per step. Redis inverts AMQP: 0 is the highest priority and 9 the lowest,
+    # and messages sent without one count as 0. Prefetching only one task per
+    # process keeps queued low-priority backfill from running ahead of event
+    # windows enqueued later.
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
+    worker_prefetch_multiplier=settings.WORKER_PREFETCH_MULTIPLIER,
+    beat_schedule={
+        # Run with `celery -A app.celery_app beat`
+        "cleanup-expired-uploads": {
+            "task": "cleanup_expired_uploads",
+            "schedule": 3600.0,
+        },
+        "purge-video-trash": {
+            "task": "purge_video_trash",
+            "schedule": 3600.0,
+        },
+    },
 )
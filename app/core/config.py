@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     API_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt process pool size, 0 = thread pool
     
     # Database Configuration
     DATABASE_URL: str
@@ -29,6 +30,12 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_URL: str = "redis://redis:6379/0"
     
+    # Authenticated user cache
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_REDIS: bool = False
+    USER_CACHE_LOCAL_TTL_SECONDS: float = 2.0  # in-process lifetime with USER_CACHE_REDIS, bounds cross-worker staleness
+    
     # Celery Configuration
     CELERY_BROKER_URL: str = "redis://redis:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/0"
@@ -41,10 +48,60 @@ class Settings(BaseSettings):
     # Video Storage
     VIDEO_STORAGE_PATH: str = "/var/data/videos"
     MAX_VIDEO_SIZE_MB: int = 500
+    UPLOAD_CHUNK_SIZE_KB: int = 1024
+    UPLOAD_SESSION_EXPIRE_HOURS: int = 24  # resumable uploads idle this long are deleted
+    VIDEO_TRASH_GRACE_MINUTES: int = 60  # unreferenced videos stay in the trash this long before deletion
     
     # ML Models
     YOLO_MODEL: str = "yolov8n.pt"
+    DETECTOR_BACKEND: str = "ultralytics"  # ultralytics, onnxruntime or openvino (YOLO_MODEL must be .onnx)
+    DETECTOR_THREADS: int = 0  # intra-op inference threads, 0 keeps the backend default
+    DETECTOR_PROFILE: str = "accurate"  # accurate (640 fp32), balanced (480 fp32) or fast (320 int8)
+    DETECTOR_PROFILE_BY_INCIDENT_TYPE: str = ""  # e.g. "crash:accurate,hazard:fast"
+    DETECTOR_PEAK_PROFILE: str = "fast"
+    DETECTOR_PEAK_QUEUE_LENGTH: int = 0  # queued tasks at which DETECTOR_PEAK_PROFILE is used, 0 disables
     OCR_LANGUAGES: str = "en"
+    PRELOAD_MODELS: bool = True
+    WORKER_PROC_ALIVE_TIMEOUT: float = 300.0  # seconds a Celery worker process may spend starting, incl. model warm-up
+    WORKER_PREFETCH_MULTIPLIER: int = 1  # tasks each worker process reserves; higher values weaken priorities
+    DETECTOR_BATCH_SIZE: int = 8
+    OCR_BATCH_SIZE: int = 8  # crops per EasyOCR text detection batch
+    
+    # Video Processing
+    FRAME_SAMPLING_MODE: str = "grab"  # read, grab, seek, auto or adaptive
+    FRAME_SEEK_MIN_DURATION_SECONDS: float = 600.0
+    ADAPTIVE_SAMPLING_MAX_FPS: int = 5  # candidate frames per second in adaptive mode
+    ADAPTIVE_SAMPLING_MIN_FPS: float = 0.2  # frames kept per second on static footage
+    ADAPTIVE_MOTION_THRESHOLD: float = 6.0  # mean grayscale difference (0-255) that keeps a frame
+    ADAPTIVE_SCENE_THRESHOLD: float = 0.2  # histogram distance (0-1) that keeps a frame
+    DETECTION_INSERT_CHUNK_SIZE: int = 1000
+    VIDEO_SEGMENT_SECONDS: float = 60.0  # 0 processes the whole video as one segment
+    SEGMENT_MAX_RETRIES: int = 3
+    PIPELINE_QUEUE_SIZE: int = 2  # batches buffered between decode, detect, OCR and write stages
+    FRAME_BUFFER_REUSE: bool = True  # decode into pooled buffers and letterbox once for exported detectors
+    
+    # Event-First Processing
+    EVENT_FIRST_PROCESSING: bool = False  # process a dense window around the event before the rest
+    EVENT_POSITION: float = 0.5  # where the reported event falls in the video, as a share of its duration
+    EVENT_WINDOW_SECONDS: float = 10.0  # seconds before and after the event in the window
+    EVENT_WINDOW_FPS: int = 5
+    EVENT_BACKFILL_PRIORITY: int = 9  # broker priority of the rest of the video (Redis: 0 highest, 9 lowest)
+    
+    # Vehicle Tracking
+    TRACKER_IOU_THRESHOLD: float = 0.3
+    TRACKER_MAX_AGE: int = 2  # sampled frames a vehicle may be missed before its track ends
+    TRACKER_HIGH_CONFIDENCE: float = 0.6  # detections at or above this are associated with tracks first
+    
+    # License Plate Consensus
+    PLATE_CONSENSUS_MIN_WEIGHT: float = 1.5  # summed confidence each character needs before OCR stops
+    PLATE_CONSENSUS_MIN_AGREEMENT: float = 0.6  # share of reading confidence each character needs
+    PLATE_CLUSTER_MAX_DISTANCE: int = 1  # substitutions for full-frame readings to count as one plate
+    
+    # License Plate Search
+    PLATE_SEARCH_STRATEGY: str = "full_frame"  # vehicle, vehicle_roi or full_frame
+    PLATE_SEARCH_ROI_FRACTION: float = 0.5  # lower share of the vehicle box searched by vehicle_roi
+    PLATE_SEARCH_FULL_FRAME_INTERVAL: int = 1  # full_frame searches every Nth sampled frame
+    PLATE_SEARCH_FULL_FRAME_MAX_WIDTH: int = 0  # downscale full-frame search to this width (0 = native)
     
     # Environment
     ENVIRONMENT: str = "development"
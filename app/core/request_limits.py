@@ -0,0 +1,76 @@
+"""
+Request body size limits enforced before the body is parsed.
+
+FastAPI parses a multipart form, spooling every file to a temporary file,
+before the endpoint or any of its dependencies run, so a size check in the
+endpoint only fires after the whole upload has been received. This ASGI
+middleware rejects a request whose Content-Length is over the limit before
+reading any of it, and stops reading a body without one (chunked transfer)
+as soon as it grows past the limit.
+"""
+from typing import Callable, Dict
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+# Room for the boundaries, part headers and text fields around an uploaded file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def video_upload_limit() -> int:
+    """
+    Get the largest request body accepted for a video upload form.
+    
+    Returns:
+        MAX_VIDEO_SIZE_MB plus the multipart overhead, in bytes
+    """
+    return settings.MAX_VIDEO_SIZE_MB * 1024 * 1024 + MULTIPART_OVERHEAD_BYTES
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies larger than a per-path limit with 413.
+    """
+    
+    def __init__(self, app, limits: Dict[str, Callable[[], int]]):
+        """
+        Initialize body size limit middleware.
+        
+        Args:
+            app: ASGI application to wrap
+            limits: Request path to callable returning its body limit in bytes,
+                evaluated per request so settings changes apply
+        """
+        self.app = app
+        self.limits = limits
+    
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+        
+        max_bytes = limit()
+        detail = f"Request body exceeds maximum allowed size of {max_bytes} bytes"
+        
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            response = JSONResponse({"detail": detail}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+        
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # Raised inside request.form(); FastAPI re-raises HTTPExceptions as-is
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+            return message
+        
+        await self.app(scope, limited_receive, send)
@@ -1,6 +1,9 @@
 """
 Security utilities for password hashing and JWT token management.
 """
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
@@ -12,6 +15,11 @@ from app.core.config import settings
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Dedicated process pool for bcrypt, created on first use; endpoints run in
+# FastAPI's thread pool, so creation and shutdown hold the lock
+_hash_executor: Optional[ProcessPoolExecutor] = None
+_hash_executor_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
@@ -40,6 +48,85 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _get_hash_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the password hashing process pool, creating it on first use.
+    
+    Returns:
+        Process pool sized by PASSWORD_HASH_WORKERS, or None when set to 0
+    """
+    global _hash_executor
+    
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    
+    executor = _hash_executor
+    if executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                # Spawn rather than fork: the API process runs threads and an event loop
+                _hash_executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            executor = _hash_executor
+    
+    return executor
+
+
+def _run_in_hash_pool(function, *args):
+    """
+    Run a hashing function in the process pool and wait for its result.
+    
+    Meant for sync endpoints, which FastAPI runs in its thread pool: the
+    waiting thread holds no GIL while bcrypt runs in another process.
+    """
+    executor = _get_hash_executor()
+    if executor is None:
+        return function(*args)
+    return executor.submit(function, *args).result()
+
+
+def hash_password_pooled(password: str) -> str:
+    """
+    Hash a password using bcrypt in the hashing process pool.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+    """
+    return _run_in_hash_pool(hash_password, password)
+
+
+def verify_password_pooled(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash in the hashing process pool.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to check against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    return _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+def shutdown_hash_executor() -> None:
+    """
+    Shut down the password hashing process pool if it was started.
+    """
+    global _hash_executor
+    
+    with _hash_executor_lock:
+        executor, _hash_executor = _hash_executor, None
+    
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
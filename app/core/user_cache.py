@@ -0,0 +1,240 @@
+"""
+Short-lived cache of authenticated user records.
+
+Every authenticated request resolves its user; caching the row for a few
+seconds avoids one users-table query per API call. Entries live in an
+in-process LRU and, optionally, in Redis so API workers share them.
+
+Invalidation only reaches the local LRU of the process that made it, so
+with Redis enabled local entries expire after local_ttl_seconds (a few
+seconds) and other workers see a changed or deactivated user from Redis
+soon after.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Columns never cached, so credentials stay out of Redis and process memory
+UNCACHED_FIELDS = ("password_hash",)
+
+
+class UserCache:
+    """
+    TTL + LRU cache of user column values keyed by user_id.
+    """
+    
+    KEY_PREFIX = "user_cache:"
+    DATETIME_FIELDS = ("created_at", "last_login")
+    
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_size: int = 10000,
+        redis_url: Optional[str] = None,
+        local_ttl_seconds: float = 2.0
+    ):
+        """
+        Initialize user cache.
+        
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_size: Maximum number of entries kept in process
+            redis_url: Optional Redis URL for a cache shared between processes
+            local_ttl_seconds: Cap on the lifetime of in-process entries while Redis is used
+        """
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = None
+        
+        if redis_url and REDIS_AVAILABLE:
+            try:
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+            except Exception as e:
+                print(f"Warning: Could not connect user cache to Redis: {e}")
+    
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached user values.
+        
+        Args:
+            user_id: UUID of the user
+            
+        Returns:
+            Dictionary of user column values, or None on a miss
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                expires_at, values = entry
+                if expires_at > now:
+                    self._entries.move_to_end(user_id)
+                    self.hits += 1
+                    return values
+                del self._entries[user_id]
+        
+        values = self._redis_get(user_id)
+        
+        with self._lock:
+            if values is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store_local(user_id, values, now)
+        
+        return values
+    
+    def set(self, user_id: str, values: Dict[str, Any]) -> None:
+        """
+        Cache user values.
+        
+        Args:
+            user_id: UUID of the user
+            values: Dictionary of user column values
+        """
+        with self._lock:
+            self._store_local(user_id, values, time.monotonic())
+        
+        if self._redis is not None:
+            try:
+                payload = {
+                    key: value.isoformat() if key in self.DATETIME_FIELDS and value is not None else value
+                    for key, value in values.items()
+                }
+                self._redis.setex(self.KEY_PREFIX + user_id, max(int(self.ttl_seconds), 1), json.dumps(payload))
+            except Exception as e:
+                print(f"Error writing user cache to Redis: {e}")
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user from the cache, e.g. after the row changes.
+        
+        Args:
+            user_id: UUID of the user
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+        
+        if self._redis is not None:
+            try:
+                self._redis.delete(self.KEY_PREFIX + user_id)
+            except Exception as e:
+                print(f"Error invalidating user cache in Redis: {e}")
+    
+    def clear(self) -> None:
+        """
+        Drop every in-process entry and reset counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses and current in-process size
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+    
+    def _store_local(self, user_id: str, values: Dict[str, Any], now: float) -> None:
+        """
+        Insert into the in-process LRU, evicting the oldest entries (lock held).
+        """
+        ttl_seconds = self.ttl_seconds
+        if self._redis is not None:
+            # Other processes invalidate in Redis only, so keep local copies brief
+            ttl_seconds = min(ttl_seconds, self.local_ttl_seconds)
+        
+        self._entries[user_id] = (now + ttl_seconds, values)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def _redis_get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look a user up in Redis.
+        """
+        if self._redis is None:
+            return None
+        
+        try:
+            payload = self._redis.get(self.KEY_PREFIX + user_id)
+        except Exception as e:
+            print(f"Error reading user cache from Redis: {e}")
+            return None
+        
+        if payload is None:
+            return None
+        
+        values = json.loads(payload)
+        for key in self.DATETIME_FIELDS:
+            if values.get(key) is not None:
+                values[key] = datetime.fromisoformat(values[key])
+        return values
+
+
+def user_to_cache(user: User) -> Dict[str, Any]:
+    """
+    Snapshot the column values of a user row, except UNCACHED_FIELDS.
+    
+    Args:
+        user: Loaded user object
+        
+    Returns:
+        Dictionary of column values
+    """
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in UNCACHED_FIELDS
+    }
+
+
+def user_from_cache(values: Dict[str, Any]) -> User:
+    """
+    Rebuild a detached user from cached values.
+    
+    The result can be attached to a session with db.merge(user, load=False)
+    without issuing a SELECT; uncached columns are loaded on first access.
+    
+    Args:
+        values: Dictionary of column values
+        
+    Returns:
+        Detached User object
+    """
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+user_cache = UserCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    redis_url=settings.REDIS_URL if settings.USER_CACHE_REDIS else None,
+    local_ttl_seconds=settings.USER_CACHE_LOCAL_TTL_SECONDS
+)
@@ -1,18 +1,33 @@
 """
 Main FastAPI application initialization and configuration.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.request_limits import BodySizeLimitMiddleware, video_upload_limit
+from app.core.security import shutdown_hash_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: release background resources on shutdown.
+    """
+    yield
+    shutdown_hash_executor()
+
 
 # Create FastAPI application
 app = FastAPI(
     title="Dashcam Backend API",
     description="Backend API for dashcam incident reporting and video processing",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -24,6 +39,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reject oversized video uploads before the multipart form is parsed
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={"/api/v1/incidents/report": video_upload_limit},
+)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
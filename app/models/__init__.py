@@ -4,6 +4,7 @@ Database models module initialization.
 from app.models.user import User
 from app.models.incident import Incident, IncidentType, ProcessingStatus
 from app.models.vehicle import DetectedVehicle, LicensePlate
+from app.models.upload import UploadSession
 
 __all__ = [
     "User",
@@ -12,4 +13,5 @@ __all__ = [
     "ProcessingStatus",
     "DetectedVehicle",
     "LicensePlate",
+    "UploadSession",
 ]
\ No newline at end of file
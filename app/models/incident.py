@@ -3,7 +3,7 @@ Incident database model.
 """
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, String, Float, DateTime, Text, BigInteger, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, Float, DateTime, Text, BigInteger, Enum as SQLEnum, ForeignKey, Index
 from app.core.database import Base
 
 
@@ -20,6 +20,7 @@ class ProcessingStatus(str, Enum):
     """Enum for processing status."""
     PENDING = "pending"
     PROCESSING = "processing"
+    PARTIAL = "partial"  # event window processed, the rest of the video still running
     COMPLETED = "completed"
     FAILED = "failed"
 
@@ -27,6 +28,10 @@ class ProcessingStatus(str, Enum):
 class Incident(Base):
     """Incident model for dashcam incidents."""
     __tablename__ = "incidents"
+    __table_args__ = (
+        # Bounding-box prefilter for nearby incident searches
+        Index("ix_incidents_latitude_longitude", "latitude", "longitude"),
+    )
     
     incident_id = Column(String(36), primary_key=True, index=True)
     user_id = Column(String(36), ForeignKey("users.user_id"), nullable=False)
@@ -39,5 +44,7 @@ class Incident(Base):
     description = Column(Text, nullable=True)
     video_path = Column(String(500), nullable=False)
     video_size = Column(BigInteger, nullable=False)
+    # SHA-256 of the video; incidents with the same content share one stored file
+    video_sha256 = Column(String(64), nullable=True, index=True)
     processing_status = Column(SQLEnum(ProcessingStatus), nullable=False, default=ProcessingStatus.PENDING)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
\ No newline at end of file
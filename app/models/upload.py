@@ -0,0 +1,21 @@
+"""
+Resumable upload session database model.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, BigInteger, ForeignKey
+from app.core.database import Base
+
+
+class UploadSession(Base):
+    """Resumable video upload in progress."""
+    __tablename__ = "upload_sessions"
+    
+    upload_id = Column(String(36), primary_key=True, index=True)
+    user_id = Column(String(36), ForeignKey("users.user_id"), nullable=False)
+    incident_id = Column(String(36), nullable=False)
+    content_type = Column(String(100), nullable=False)
+    total_size = Column(BigInteger, nullable=False)
+    received_size = Column(BigInteger, nullable=False, default=0)
+    part_path = Column(String(500), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
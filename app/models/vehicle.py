@@ -1,7 +1,7 @@
 """
 Vehicle detection database models.
 """
-from sqlalchemy import Column, String, Float, JSON, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, JSON, ForeignKey
 from app.core.database import Base
 
 
@@ -18,6 +18,10 @@ class DetectedVehicle(Base):
     confidence = Column(Float, nullable=False)
     bounding_box = Column(JSON, nullable=False)
     frame_timestamp = Column(Float, nullable=False)
+    # Tracked vehicles are stored once: when first and last seen, and in how many sampled frames
+    first_timestamp = Column(Float, nullable=True)
+    last_timestamp = Column(Float, nullable=True)
+    frame_count = Column(Integer, nullable=True)
 
 
 class LicensePlate(Base):
@@ -32,4 +36,6 @@ class LicensePlate(Base):
     state_region = Column(String(50), nullable=True)
     country = Column(String(50), nullable=True)
     frame_timestamp = Column(Float, nullable=False)
-    bounding_box = Column(JSON, nullable=False)
\ No newline at end of file
+    bounding_box = Column(JSON, nullable=False)
+    # Number of readings that agreed on the consolidated plate
+    support_count = Column(Integer, nullable=True)
\ No newline at end of file
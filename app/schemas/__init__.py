@@ -10,6 +10,7 @@ from app.schemas.incident import (
     LicensePlateDetection,
 )
 from app.schemas.user import UserUpdate, UserStats, UserProfile
+from app.schemas.upload import UploadSessionCreate, UploadSessionResponse
 
 __all__ = [
     "UserRegister",
@@ -25,4 +26,6 @@ __all__ = [
     "UserUpdate",
     "UserStats",
     "UserProfile",
+    "UploadSessionCreate",
+    "UploadSessionResponse",
 ]
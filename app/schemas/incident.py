@@ -29,6 +29,9 @@ class VehicleDetection(BaseModel):
     confidence: float
     bounding_box: Dict[str, Any]
     frame_timestamp: float
+    first_timestamp: Optional[float] = None
+    last_timestamp: Optional[float] = None
+    frame_count: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -43,6 +46,7 @@ class LicensePlateDetection(BaseModel):
     country: Optional[str]
     frame_timestamp: float
     bounding_box: Dict[str, Any]
+    support_count: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -0,0 +1,18 @@
+"""
+Resumable upload Pydantic schemas.
+"""
+from pydantic import BaseModel, Field
+
+
+class UploadSessionCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+    total_size: int = Field(..., gt=0)
+    content_type: str = "video/mp4"
+
+
+class UploadSessionResponse(BaseModel):
+    """Schema for resumable upload state."""
+    upload_id: str
+    total_size: int
+    offset: int
+    complete: bool
@@ -0,0 +1,93 @@
+"""
+Content-gated frame sampling.
+
+Sampling at a fixed rate spends inference on identical frames of a parked
+car and misses most of a crash. The adaptive sampler looks at candidate
+frames at the maximum rate and keeps one only when a cheap, downscaled
+comparison with the last kept frame shows motion (mean absolute pixel
+difference) or a scene change (grayscale histogram distance), or when the
+minimum rate requires a frame anyway.
+"""
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class AdaptiveSampler:
+    """
+    Decides which candidate frames are worth processing.
+    """
+    
+    def __init__(
+        self,
+        min_fps: float = 0.2,
+        motion_threshold: float = 6.0,
+        scene_threshold: float = 0.2,
+        thumbnail_size: Tuple[int, int] = (64, 36),
+        histogram_bins: int = 32
+    ):
+        """
+        Initialize adaptive sampler.
+        
+        Args:
+            min_fps: Minimum rate of kept frames, even on static footage
+            motion_threshold: Mean absolute grayscale difference (0-255) that keeps a frame
+            scene_threshold: Histogram distance (0-1) that keeps a frame
+            thumbnail_size: Width and height frames are compared at
+            histogram_bins: Grayscale histogram bins of the scene score
+        """
+        self.max_gap = 1.0 / min_fps if min_fps > 0 else float("inf")
+        self.motion_threshold = motion_threshold
+        self.scene_threshold = scene_threshold
+        self.thumbnail_size = thumbnail_size
+        self.histogram_bins = histogram_bins
+        self.kept = 0
+        self.skipped = 0
+        self._reference: Optional[np.ndarray] = None
+        self._reference_histogram: Optional[np.ndarray] = None
+        self._last_kept_timestamp: Optional[float] = None
+    
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Downscale a BGR frame to a small grayscale image.
+        """
+        small = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+    
+    def _histogram(self, thumbnail: np.ndarray) -> np.ndarray:
+        """
+        Normalized grayscale histogram of a thumbnail.
+        """
+        bins = (thumbnail.astype(np.uint16) * self.histogram_bins) >> 8
+        return np.bincount(bins.ravel(), minlength=self.histogram_bins) / thumbnail.size
+    
+    def should_keep(self, frame: np.ndarray, timestamp: float) -> bool:
+        """
+        Decide whether a candidate frame is kept, and make it the reference if so.
+        
+        Args:
+            frame: BGR frame
+            timestamp: Timestamp of the frame in seconds
+            
+        Returns:
+            True if the frame should be processed
+        """
+        thumbnail = self._thumbnail(frame)
+        histogram = self._histogram(thumbnail)
+        
+        if self._reference is None or timestamp - self._last_kept_timestamp >= self.max_gap:
+            keep = True
+        else:
+            motion = float(cv2.absdiff(thumbnail, self._reference).mean())
+            scene = float(np.abs(histogram - self._reference_histogram).sum() / 2)
+            keep = motion >= self.motion_threshold or scene >= self.scene_threshold
+        
+        if keep:
+            self._reference = thumbnail
+            self._reference_histogram = histogram
+            self._last_kept_timestamp = timestamp
+            self.kept += 1
+        else:
+            self.skipped += 1
+        return keep
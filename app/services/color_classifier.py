@@ -0,0 +1,146 @@
+"""
+Vehicle color classification from HSV histograms.
+
+Every pixel votes for a color label through a lookup table indexed by its
+quantized BGR value; the table is built once by converting the centre of
+every BGR cell to HSV. The pixels of all vehicle crops of a frame are
+labelled and counted in a single NumPy pass, and each crop takes the label
+with the most votes. Tires, windows and shadows make every vehicle partly
+black or gray, so a chromatic label wins as soon as it holds chromatic_share
+of the pixels.
+"""
+from typing import List
+
+import cv2
+import numpy as np
+
+# Labels in lookup table order; the first three are achromatic
+COLOR_LABELS = ("black", "gray", "white", "red", "orange", "yellow", "green", "blue", "other")
+ACHROMATIC_LABELS = 3
+
+# Upper OpenCV hue bounds (0-179) of the chromatic labels; hues past the last wrap to red
+HUE_BOUNDS = ((8, "red"), (22, "orange"), (35, "yellow"), (85, "green"), (130, "blue"), (165, "other"))
+
+
+def build_color_lut(
+    bits: int = 5,
+    black_value: int = 60,
+    white_value: int = 190,
+    gray_saturation: int = 50
+) -> np.ndarray:
+    """
+    Build the table mapping quantized BGR values to color label indices.
+    
+    Args:
+        bits: Bits kept per channel (the table has 2 ** (3 * bits) entries)
+        black_value: HSV value (0-255) below which a pixel is black
+        white_value: HSV value at or above which an unsaturated pixel is white
+        gray_saturation: HSV saturation (0-255) below which a pixel is gray or white
+        
+    Returns:
+        uint8 array of COLOR_LABELS indices, indexed by b << 2 * bits | g << bits | r
+        of the quantized channels
+    """
+    levels = 1 << bits
+    step = 256 // levels
+    centers = np.arange(levels, dtype=np.uint8) * step + step // 2
+    blue, green, red = np.meshgrid(centers, centers, centers, indexing="ij")
+    cells = np.stack([blue, green, red], axis=-1).reshape(1, -1, 3)
+    hue, saturation, value = cv2.cvtColor(cells, cv2.COLOR_BGR2HSV)[0].T
+    
+    index = {label: position for position, label in enumerate(COLOR_LABELS)}
+    lut = np.full(hue.shape, index["red"], dtype=np.uint8)
+    lower = 0
+    for upper, label in HUE_BOUNDS:
+        lut[(hue >= lower) & (hue < upper)] = index[label]
+        lower = upper
+    
+    unsaturated = saturation < gray_saturation
+    lut[unsaturated] = np.where(value[unsaturated] >= white_value, index["white"], index["gray"])
+    lut[value < black_value] = index["black"]
+    return lut
+
+
+class ColorClassifier:
+    """
+    Classifies the dominant color of vehicle boxes in a frame.
+    """
+    
+    def __init__(self, bits: int = 5, stride: int = 4, margin: float = 0.15, chromatic_share: float = 0.3):
+        """
+        Initialize color classifier.
+        
+        Args:
+            bits: Bits kept per channel by the lookup table
+            stride: Pixel step of the sampling grid in each direction
+            margin: Share of the box width and height skipped on every side,
+                where the background shows
+            chromatic_share: Share of the pixels a chromatic label needs to
+                win over black, gray and white
+        """
+        self.bits = bits
+        self.stride = max(stride, 1)
+        self.margin = min(max(margin, 0.0), 0.45)
+        self.chromatic_share = chromatic_share
+        self.lut = build_color_lut(bits)
+    
+    def classify(self, frame: np.ndarray, boxes: np.ndarray) -> List[str]:
+        """
+        Classify the color of every box in a frame.
+        
+        Args:
+            frame: BGR frame
+            boxes: Integer array of shape (N, 4) with x1, y1, x2, y2 rows inside the frame
+            
+        Returns:
+            List aligned with boxes of color labels, "unknown" for empty boxes
+        """
+        if len(boxes) == 0:
+            return []
+        if frame.ndim != 3:
+            return ["unknown"] * len(boxes)
+        
+        boxes = np.asarray(boxes, dtype=np.int64)
+        inset_x = ((boxes[:, 2] - boxes[:, 0]) * self.margin).astype(np.int64)
+        inset_y = ((boxes[:, 3] - boxes[:, 1]) * self.margin).astype(np.int64)
+        
+        samples = [
+            frame[y1 + dy:y2 - dy:self.stride, x1 + dx:x2 - dx:self.stride].reshape(-1, 3)
+            for (x1, y1, x2, y2), dx, dy in zip(boxes.tolist(), inset_x.tolist(), inset_y.tolist())
+        ]
+        owners = np.repeat(np.arange(len(boxes)), [len(pixels) for pixels in samples])
+        
+        # One pass over the pixels of every crop: quantize, look up, count per crop
+        pixels = np.concatenate(samples)
+        shift = 8 - self.bits
+        quantized = (pixels >> shift).astype(np.int64)
+        labels = self.lut[(quantized[:, 0] << 2 * self.bits) | (quantized[:, 1] << self.bits) | quantized[:, 2]]
+        label_count = len(COLOR_LABELS)
+        counts = np.bincount(
+            owners * label_count + labels,
+            minlength=len(boxes) * label_count
+        ).reshape(len(boxes), label_count)
+        
+        totals = counts.sum(axis=1)
+        chromatic = ACHROMATIC_LABELS + counts[:, ACHROMATIC_LABELS:].argmax(axis=1)
+        winners = np.where(
+            counts[np.arange(len(boxes)), chromatic] >= self.chromatic_share * totals,
+            chromatic,
+            counts.argmax(axis=1)
+        )
+        return [COLOR_LABELS[winner] if total else "unknown" for winner, total in zip(winners.tolist(), totals.tolist())]
+    
+    def classify_crop(self, cropped_image: np.ndarray) -> str:
+        """
+        Classify the color of a single crop.
+        
+        Args:
+            cropped_image: BGR crop of a vehicle
+            
+        Returns:
+            Color label, "unknown" for an empty or grayscale crop
+        """
+        if cropped_image.size == 0:
+            return "unknown"
+        height, width = cropped_image.shape[:2]
+        return self.classify(cropped_image, np.array([[0, 0, width, height]]))[0]
@@ -0,0 +1,186 @@
+"""
+Buffered bulk writer for vehicle and license plate detections.
+"""
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.vehicle import DetectedVehicle, LicensePlate
+
+
+class DetectionWriter:
+    """
+    Accumulates detection rows as tuples and writes them with executemany inserts.
+    
+    Bypasses the ORM unit of work: rows are never turned into mapped objects,
+    and each flush issues one INSERT per table for up to chunk_size rows.
+    """
+    
+    VEHICLE_COLUMNS = (
+        "detection_id",
+        "incident_id",
+        "vehicle_type",
+        "make",
+        "model",
+        "color",
+        "confidence",
+        "bounding_box",
+        "frame_timestamp",
+        "first_timestamp",
+        "last_timestamp",
+        "frame_count",
+    )
+    
+    PLATE_COLUMNS = (
+        "plate_id",
+        "incident_id",
+        "detection_id",
+        "plate_number",
+        "confidence",
+        "state_region",
+        "country",
+        "frame_timestamp",
+        "bounding_box",
+        "support_count",
+    )
+    
+    def __init__(self, db: Session, incident_id: str, chunk_size: int = 1000):
+        """
+        Initialize detection writer for one incident.
+        
+        Args:
+            db: Database session used for the inserts
+            incident_id: UUID of the incident the detections belong to
+            chunk_size: Number of buffered rows that triggers a flush
+        """
+        self.db = db
+        self.incident_id = incident_id
+        self.chunk_size = max(chunk_size, 1)
+        self.vehicles_written = 0
+        self.plates_written = 0
+        self._vehicle_rows: List[Tuple] = []
+        self._plate_rows: List[Tuple] = []
+    
+    def add_vehicle(self, detection: Dict[str, Any], frame_timestamp: float) -> str:
+        """
+        Buffer a detected vehicle row.
+        
+        Args:
+            detection: Detection dictionary from MLDetector, or an aggregated
+                track with first_timestamp, last_timestamp and frame_count
+            frame_timestamp: Timestamp of the frame in seconds
+            
+        Returns:
+            Generated detection ID, usable to link license plates
+        """
+        detection_id = str(uuid.uuid4())
+        self._vehicle_rows.append((
+            detection_id,
+            self.incident_id,
+            detection["vehicle_type"],
+            detection.get("make"),
+            detection.get("model"),
+            detection.get("color"),
+            detection["confidence"],
+            detection["bounding_box"],
+            frame_timestamp,
+            detection.get("first_timestamp"),
+            detection.get("last_timestamp"),
+            detection.get("frame_count"),
+        ))
+        self._maybe_flush()
+        return detection_id
+    
+    def add_plate(
+        self,
+        plate_result: Dict[str, Any],
+        frame_timestamp: float,
+        detection_id: Optional[str] = None
+    ) -> str:
+        """
+        Buffer a license plate row.
+        
+        Args:
+            plate_result: Plate dictionary from OCRService, or a consensus
+                plate with support_count
+            frame_timestamp: Timestamp of the frame in seconds
+            detection_id: Optional ID of the vehicle the plate belongs to
+            
+        Returns:
+            Generated plate ID
+        """
+        plate_id = str(uuid.uuid4())
+        self._plate_rows.append((
+            plate_id,
+            self.incident_id,
+            detection_id,
+            plate_result["plate_number"],
+            plate_result["confidence"],
+            plate_result.get("state_region"),
+            plate_result.get("country"),
+            frame_timestamp,
+            plate_result["bounding_box"],
+            plate_result.get("support_count"),
+        ))
+        self._maybe_flush()
+        return plate_id
+    
+    def copy_from(self, source_incident_id: str) -> None:
+        """
+        Buffer copies of another incident's detections, e.g. for the same video.
+        
+        Copied rows get new IDs; plates stay linked to their copied vehicles.
+        
+        Args:
+            source_incident_id: UUID of the incident whose detections are copied
+        """
+        vehicles = self.db.execute(
+            select(DetectedVehicle.__table__).where(DetectedVehicle.incident_id == source_incident_id)
+        ).mappings().all()
+        plates = self.db.execute(
+            select(LicensePlate.__table__).where(LicensePlate.incident_id == source_incident_id)
+        ).mappings().all()
+        
+        # Map source detection IDs to the IDs of the copies
+        detection_ids = {
+            vehicle["detection_id"]: self.add_vehicle(vehicle, vehicle["frame_timestamp"])
+            for vehicle in vehicles
+        }
+        
+        for plate in plates:
+            self.add_plate(
+                plate,
+                plate["frame_timestamp"],
+                detection_id=detection_ids.get(plate["detection_id"])
+            )
+    
+    def _maybe_flush(self) -> None:
+        """
+        Flush once the buffers hold chunk_size rows.
+        """
+        if len(self._vehicle_rows) + len(self._plate_rows) >= self.chunk_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write all buffered rows; vehicles go first so plate foreign keys resolve.
+        
+        Rows are inserted inside the session's transaction; the caller commits.
+        """
+        if self._vehicle_rows:
+            self.db.execute(
+                insert(DetectedVehicle.__table__),
+                [dict(zip(self.VEHICLE_COLUMNS, row)) for row in self._vehicle_rows]
+            )
+            self.vehicles_written += len(self._vehicle_rows)
+            self._vehicle_rows = []
+        
+        if self._plate_rows:
+            self.db.execute(
+                insert(LicensePlate.__table__),
+                [dict(zip(self.PLATE_COLUMNS, row)) for row in self._plate_rows]
+            )
+            self.plates_written += len(self._plate_rows)
+            self._plate_rows = []
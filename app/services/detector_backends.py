@@ -0,0 +1,344 @@
+"""
+Inference backends for the YOLOv8 vehicle detector.
+
+Every backend takes BGR frames and returns, per frame, an array of rows
+x1, y1, x2, y2, confidence, class_id in frame pixels, already filtered to the
+requested classes and confidence and de-duplicated by NMS:
+
+    ultralytics: PyTorch eager inference on a .pt model (default)
+    onnxruntime: ONNX Runtime on a graph exported with
+                 `yolo export model=yolov8n.pt format=onnx dynamic=True`
+    openvino:    OpenVINO on the same ONNX graph (or its IR .xml)
+
+The exported graphs avoid PyTorch's eager overhead and most of its memory,
+which matters on CPU-only workers. Callers that already letterboxed the
+frames to input_size (see frame_buffer) pass them along to the exported
+backends, so the frames are not resized again. ultralytics pads each frame
+only to a multiple of the model stride, which for 16:9 video is far fewer
+pixels than a square input, so it always gets the original frames.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from app.services.frame_buffer import letterbox
+
+try:
+    from ultralytics import YOLO
+    YOLO_AVAILABLE = True
+except ImportError:
+    YOLO_AVAILABLE = False
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import openvino
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+
+class DetectorBackend(ABC):
+    """
+    Interface of a detector inference backend.
+    """
+    
+    name = "base"
+    input_size: Optional[int] = None  # square network input, None if unknown
+    uses_letterbox = False  # whether predict uses letterboxes passed by the caller
+    
+    @abstractmethod
+    def predict(
+        self,
+        frames: List[np.ndarray],
+        class_ids: np.ndarray,
+        confidence_threshold: float,
+        letterboxed: Optional[List[Optional[tuple]]] = None
+    ) -> List[np.ndarray]:
+        """
+        Detect objects in a batch of frames.
+        
+        Args:
+            frames: BGR frames
+            class_ids: COCO class IDs to keep
+            confidence_threshold: Minimum confidence score
+            letterboxed: Optional list aligned with frames of (image, scale,
+                pad_x, pad_y) letterboxes of each frame to input_size
+                
+        Returns:
+            List aligned with frames of float arrays of shape (N, 6) with
+            x1, y1, x2, y2, confidence, class_id rows
+        """
+
+
+class UltralyticsBackend(DetectorBackend):
+    """
+    PyTorch inference through the ultralytics YOLO wrapper.
+    """
+    
+    name = "ultralytics"
+    
+    def __init__(self, model_path: str, threads: int = 0, input_size: Optional[int] = None):
+        """
+        Load a YOLO model.
+        
+        Args:
+            model_path: Path to .pt weights (or any format ultralytics loads)
+            threads: PyTorch intra-op threads (0 keeps the default)
+            input_size: Inference size in pixels (None keeps the model's)
+        """
+        if threads > 0:
+            import torch
+            torch.set_num_threads(threads)
+        
+        self.model = YOLO(model_path)
+        # ultralytics predicts at 640 unless told otherwise
+        self.input_size = input_size or 640
+        self.options = {"imgsz": self.input_size}
+    
+    def predict(
+        self,
+        frames: List[np.ndarray],
+        class_ids: np.ndarray,
+        confidence_threshold: float,
+        letterboxed: Optional[List[Optional[tuple]]] = None
+    ) -> List[np.ndarray]:
+        # letterboxed is ignored: a square input costs more than ultralytics' stride-padded one
+        # Class and confidence filtering happen inside NMS
+        results = self.model(frames, classes=class_ids.tolist(), conf=confidence_threshold, verbose=False, **self.options)
+        
+        predictions = []
+        for result in results:
+            boxes = result.boxes
+            if boxes is None or len(boxes) == 0:
+                predictions.append(np.zeros((0, 6), dtype=np.float32))
+            else:
+                predictions.append(boxes.data[:, :6].cpu().numpy())
+        return predictions
+
+
+def _unletterbox(boxes: np.ndarray, scale: float, pad_x: int, pad_y: int) -> None:
+    """
+    Map x1, y1, x2, y2 columns from network input to frame coordinates in place.
+    """
+    boxes[:, [0, 2]] = (boxes[:, [0, 2]] - pad_x) / scale
+    boxes[:, [1, 3]] = (boxes[:, [1, 3]] - pad_y) / scale
+
+
+def decode_yolo_output(
+    output: np.ndarray,
+    class_ids: np.ndarray,
+    confidence_threshold: float,
+    iou_threshold: float = 0.7
+) -> np.ndarray:
+    """
+    Turn one image's raw YOLOv8 head output into NMS'd boxes.
+    
+    Args:
+        output: Array of shape (4 + classes, anchors) with cx, cy, w, h and class scores
+        class_ids: Class IDs to keep
+        confidence_threshold: Minimum confidence score
+        iou_threshold: NMS IoU threshold (ultralytics default 0.7)
+        
+    Returns:
+        Array of shape (N, 6) with x1, y1, x2, y2, confidence, class_id rows in
+        network input coordinates
+    """
+    scores = output[4 + class_ids]
+    best = scores.argmax(axis=0)
+    confidences = scores[best, np.arange(scores.shape[1])]
+    
+    keep = confidences >= confidence_threshold
+    if not keep.any():
+        return np.zeros((0, 6), dtype=np.float32)
+    
+    center_x, center_y, width, height = output[:4, keep]
+    boxes = np.stack([center_x - width / 2, center_y - height / 2, center_x + width / 2, center_y + height / 2], axis=1)
+    confidences = confidences[keep]
+    classes = class_ids[best[keep]]
+    
+    # Class-aware NMS: shift each class into its own coordinate range
+    offsets = classes[:, None] * 4096.0
+    shifted = boxes + offsets
+    kept = cv2.dnn.NMSBoxes(
+        np.column_stack([shifted[:, :2], shifted[:, 2:] - shifted[:, :2]]).tolist(),
+        confidences.tolist(),
+        confidence_threshold,
+        iou_threshold
+    )
+    kept = np.asarray(kept, dtype=np.int64).reshape(-1)
+    
+    return np.column_stack([boxes[kept], confidences[kept], classes[kept]]).astype(np.float32)
+
+
+class ExportedYoloBackend(DetectorBackend):
+    """
+    Shared pre- and post-processing for exported YOLOv8 graphs.
+    """
+    
+    uses_letterbox = True
+    
+    def __init__(self, input_size: int, dynamic_batch: bool):
+        """
+        Initialize pre- and post-processing.
+        
+        Args:
+            input_size: Square network input size in pixels
+            dynamic_batch: Whether the graph accepts more than one image per run
+        """
+        self.input_size = input_size
+        self.dynamic_batch = dynamic_batch
+        self._canvas = np.empty((input_size, input_size, 3), dtype=np.uint8)
+    
+    @abstractmethod
+    def _infer(self, blob: np.ndarray) -> np.ndarray:
+        """
+        Run the graph on an (N, 3, size, size) float32 blob.
+        
+        Returns:
+            Raw output of shape (N, 4 + classes, anchors)
+        """
+    
+    def predict(
+        self,
+        frames: List[np.ndarray],
+        class_ids: np.ndarray,
+        confidence_threshold: float,
+        letterboxed: Optional[List[Optional[tuple]]] = None
+    ) -> List[np.ndarray]:
+        size = self.input_size
+        blob = np.empty((len(frames), 3, size, size), dtype=np.float32)
+        transforms = []
+        for index, frame in enumerate(frames):
+            prepared = letterboxed[index] if letterboxed is not None else None
+            if prepared is not None and prepared[0].shape[:2] == (size, size):
+                image, scale, pad_x, pad_y = prepared
+            else:
+                image, scale, pad_x, pad_y = letterbox(frame, size, out=self._canvas)
+            # BGR HWC uint8 -> RGB CHW float in [0, 1]
+            np.multiply(image[:, :, ::-1].transpose(2, 0, 1), 1 / 255.0, out=blob[index], casting="unsafe")
+            transforms.append((scale, pad_x, pad_y))
+        
+        if self.dynamic_batch:
+            outputs = self._infer(blob)
+        else:
+            outputs = np.concatenate([self._infer(blob[index:index + 1]) for index in range(len(frames))])
+        
+        predictions = []
+        for output, (scale, pad_x, pad_y) in zip(outputs, transforms):
+            boxes = decode_yolo_output(output, class_ids, confidence_threshold)
+            _unletterbox(boxes, scale, pad_x, pad_y)
+            predictions.append(boxes)
+        return predictions
+
+
+class OnnxRuntimeBackend(ExportedYoloBackend):
+    """
+    ONNX Runtime CPU inference of an exported YOLOv8 graph.
+    """
+    
+    name = "onnxruntime"
+    
+    def __init__(self, model_path: str, threads: int = 0, input_size: Optional[int] = None):
+        """
+        Load an ONNX graph.
+        
+        Args:
+            model_path: Path to the exported .onnx file
+            threads: Intra-op threads (0 lets ONNX Runtime use every core)
+            input_size: Input size for graphs exported with dynamic height and
+                width (None uses 640; a fixed-size graph keeps its own)
+        """
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = max(threads, 0)
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        batch, _, size = model_input.shape[:3]
+        super().__init__(size if isinstance(size, int) else input_size or 640, not isinstance(batch, int))
+    
+    def _infer(self, blob: np.ndarray) -> np.ndarray:
+        return self.session.run(None, {self.input_name: blob})[0]
+
+
+class OpenVINOBackend(ExportedYoloBackend):
+    """
+    OpenVINO CPU inference of an exported YOLOv8 graph.
+    """
+    
+    name = "openvino"
+    
+    def __init__(self, model_path: str, threads: int = 0, input_size: Optional[int] = None):
+        """
+        Load and compile an ONNX graph or OpenVINO IR.
+        
+        Args:
+            model_path: Path to the exported .onnx or .xml file
+            threads: Inference threads (0 lets OpenVINO decide)
+            input_size: Input size for graphs with dynamic height and width
+                (None uses 640; a fixed-size graph keeps its own)
+        """
+        core = openvino.Core()
+        model = core.read_model(model_path)
+        
+        model_input = model.inputs[0].get_partial_shape()
+        size = model_input[2].get_length() if model_input[2].is_static else input_size or 640
+        dynamic_batch = model_input[0].is_dynamic
+        
+        config = {"INFERENCE_NUM_THREADS": threads} if threads > 0 else {}
+        self.compiled_model = core.compile_model(model, "CPU", config)
+        super().__init__(size, dynamic_batch)
+    
+    def _infer(self, blob: np.ndarray) -> np.ndarray:
+        return self.compiled_model(blob)[0]
+
+
+BACKENDS = {
+    "ultralytics": (UltralyticsBackend, lambda: YOLO_AVAILABLE),
+    "onnxruntime": (OnnxRuntimeBackend, lambda: ONNXRUNTIME_AVAILABLE),
+    "openvino": (OpenVINOBackend, lambda: OPENVINO_AVAILABLE),
+}
+
+
+def create_backend(
+    name: str,
+    model_path: str,
+    threads: int = 0,
+    input_size: Optional[int] = None
+) -> Optional[DetectorBackend]:
+    """
+    Load a detector backend.
+    
+    Args:
+        name: One of BACKENDS
+        model_path: Model file for the backend
+        threads: Intra-op threads (0 keeps the runtime default)
+        input_size: Network input size in pixels (None keeps the model's)
+        
+    Returns:
+        Loaded backend, or None if its runtime is not installed or loading failed
+        
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown detector backend: {name}")
+    
+    backend_class, available = BACKENDS[name]
+    if not available():
+        print(f"Warning: Detector backend {name} is not installed")
+        return None
+    
+    try:
+        return backend_class(model_path, threads, input_size)
+    except Exception as e:
+        print(f"Warning: Could not load {name} detector model: {e}")
+        return None
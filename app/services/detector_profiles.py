@@ -0,0 +1,141 @@
+"""
+Detector profiles trading vehicle recall for throughput.
+
+A profile fixes the detector input size and weight precision:
+
+    accurate: 640 px, fp32 (the model's native resolution)
+    balanced: 480 px, fp32
+    fast:     320 px, dynamic int8 weights
+
+Int8 profiles need an exported ONNX graph (onnxruntime or openvino backend);
+the quantized graph is written next to the fp32 one on first use. Profiles
+are chosen per incident type, or for every incident while the task queue
+is long.
+"""
+import os
+from typing import Dict, NamedTuple, Optional
+
+try:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    ONNX_QUANTIZATION_AVAILABLE = True
+except ImportError:
+    ONNX_QUANTIZATION_AVAILABLE = False
+
+
+class DetectorProfile(NamedTuple):
+    """Input size and weight precision of the vehicle detector."""
+    name: str
+    input_size: int
+    precision: str  # fp32 or int8
+
+
+PROFILES = {
+    "accurate": DetectorProfile("accurate", 640, "fp32"),
+    "balanced": DetectorProfile("balanced", 480, "fp32"),
+    "fast": DetectorProfile("fast", 320, "int8"),
+}
+
+
+def get_profile(name: str) -> DetectorProfile:
+    """
+    Look a profile up by name.
+    
+    Args:
+        name: One of PROFILES
+        
+    Returns:
+        Detector profile
+        
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unknown detector profile: {name}")
+    return PROFILES[name]
+
+
+def parse_profile_map(value: str) -> Dict[str, str]:
+    """
+    Parse a "type:profile,type:profile" setting.
+    
+    Args:
+        value: Comma separated incident type to profile pairs
+        
+    Returns:
+        Dictionary of incident type to profile name
+        
+    Raises:
+        ValueError: If an entry is malformed or names an unknown profile
+    """
+    mapping = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        incident_type, separator, profile = entry.partition(":")
+        if not separator:
+            raise ValueError(f"Invalid detector profile mapping: {entry}")
+        mapping[incident_type.strip()] = get_profile(profile.strip()).name
+    return mapping
+
+
+def choose_profile(
+    incident_type: Optional[str],
+    queue_length: int,
+    default: str,
+    by_incident_type: Dict[str, str],
+    peak_profile: str,
+    peak_queue_length: int
+) -> DetectorProfile:
+    """
+    Choose the detector profile for an incident.
+    
+    An explicit profile for the incident type wins (e.g. crashes always
+    accurate); otherwise the peak profile applies while at least
+    peak_queue_length tasks are queued, and the default profile when not.
+    
+    Args:
+        incident_type: Type of the incident
+        queue_length: Number of tasks waiting in the queue
+        default: Profile name used normally
+        by_incident_type: Incident type to profile name
+        peak_profile: Profile name used under load
+        peak_queue_length: Queue length at which the peak profile applies (0 disables it)
+        
+    Returns:
+        Detector profile
+    """
+    if incident_type in by_incident_type:
+        return get_profile(by_incident_type[incident_type])
+    if 0 < peak_queue_length <= queue_length:
+        return get_profile(peak_profile)
+    return get_profile(default)
+
+
+def quantized_model_path(model_path: str) -> str:
+    """
+    Get the path of the int8 graph for an fp32 ONNX graph, quantizing it if missing.
+    
+    Args:
+        model_path: Path to the fp32 .onnx graph
+        
+    Returns:
+        Path to the dynamically quantized graph (e.g. yolov8n-int8.onnx), or
+        model_path if it cannot be quantized
+    """
+    root, extension = os.path.splitext(model_path)
+    if extension != ".onnx":
+        print(f"Warning: int8 profiles need an ONNX model, using {model_path} in fp32")
+        return model_path
+    
+    int8_path = f"{root}-int8{extension}"
+    if os.path.exists(int8_path):
+        return int8_path
+    
+    if not ONNX_QUANTIZATION_AVAILABLE or not os.path.exists(model_path):
+        print(f"Warning: Could not quantize {model_path}, using it in fp32")
+        return model_path
+    
+    # Write to a temporary name so concurrent workers never load a partial file
+    temporary_path = f"{int8_path}.{os.getpid()}.tmp"
+    quantize_dynamic(model_path, temporary_path, weight_type=QuantType.QUInt8)
+    os.replace(temporary_path, int8_path)
+    print(f"Quantized {model_path} to {int8_path}")
+    return int8_path
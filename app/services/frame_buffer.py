@@ -0,0 +1,147 @@
+"""
+Reusable buffers for decoded frames.
+
+Decoding a sampled frame used to allocate a new full-resolution BGR array,
+which the detector then resized and letterboxed into yet another array.
+A FramePool hands out FrameBuffers that hold both images, so the decoder
+writes into the same memory every time and the detector input is resized
+and letterboxed exactly once, when first needed (adaptive sampling skips
+most candidates before that point). Buffers return to the
+pool once every pipeline stage is done with the frame; the pool only
+allocates while more frames are in flight than ever before. Only the
+exported detector backends take the letterboxes (see detector_backends);
+with ultralytics the pool just decodes.
+"""
+from collections import deque
+from typing import Callable, Iterable, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def letterbox(frame: np.ndarray, size: int, out: Optional[np.ndarray] = None):
+    """
+    Resize a frame to fit a square input, padding the rest with gray.
+    
+    Args:
+        frame: BGR frame
+        size: Input width and height of the network
+        out: Optional (size, size, 3) uint8 array to draw into
+        
+    Returns:
+        Tuple of (letterboxed image, scale, x padding, y padding); frame
+        coordinates are (network coordinates - padding) / scale
+    """
+    height, width = frame.shape[:2]
+    scale = min(size / height, size / width)
+    new_width, new_height = int(round(width * scale)), int(round(height * scale))
+    pad_x, pad_y = (size - new_width) // 2, (size - new_height) // 2
+    
+    if out is None:
+        out = np.empty((size, size, 3), dtype=np.uint8)
+    out[:pad_y].fill(114)
+    out[pad_y + new_height:].fill(114)
+    out[pad_y:pad_y + new_height, :pad_x].fill(114)
+    out[pad_y:pad_y + new_height, pad_x + new_width:].fill(114)
+    # Resize straight into the canvas instead of through a temporary image
+    cv2.resize(
+        frame,
+        (new_width, new_height),
+        dst=out[pad_y:pad_y + new_height, pad_x:pad_x + new_width],
+        interpolation=cv2.INTER_LINEAR
+    )
+    return out, scale, pad_x, pad_y
+
+
+class FrameBuffer:
+    """
+    One decoded frame and its detector input.
+    
+    image is the full-resolution BGR frame that vehicle and plate crops are
+    cut from; letterboxed is its detector input.
+    """
+    
+    def __init__(self, image: np.ndarray, detector_size: Optional[int] = None):
+        """
+        Wrap a decoded frame and allocate its detector input.
+        
+        Args:
+            image: Decoded BGR frame, reused for the following frames
+            detector_size: Square detector input size in pixels, or None
+        """
+        self.image = image
+        self.detector_size = detector_size
+        self._canvas = np.empty((detector_size, detector_size, 3), dtype=np.uint8) if detector_size else None
+        self._letterboxed: Optional[tuple] = None
+    
+    def invalidate(self) -> None:
+        """
+        Mark the detector input stale after a new frame was decoded into image.
+        """
+        self._letterboxed = None
+    
+    @property
+    def letterboxed(self) -> Optional[tuple]:
+        """
+        (image, scale, pad_x, pad_y) as returned by letterbox, computed on first
+        access; None when the pool has no detector size.
+        """
+        if self._letterboxed is None and self._canvas is not None:
+            self._letterboxed = letterbox(self.image, self.detector_size, out=self._canvas)
+        return self._letterboxed
+
+
+class FramePool:
+    """
+    Free list of FrameBuffers shared by the decode stage and the last stage reading frames.
+    
+    decode is called on the decoder thread and release on the thread that
+    is done with the frames; deque appends and pops are atomic, so no lock
+    is needed.
+    """
+    
+    def __init__(self, detector_size: Optional[int] = None):
+        """
+        Initialize frame pool.
+        
+        Args:
+            detector_size: Square detector input size to letterbox every frame
+                to, or None to only decode
+        """
+        self.detector_size = detector_size
+        self.allocations = 0
+        self._free = deque()
+    
+    def decode(self, read: Callable[[Optional[np.ndarray]], Tuple[bool, np.ndarray]]) -> Optional[FrameBuffer]:
+        """
+        Decode a frame into a free buffer.
+        
+        Args:
+            read: VideoCapture.read or VideoCapture.retrieve, called with the
+                array to decode into (None while no buffer is free)
+                
+        Returns:
+            Frame buffer holding the frame, or None if decoding failed
+        """
+        buffer = self._free.pop() if self._free else None
+        ret, image = read(buffer.image if buffer is not None else None)
+        if not ret:
+            if buffer is not None:
+                self._free.append(buffer)
+            return None
+        
+        if buffer is None or image is not buffer.image:
+            # No free buffer, or the frame size changed and OpenCV allocated a new array
+            self.allocations += 1
+            buffer = FrameBuffer(image, self.detector_size)
+        buffer.invalidate()
+        return buffer
+    
+    def release(self, buffers: Iterable[FrameBuffer]) -> None:
+        """
+        Return buffers whose frames are no longer needed.
+        
+        Args:
+            buffers: Buffers from decode
+        """
+        self._free.extend(buffers)
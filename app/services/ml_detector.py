@@ -2,20 +2,20 @@
 Machine learning service for vehicle detection using YOLO.
 """
 import os
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from collections import Counter
 
-try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
-except ImportError:
-    YOLO_AVAILABLE = False
+from app.services.color_classifier import ColorClassifier
+from app.services.detector_backends import create_backend
 
 
 class MLDetector:
     """
     Machine learning detector for vehicles using YOLOv8.
+    
+    Inference runs on a pluggable backend (see detector_backends); model is
+    the loaded backend, or None if it could not be loaded.
     """
     
     # Vehicle classes from COCO dataset
@@ -25,22 +25,39 @@ class MLDetector:
         5: "bus",
         7: "truck"
     }
+    VEHICLE_CLASS_IDS = np.array(sorted(VEHICLE_CLASSES))
     
-    def __init__(self, model_path: str = "yolov8n.pt"):
+    def __init__(
+        self,
+        model_path: str = "yolov8n.pt",
+        backend: str = "ultralytics",
+        threads: int = 0,
+        input_size: Optional[int] = None
+    ):
         """
         Initialize ML detector with YOLO model.
         
         Args:
-            model_path: Path to YOLO model weights
+            model_path: Path to YOLO model weights (.pt) or exported graph (.onnx)
+            backend: Inference backend name (ultralytics, onnxruntime or openvino)
+            threads: Intra-op threads of the backend (0 keeps its default)
+            input_size: Network input size in pixels (None keeps the model's)
         """
         self.model_path = model_path
-        self.model = None
-        
-        if YOLO_AVAILABLE:
-            try:
-                self.model = YOLO(model_path)
-            except Exception as e:
-                print(f"Warning: Could not load YOLO model: {e}")
+        self.backend = backend
+        self.input_size = input_size
+        self.model = create_backend(backend, model_path, threads, input_size)
+        self.color_classifier = ColorClassifier()
+    
+    @property
+    def letterbox_size(self) -> Optional[int]:
+        """
+        Square input size frames can be letterboxed to ahead of detect_vehicles_batch,
+        or None if the backend does not use prepared letterboxes.
+        """
+        if self.model is None or not self.model.uses_letterbox:
+            return None
+        return self.model.input_size
     
     def detect_vehicles(self, frame: np.ndarray, confidence_threshold: float = 0.5) -> List[Dict[str, Any]]:
         """
@@ -53,49 +70,109 @@ class MLDetector:
         Returns:
             List of detected vehicles with bounding boxes, confidence, and type
         """
+        return self.detect_vehicles_batch([frame], confidence_threshold=confidence_threshold)[0]
+    
+    def detect_vehicles_batch(
+        self,
+        frames: List[np.ndarray],
+        batch_size: int = 8,
+        confidence_threshold: float = 0.5,
+        letterboxed: Optional[List[Optional[tuple]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Detect vehicles in many frames, running one forward pass per batch.
+        
+        Args:
+            frames: Input frames as numpy arrays
+            batch_size: Number of frames per forward pass
+            confidence_threshold: Minimum confidence score for detections
+            letterboxed: Optional list aligned with frames of (image, scale,
+                pad_x, pad_y) letterboxes to letterbox_size, which the backend
+                uses instead of resizing the frames again
+                
+        Returns:
+            List aligned with frames, each entry the detections for that frame
+        """
+        detections = [[] for _ in frames]
+        
         if self.model is None:
-            # Return empty list if model not available
+            # Return empty lists if model not available
+            return detections
+        
+        batch_size = max(batch_size, 1)
+        for start in range(0, len(frames), batch_size):
+            batch = frames[start:start + batch_size]
+            
+            try:
+                # Run inference; class and confidence filtering happen inside NMS
+                predictions = self.model.predict(
+                    batch,
+                    self.VEHICLE_CLASS_IDS,
+                    confidence_threshold,
+                    letterboxed=letterboxed[start:start + batch_size] if letterboxed is not None else None
+                )
+                
+                for offset, (frame, boxes) in enumerate(zip(batch, predictions)):
+                    detections[start + offset] = self._parse_boxes(frame, boxes, confidence_threshold)
+            
+            except Exception as e:
+                print(f"Error during vehicle detection: {e}")
+        
+        return detections
+    
+    def _parse_boxes(self, frame: np.ndarray, boxes: np.ndarray, confidence_threshold: float) -> List[Dict[str, Any]]:
+        """
+        Convert one frame's YOLO boxes into detection dictionaries.
+        
+        Class and confidence filtering and coordinate extraction operate on
+        whole arrays, so only the kept boxes are touched from Python.
+        
+        Args:
+            frame: Frame the boxes belong to
+            boxes: Backend prediction for the frame, rows of x1, y1, x2, y2, confidence, class_id
+            confidence_threshold: Minimum confidence score for detections
+            
+        Returns:
+            List of detected vehicles with bounding boxes, confidence, type and color
+        """
+        if boxes is None or len(boxes) == 0:
             return []
         
-        detections = []
+        class_ids = boxes[:, 5].astype(np.int64)
+        confidences = boxes[:, 4]
+        coordinates = boxes[:, :4]
+        
+        keep = np.isin(class_ids, self.VEHICLE_CLASS_IDS) & (confidences >= confidence_threshold)
+        if not keep.any():
+            return []
+        
+        # Clip to the frame so crops never wrap around with negative indices
+        height, width = frame.shape[:2]
+        coordinates = coordinates[keep].astype(np.int64)
+        np.clip(coordinates[:, 0::2], 0, width, out=coordinates[:, 0::2])
+        np.clip(coordinates[:, 1::2], 0, height, out=coordinates[:, 1::2])
+        
+        # Classify the colors of every box in one pass over the frame
+        colors = self.color_classifier.classify(frame, coordinates)
         
-        try:
-            # Run inference
-            results = self.model(frame, verbose=False)
+        detections = []
+        kept = zip(class_ids[keep].tolist(), confidences[keep].tolist(), coordinates.tolist(), colors)
+        for class_id, confidence, (x1, y1, x2, y2), color in kept:
+            detection = {
+                "vehicle_type": self.VEHICLE_CLASSES[class_id],
+                "confidence": confidence,
+                "bounding_box": {
+                    "x1": x1,
+                    "y1": y1,
+                    "x2": x2,
+                    "y2": y2
+                }
+            }
+            
+            if x2 > x1 and y2 > y1:
+                detection["color"] = color
             
-            # Process results
-            for result in results:
-                boxes = result.boxes
-                for box in boxes:
-                    # Get class ID and confidence
-                    class_id = int(box.cls[0])
-                    confidence = float(box.conf[0])
-                    
-                    # Check if it's a vehicle and meets confidence threshold
-                    if class_id in self.VEHICLE_CLASSES and confidence >= confidence_threshold:
-                        # Get bounding box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].tolist()
-                        
-                        detection = {
-                            "vehicle_type": self.VEHICLE_CLASSES[class_id],
-                            "confidence": confidence,
-                            "bounding_box": {
-                                "x1": int(x1),
-                                "y1": int(y1),
-                                "x2": int(x2),
-                                "y2": int(y2)
-                            }
-                        }
-                        
-                        # Detect color from cropped region
-                        cropped = frame[int(y1):int(y2), int(x1):int(x2)]
-                        if cropped.size > 0:
-                            detection["color"] = self.detect_vehicle_color(cropped)
-                        
-                        detections.append(detection)
-        
-        except Exception as e:
-            print(f"Error during vehicle detection: {e}")
+            detections.append(detection)
         
         return detections
     
@@ -118,44 +195,10 @@ class MLDetector:
         Detect dominant color of vehicle from cropped image.
         
         Args:
-            cropped_image: Cropped image of vehicle
+            cropped_image: Cropped BGR image of vehicle
             
         Returns:
-            Color name as string
+            Color name as string (see color_classifier.COLOR_LABELS), or
+            "unknown" for an empty or grayscale crop
         """
-        if cropped_image.size == 0:
-            return "unknown"
-        
-        # Resize for faster processing
-        small = cropped_image[::4, ::4]
-        
-        # Convert to RGB
-        if len(small.shape) == 3:
-            # Reshape to list of pixels
-            pixels = small.reshape(-1, 3)
-            
-            # Get average color
-            avg_color = pixels.mean(axis=0)
-            
-            # Simple color classification
-            r, g, b = avg_color
-            
-            # Basic color detection logic
-            if r > 200 and g > 200 and b > 200:
-                return "white"
-            elif r < 50 and g < 50 and b < 50:
-                return "black"
-            elif r > 150 and g < 100 and b < 100:
-                return "red"
-            elif r < 100 and g > 150 and b < 100:
-                return "green"
-            elif r < 100 and g < 100 and b > 150:
-                return "blue"
-            elif r > 150 and g > 150 and b < 100:
-                return "yellow"
-            elif r > 100 and g > 100 and b > 100:
-                return "gray"
-            else:
-                return "other"
-        
-        return "unknown"
+        return self.color_classifier.classify_crop(cropped_image)
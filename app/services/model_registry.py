@@ -0,0 +1,148 @@
+"""
+Process-wide registry of loaded ML models.
+
+Loading YOLO weights and building the EasyOCR reader takes seconds and
+hundreds of MB, so each worker process loads them once and reuses the
+instances for every task it runs.
+"""
+import os
+import resource
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.services.detector_profiles import get_profile, quantized_model_path
+from app.services.ml_detector import MLDetector
+from app.services.ocr_service import OCRService
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+_lock = threading.Lock()
+_models: Dict[str, Any] = {}
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _rss_mb() -> float:
+    """
+    Get the current resident set size of this process in megabytes.
+    
+    Returns:
+        RSS in MB from psutil if installed, else /proc/self/statm; 0.0 if
+        neither is available
+    """
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss / 1024.0 / 1024.0
+    
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024.0 / 1024.0
+    except (OSError, ValueError):
+        return 0.0
+
+
+def _max_rss_mb() -> float:
+    """
+    Get the peak resident set size of this process in megabytes.
+    
+    Returns:
+        Peak RSS in MB (ru_maxrss is reported in kilobytes on Linux)
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _get_or_load(name: str, loader: Callable[[], Any]) -> Any:
+    """
+    Return the cached model for name, loading it on first use.
+    
+    Args:
+        name: Registry key
+        loader: Callable that builds the model
+        
+    Returns:
+        The loaded model instance
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+    
+    with _lock:
+        model = _models.get(name)
+        if model is None:
+            rss_before = _rss_mb()
+            start_time = time.perf_counter()
+            
+            model = loader()
+            
+            _stats[name] = {
+                "load_time_s": round(time.perf_counter() - start_time, 3),
+                "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+            }
+            _models[name] = model
+            print(f"Loaded {name} in {_stats[name]['load_time_s']:.2f}s "
+                  f"(+{_stats[name]['rss_delta_mb']:.0f}MB RSS)")
+    
+    return model
+
+
+def get_ml_detector(profile_name: Optional[str] = None) -> MLDetector:
+    """
+    Get the process-wide vehicle detector for a profile.
+    
+    Args:
+        profile_name: Detector profile (default DETECTOR_PROFILE)
+        
+    Returns:
+        Shared MLDetector instance
+    """
+    profile = get_profile(profile_name or settings.DETECTOR_PROFILE)
+    
+    def load() -> MLDetector:
+        model_path = settings.YOLO_MODEL
+        if profile.precision == "int8":
+            model_path = quantized_model_path(model_path)
+        return MLDetector(
+            model_path,
+            backend=settings.DETECTOR_BACKEND,
+            threads=settings.DETECTOR_THREADS,
+            input_size=profile.input_size
+        )
+    
+    return _get_or_load(f"ml_detector:{profile.name}", load)
+
+
+def get_ocr_service() -> OCRService:
+    """
+    Get the process-wide OCR service.
+    
+    Returns:
+        Shared OCRService instance
+    """
+    return _get_or_load("ocr_service", lambda: OCRService(languages=[settings.OCR_LANGUAGES]))
+
+
+def warm_up() -> None:
+    """
+    Load every model up front, e.g. when a worker process starts.
+    """
+    get_ml_detector()
+    get_ocr_service()
+
+
+def get_stats() -> Dict[str, Any]:
+    """
+    Get load statistics for the models resident in this process.
+    
+    Returns:
+        Dictionary with per-model load time and RSS growth, and the current
+        and peak RSS of the process
+    """
+    return {
+        "models": {name: dict(stats) for name, stats in _stats.items()},
+        "rss_mb": round(_rss_mb(), 1),
+        "max_rss_mb": round(_max_rss_mb(), 1),
+    }
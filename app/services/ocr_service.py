@@ -101,42 +101,116 @@ class OCRService:
         
         try:
             # Run OCR on the plate image
-            results = self.reader.readtext(plate_image)
-            
-            if not results:
-                return None
-            
-            # Get the best result (highest confidence)
-            best_result = max(results, key=lambda x: x[2])
-            
-            bbox, text, confidence = best_result
+            return self._best_plate(self.reader.readtext(plate_image))
+        
+        except Exception as e:
+            print(f"Error during plate text reading: {e}")
+            return None
+    
+    def read_plate_texts(self, plate_images: List[np.ndarray], batch_size: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read text from many license plate (or vehicle) images at once.
+        
+        Images are sorted by size, grouped into batches and padded onto one
+        shared canvas per batch, so EasyOCR runs text detection once per batch
+        (readtext_batched) instead of once per image; the padding sits right
+        and below each image, so boxes stay in the image's own coordinates.
+        
+        Args:
+            plate_images: Cropped images
+            batch_size: Number of images per detection batch
             
-            # Clean up the text
-            text = text.upper().replace(" ", "").replace("-", "")
+        Returns:
+            List aligned with plate_images holding a plate dictionary (see
+            read_plate_text) or None for each image
+        """
+        plates: List[Optional[Dict[str, Any]]] = [None] * len(plate_images)
+        if self.reader is None:
+            return plates
+        
+        # Similar sizes share a batch so little of the canvas is padding
+        order = sorted(
+            (index for index, image in enumerate(plate_images) if image.size > 0),
+            key=lambda index: plate_images[index].shape[0] * plate_images[index].shape[1]
+        )
+        
+        for start in range(0, len(order), max(batch_size, 1)):
+            indices = order[start:start + max(batch_size, 1)]
+            try:
+                batch_results = self.reader.readtext_batched(
+                    self._pad_batch([plate_images[index] for index in indices]),
+                    batch_size=max(batch_size, 1)
+                )
+                for index, results in zip(indices, batch_results):
+                    plates[index] = self._best_plate(results)
             
-            # Validate that it looks like a plate
-            if not self.validate_plate_format(text):
-                return None
+            except Exception as e:
+                print(f"Error during batched plate text reading: {e}")
+        
+        return plates
+    
+    @staticmethod
+    def _pad_batch(images: List[np.ndarray]) -> np.ndarray:
+        """
+        Copy images into the top-left corner of one zero-padded BGR canvas each.
+        
+        Args:
+            images: Grayscale or BGR images
             
-            # Convert bbox format
-            points = bbox
-            x_coords = [p[0] for p in points]
-            y_coords = [p[1] for p in points]
+        Returns:
+            Array of shape (N, max height, max width, 3)
+        """
+        height = max(image.shape[0] for image in images)
+        width = max(image.shape[1] for image in images)
+        canvas = np.zeros((len(images), height, width, 3), dtype=np.uint8)
+        
+        for slot, image in zip(canvas, images):
+            if image.ndim == 2:
+                image = image[:, :, None]
+            slot[:image.shape[0], :image.shape[1]] = image[:, :, :3]
+        
+        return canvas
+    
+    def _best_plate(self, results: List[Tuple[Any, str, float]]) -> Optional[Dict[str, Any]]:
+        """
+        Pick the most confident EasyOCR result and turn it into a plate.
+        
+        Args:
+            results: EasyOCR (box, text, confidence) results for one image
             
-            return {
-                "plate_number": text,
-                "confidence": float(confidence),
-                "bounding_box": {
-                    "x1": int(min(x_coords)),
-                    "y1": int(min(y_coords)),
-                    "x2": int(max(x_coords)),
-                    "y2": int(max(y_coords))
-                }
-            }
+        Returns:
+            Plate dictionary, or None if nothing looks like a plate
+        """
+        if not results:
+            return None
         
-        except Exception as e:
-            print(f"Error during plate text reading: {e}")
+        # Get the best result (highest confidence)
+        best_result = max(results, key=lambda x: x[2])
+        
+        bbox, text, confidence = best_result
+        
+        # Clean up the text
+        text = text.upper().replace(" ", "").replace("-", "")
+        
+        # Validate that it looks like a plate
+        if not self.validate_plate_format(text):
             return None
+        
+        # Convert bbox format
+        points = bbox
+        x_coords = [p[0] for p in points]
+        y_coords = [p[1] for p in points]
+        
+        return {
+            "plate_number": text,
+            "confidence": float(confidence),
+            "bounding_box": {
+                "x1": int(min(x_coords)),
+                "y1": int(min(y_coords)),
+                "x2": int(max(x_coords)),
+                "y2": int(max(y_coords))
+            }
+        }
     
     def validate_plate_format(self, text: str) -> bool:
         """
@@ -0,0 +1,184 @@
+"""
+Temporal consensus of license plate readings.
+
+OCR of a single frame is noisy (O/0, B/8, dropped characters), but the same
+plate is usually read in several frames. Readings are combined by
+confidence-weighted voting per character position, producing one plate per
+vehicle (or per cluster of unassociated readings) with the number of
+readings that support it.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class PlateVoter:
+    """
+    Accumulates readings of one plate and votes on every character.
+    
+    The plate length is decided first by the total confidence of readings of
+    each length; then each position takes the character with the highest
+    total confidence among readings of that length.
+    """
+    
+    def __init__(self, min_weight: float = 1.5, min_agreement: float = 0.6):
+        """
+        Initialize plate voter.
+        
+        Args:
+            min_weight: Confidence every winning character must accumulate for consensus
+            min_agreement: Share of all reading confidence every winning character must hold
+        """
+        self.min_weight = min_weight
+        self.min_agreement = min_agreement
+        self.readings: List[Tuple[Dict[str, Any], float]] = []
+        self._total_weight = 0.0
+        self._length_weights: Dict[int, float] = defaultdict(float)
+        self._position_weights: Dict[int, List[Dict[str, float]]] = {}
+    
+    def add(self, plate_result: Dict[str, Any], timestamp: float) -> None:
+        """
+        Add one OCR reading.
+        
+        Args:
+            plate_result: Plate dictionary from OCRService
+            timestamp: Timestamp of the frame in seconds
+        """
+        text = plate_result["plate_number"]
+        weight = plate_result["confidence"]
+        
+        self.readings.append((plate_result, timestamp))
+        self._total_weight += weight
+        self._length_weights[len(text)] += weight
+        
+        positions = self._position_weights.setdefault(len(text), [defaultdict(float) for _ in text])
+        for position, character in zip(positions, text):
+            position[character] += weight
+    
+    def _winners(self) -> List[Tuple[str, float]]:
+        """
+        Winning character and its weight at each position of the winning length.
+        """
+        if not self.readings:
+            return []
+        
+        length = max(self._length_weights, key=self._length_weights.get)
+        return [max(position.items(), key=lambda item: item[1]) for position in self._position_weights[length]]
+    
+    @property
+    def plate_number(self) -> Optional[str]:
+        """
+        Consensus plate text, or None without readings.
+        """
+        winners = self._winners()
+        return "".join(character for character, _ in winners) if winners else None
+    
+    @property
+    def has_consensus(self) -> bool:
+        """
+        Whether every character is settled, so further OCR can stop.
+        """
+        winners = self._winners()
+        if not winners:
+            return False
+        
+        weakest = min(weight for _, weight in winners)
+        return weakest >= self.min_weight and weakest / self._total_weight >= self.min_agreement
+    
+    def result(self) -> Optional[Dict[str, Any]]:
+        """
+        Consolidate the readings into one plate.
+        
+        Returns:
+            Plate dictionary with the consensus plate_number, a confidence
+            (mean winning character weight per reading of the consensus
+            length), support_count (number of those readings), and the bounding box and
+            frame_timestamp of the best reading that matches; None without readings
+        """
+        winners = self._winners()
+        if not winners:
+            return None
+        
+        plate_number = "".join(character for character, _ in winners)
+        supporting = [
+            (reading, timestamp) for reading, timestamp in self.readings
+            if len(reading["plate_number"]) == len(plate_number)
+        ]
+        # Prefer a reading that matches the consensus exactly for the location
+        best_reading, best_timestamp = max(
+            supporting,
+            key=lambda item: (item[0]["plate_number"] == plate_number, item[0]["confidence"])
+        )
+        
+        return {
+            "plate_number": plate_number,
+            "confidence": sum(weight for _, weight in winners) / len(winners) / len(supporting),
+            "bounding_box": best_reading["bounding_box"],
+            "frame_timestamp": best_timestamp,
+            "support_count": len(supporting),
+        }
+
+
+def hamming_distance(a: str, b: str) -> int:
+    """
+    Number of differing characters between two strings of equal length.
+    
+    Args:
+        a: First string
+        b: Second string
+        
+    Returns:
+        Hamming distance, or the longer length if the lengths differ
+    """
+    if len(a) != len(b):
+        return max(len(a), len(b))
+    return sum(x != y for x, y in zip(a, b))
+
+
+class PlateClusterer:
+    """
+    Groups readings that are not tied to a tracked vehicle into plates.
+    
+    A reading joins the first cluster whose consensus text is within
+    max_distance substitutions; otherwise it starts a new cluster.
+    """
+    
+    def __init__(self, max_distance: int = 1, min_weight: float = 1.5, min_agreement: float = 0.6):
+        """
+        Initialize plate clusterer.
+        
+        Args:
+            max_distance: Maximum character substitutions to join a cluster
+            min_weight: Passed to each cluster's PlateVoter
+            min_agreement: Passed to each cluster's PlateVoter
+        """
+        self.max_distance = max_distance
+        self.min_weight = min_weight
+        self.min_agreement = min_agreement
+        self.voters: List[PlateVoter] = []
+    
+    def add(self, plate_result: Dict[str, Any], timestamp: float) -> None:
+        """
+        Add one OCR reading to its cluster.
+        
+        Args:
+            plate_result: Plate dictionary from OCRService
+            timestamp: Timestamp of the frame in seconds
+        """
+        text = plate_result["plate_number"]
+        for voter in self.voters:
+            if hamming_distance(voter.plate_number, text) <= self.max_distance:
+                voter.add(plate_result, timestamp)
+                return
+        
+        voter = PlateVoter(min_weight=self.min_weight, min_agreement=self.min_agreement)
+        voter.add(plate_result, timestamp)
+        self.voters.append(voter)
+    
+    def results(self) -> List[Dict[str, Any]]:
+        """
+        Consolidated plate of every cluster.
+        
+        Returns:
+            List of plate dictionaries, see PlateVoter.result
+        """
+        return [voter.result() for voter in self.voters]
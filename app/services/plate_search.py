@@ -0,0 +1,118 @@
+"""
+Strategies for where to look for license plates in a frame.
+
+Running EasyOCR's text detector over a full 1080p frame is the most
+expensive step of processing, so the search area is configurable:
+
+    vehicle:     read plates on detected vehicle crops only
+    vehicle_roi: read plates on the lower part of each vehicle crop only
+    full_frame:  vehicle crops, plus a text search over the whole frame
+                 (optionally downscaled, and only every Nth sampled frame)
+"""
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+
+class PlateSearch:
+    """
+    Chooses the image regions handed to OCR.
+    """
+    
+    STRATEGIES = ("vehicle", "vehicle_roi", "full_frame")
+    
+    def __init__(
+        self,
+        strategy: str = "full_frame",
+        roi_fraction: float = 0.5,
+        full_frame_interval: int = 1,
+        full_frame_max_width: int = 0
+    ):
+        """
+        Initialize plate search.
+        
+        Args:
+            strategy: One of STRATEGIES
+            roi_fraction: Lower share of the vehicle box searched by vehicle_roi
+            full_frame_interval: Search the full frame on every Nth sampled frame
+            full_frame_max_width: Downscale frames wider than this for the full
+                frame search (0 keeps the native resolution)
+                
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown plate search strategy: {strategy}")
+        
+        self.strategy = strategy
+        self.roi_fraction = min(max(roi_fraction, 0.0), 1.0)
+        self.full_frame_interval = max(full_frame_interval, 1)
+        self.full_frame_max_width = full_frame_max_width
+    
+    def vehicle_crop(self, frame: np.ndarray, bounding_box: Dict[str, int]) -> np.ndarray:
+        """
+        Crop the region of a detected vehicle to read its plate from.
+        
+        Args:
+            frame: BGR frame
+            bounding_box: Vehicle bounding box
+            
+        Returns:
+            View of the frame (the whole vehicle, or its lower part for vehicle_roi)
+        """
+        y1 = bounding_box["y1"]
+        if self.strategy == "vehicle_roi":
+            # Plates sit on the bumper, in the lower part of the vehicle box
+            y1 = bounding_box["y2"] - int((bounding_box["y2"] - bounding_box["y1"]) * self.roi_fraction)
+        
+        return frame[y1:bounding_box["y2"], bounding_box["x1"]:bounding_box["x2"]]
+    
+    def searches_full_frame(self, frame_number: int) -> bool:
+        """
+        Whether the full frame is searched for plates on this sampled frame.
+        
+        Args:
+            frame_number: Position of the frame among the sampled frames
+            
+        Returns:
+            True if full_frame_plates should run
+        """
+        return self.strategy == "full_frame" and frame_number % self.full_frame_interval == 0
+    
+    def full_frame_crops(self, frame: np.ndarray, ocr_service) -> List[np.ndarray]:
+        """
+        Find text regions on the (downscaled) frame and crop them at full resolution.
+        
+        Args:
+            frame: BGR frame
+            ocr_service: License plate OCR service
+            
+        Returns:
+            Views of the frame holding candidate plates, to be read with
+            OCRService.read_plate_texts
+        """
+        scale = 1.0
+        search_frame = frame
+        width = frame.shape[1]
+        if 0 < self.full_frame_max_width < width:
+            scale = width / self.full_frame_max_width
+            search_frame = cv2.resize(
+                frame,
+                (self.full_frame_max_width, int(round(frame.shape[0] / scale))),
+                interpolation=cv2.INTER_AREA
+            )
+        
+        crops = []
+        for plate_det in ocr_service.detect_license_plate(search_frame):
+            bbox = plate_det["bounding_box"]
+            # Map the box back to the full-resolution frame for recognition
+            plate_crop = frame[
+                max(int(bbox["y1"] * scale), 0):int(bbox["y2"] * scale),
+                max(int(bbox["x1"] * scale), 0):int(bbox["x2"] * scale)
+            ]
+            
+            if plate_crop.size > 0:
+                crops.append(plate_crop)
+        
+        return crops
@@ -0,0 +1,360 @@
+"""
+Multi-object vehicle tracker (SORT/ByteTrack style, pure NumPy).
+
+Each track follows one vehicle across sampled frames with a constant
+velocity Kalman filter over its bounding box. Detections are associated to
+predicted track boxes by IoU, high-confidence detections first and then the
+remaining low-confidence ones (ByteTrack), so a vehicle seen in many frames
+is stored once and only OCR'd until its plate readings reach consensus.
+Detections left unmatched start new tracks whatever their confidence, so a
+vehicle the detector only ever scores weakly is still stored.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.plate_consensus import PlateVoter
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise intersection over union of two sets of boxes.
+    
+    Args:
+        boxes_a: Array of shape (N, 4) with x1, y1, x2, y2 rows
+        boxes_b: Array of shape (M, 4) with x1, y1, x2, y2 rows
+        
+    Returns:
+        Array of shape (N, M) with IoU values
+    """
+    boxes_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def greedy_match(iou: np.ndarray, threshold: float) -> List[Tuple[int, int]]:
+    """
+    Match rows to columns by descending IoU.
+    
+    Args:
+        iou: IoU matrix of shape (N, M)
+        threshold: Minimum IoU of a match
+        
+    Returns:
+        List of (row, column) pairs; every row and column is used at most once
+    """
+    candidates = np.argwhere(iou >= threshold)
+    order = np.argsort(-iou[candidates[:, 0], candidates[:, 1]], kind="stable")
+    
+    matches = []
+    used_rows = set()
+    used_columns = set()
+    for row, column in candidates[order]:
+        if row in used_rows or column in used_columns:
+            continue
+        used_rows.add(row)
+        used_columns.add(column)
+        matches.append((int(row), int(column)))
+    
+    return matches
+
+
+class KalmanBoxFilter:
+    """
+    Constant velocity Kalman filter over a box's center, area and aspect ratio.
+    
+    State is [cx, cy, area, aspect, vx, vy, varea]; the aspect ratio is
+    assumed constant. Noise parameters follow SORT.
+    """
+    
+    TRANSITION = np.eye(7) + np.eye(7, k=4)
+    MEASUREMENT = np.eye(4, 7)
+    MEASUREMENT_NOISE = np.diag([1.0, 1.0, 10.0, 10.0])
+    PROCESS_NOISE = np.diag([1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 0.0001])
+    
+    def __init__(self, box: np.ndarray):
+        """
+        Initialize the filter at a detected box with unknown velocity.
+        
+        Args:
+            box: Box as x1, y1, x2, y2
+        """
+        self.state = np.zeros(7)
+        self.state[:4] = self._to_measurement(box)
+        self.covariance = np.diag([10.0, 10.0, 10.0, 10.0, 10000.0, 10000.0, 10000.0])
+    
+    @staticmethod
+    def _to_measurement(box: np.ndarray) -> np.ndarray:
+        """
+        Convert x1, y1, x2, y2 to center, area and aspect ratio.
+        """
+        width = box[2] - box[0]
+        height = box[3] - box[1]
+        return np.array([box[0] + width / 2, box[1] + height / 2, width * height, width / max(height, 1e-6)])
+    
+    @property
+    def box(self) -> np.ndarray:
+        """
+        Current box estimate as x1, y1, x2, y2.
+        """
+        center_x, center_y, area, aspect = self.state[:4]
+        width = np.sqrt(max(area * aspect, 0.0))
+        height = area / width if width > 0 else 0.0
+        return np.array([center_x - width / 2, center_y - height / 2, center_x + width / 2, center_y + height / 2])
+    
+    def predict(self) -> np.ndarray:
+        """
+        Advance the state by one sampled frame.
+        
+        Returns:
+            Predicted box as x1, y1, x2, y2
+        """
+        # Keep the area from going negative
+        if self.state[2] + self.state[6] <= 0:
+            self.state[6] = 0.0
+        
+        self.state = self.TRANSITION @ self.state
+        self.covariance = self.TRANSITION @ self.covariance @ self.TRANSITION.T + self.PROCESS_NOISE
+        return self.box
+    
+    def update(self, box: np.ndarray) -> None:
+        """
+        Correct the state with a matched detection.
+        
+        Args:
+            box: Detected box as x1, y1, x2, y2
+        """
+        residual = self._to_measurement(box) - self.MEASUREMENT @ self.state
+        innovation = self.MEASUREMENT @ self.covariance @ self.MEASUREMENT.T + self.MEASUREMENT_NOISE
+        gain = self.covariance @ self.MEASUREMENT.T @ np.linalg.inv(innovation)
+        
+        self.state = self.state + gain @ residual
+        self.covariance = (np.eye(7) - gain @ self.MEASUREMENT) @ self.covariance
+
+
+class Track:
+    """
+    One vehicle followed across frames, aggregated into a single detection.
+    """
+    
+    def __init__(
+        self,
+        track_id: int,
+        detection: Dict[str, Any],
+        box: np.ndarray,
+        timestamp: float,
+        plate_votes: Optional[PlateVoter] = None
+    ):
+        """
+        Start a track from its first detection.
+        
+        Args:
+            track_id: Identifier unique within the tracker
+            detection: Detection dictionary from MLDetector
+            box: Detection box as x1, y1, x2, y2
+            timestamp: Timestamp of the frame in seconds
+            plate_votes: Voter collecting the track's plate readings
+        """
+        self.track_id = track_id
+        self.filter = KalmanBoxFilter(box)
+        self.detection = detection
+        self.timestamp = timestamp
+        self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        self.frame_count = 1
+        self.misses = 0
+        self.plate_votes = plate_votes if plate_votes is not None else PlateVoter()
+        self.ocr_attempts = 0
+    
+    def update(self, detection: Dict[str, Any], box: np.ndarray, timestamp: float) -> None:
+        """
+        Add a matched detection; the most confident one represents the track.
+        
+        Args:
+            detection: Detection dictionary from MLDetector
+            box: Detection box as x1, y1, x2, y2
+            timestamp: Timestamp of the frame in seconds
+        """
+        self.filter.update(box)
+        self.last_timestamp = timestamp
+        self.frame_count += 1
+        self.misses = 0
+        
+        if detection["confidence"] > self.detection["confidence"]:
+            self.detection = detection
+            self.timestamp = timestamp
+    
+    def needs_ocr(self) -> bool:
+        """
+        Whether the track's plate readings have not reached consensus yet.
+        
+        Returns:
+            True if the plate should be read again
+        """
+        return not self.plate_votes.has_consensus
+    
+    def add_plate_reading(self, plate_result: Optional[Dict[str, Any]], timestamp: float) -> None:
+        """
+        Record an OCR attempt and vote with its reading.
+        
+        Args:
+            plate_result: Plate dictionary from OCRService, or None if nothing was read
+            timestamp: Timestamp of the frame in seconds
+        """
+        self.ocr_attempts += 1
+        if plate_result:
+            self.plate_votes.add(plate_result, timestamp)
+    
+    @property
+    def plate(self) -> Optional[Dict[str, Any]]:
+        """
+        Consolidated plate of the track (see PlateVoter.result), or None.
+        """
+        return self.plate_votes.result()
+    
+    def to_detection(self) -> Dict[str, Any]:
+        """
+        Aggregate the track into one detection dictionary.
+        
+        Returns:
+            Most confident detection with first/last timestamps and frame count
+        """
+        return {
+            **self.detection,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "frame_count": self.frame_count,
+        }
+
+
+class VehicleTracker:
+    """
+    Assigns detections in consecutive sampled frames to vehicle tracks.
+    """
+    
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_age: int = 2,
+        high_confidence: float = 0.6,
+        plate_min_weight: float = 1.5,
+        plate_min_agreement: float = 0.6
+    ):
+        """
+        Initialize vehicle tracker.
+        
+        Args:
+            iou_threshold: Minimum IoU between a predicted track box and a detection
+            max_age: Sampled frames a track may go unmatched before it finishes
+            high_confidence: Detections at or above this are matched first
+            plate_min_weight: Plate consensus weight per character (see PlateVoter)
+            plate_min_agreement: Plate consensus agreement per character (see PlateVoter)
+        """
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age
+        self.high_confidence = high_confidence
+        self.plate_min_weight = plate_min_weight
+        self.plate_min_agreement = plate_min_agreement
+        self.tracks: List[Track] = []
+        self._finished: List[Track] = []
+        self._next_id = 1
+    
+    def update(self, detections: List[Dict[str, Any]], timestamp: float) -> List[Tuple[Track, Dict[str, Any]]]:
+        """
+        Advance every track by one frame and associate the frame's detections.
+        
+        Args:
+            detections: Detection dictionaries from MLDetector
+            timestamp: Timestamp of the frame in seconds
+            
+        Returns:
+            List of (track, detection) pairs for the tracks seen in this frame,
+            including tracks started by it
+        """
+        predicted = np.array([track.filter.predict() for track in self.tracks]).reshape(-1, 4)
+        boxes = np.array([
+            [d["bounding_box"]["x1"], d["bounding_box"]["y1"], d["bounding_box"]["x2"], d["bounding_box"]["y2"]]
+            for d in detections
+        ], dtype=np.float64).reshape(-1, 4)
+        confidences = np.array([d["confidence"] for d in detections], dtype=np.float64)
+        
+        high = np.flatnonzero(confidences >= self.high_confidence)
+        low = np.flatnonzero(confidences < self.high_confidence)
+        
+        # Match confident detections first, then let weak ones extend the remaining tracks
+        matches = [
+            (row, high[column])
+            for row, column in greedy_match(iou_matrix(predicted, boxes[high]), self.iou_threshold)
+        ]
+        unmatched_rows = np.setdiff1d(np.arange(len(self.tracks)), [row for row, _ in matches])
+        matches += [
+            (unmatched_rows[row], low[column])
+            for row, column in greedy_match(iou_matrix(predicted[unmatched_rows], boxes[low]), self.iou_threshold)
+        ]
+        
+        seen = []
+        matched_rows = set()
+        for row, index in matches:
+            track = self.tracks[row]
+            track.update(detections[index], boxes[index], timestamp)
+            matched_rows.add(row)
+            seen.append((track, detections[index]))
+        
+        # Age unmatched tracks and finish the stale ones
+        active = []
+        for row, track in enumerate(self.tracks):
+            if row not in matched_rows:
+                track.misses += 1
+            if track.misses > self.max_age:
+                self._finished.append(track)
+            else:
+                active.append(track)
+        self.tracks = active
+        
+        # Unmatched detections start new tracks, confident ones first
+        matched_indices = {index for _, index in matches}
+        for index in np.concatenate([high, low]):
+            if index in matched_indices:
+                continue
+            track = Track(
+                self._next_id,
+                detections[index],
+                boxes[index],
+                timestamp,
+                plate_votes=PlateVoter(min_weight=self.plate_min_weight, min_agreement=self.plate_min_agreement)
+            )
+            self._next_id += 1
+            self.tracks.append(track)
+            seen.append((track, detections[index]))
+        
+        return seen
+    
+    def pop_finished(self) -> List[Track]:
+        """
+        Take the tracks that ended since the last call.
+        
+        Returns:
+            Finished tracks
+        """
+        finished, self._finished = self._finished, []
+        return finished
+    
+    def finish(self) -> List[Track]:
+        """
+        End every track, e.g. at the end of the video.
+        
+        Returns:
+            All tracks not yet returned by pop_finished
+        """
+        self._finished.extend(self.tracks)
+        self.tracks = []
+        return self.pop_finished()
@@ -3,52 +3,418 @@ Video processing service for extracting frames and manipulating video files.
 """
 import cv2
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
 import numpy as np
 
+from app.services.adaptive_sampler import AdaptiveSampler
+from app.services.frame_buffer import FramePool
+
+
+class VideoSegment(NamedTuple):
+    """
+    A contiguous frame range of a video processed as one unit.
+    
+    start_time/end_time bound the timestamps of the frames sampled in the
+    segment (padded by half a sampling interval); end_frame and end_time are
+    None for the last segment, which runs to the end of the video.
+    """
+    start_frame: int
+    end_frame: Optional[int]
+    start_time: float
+    end_time: Optional[float]
+
 
 class VideoProcessor:
     """
     Video processing utilities for dashcam videos.
     """
     
-    def extract_frames(self, video_path: str, fps: int = 1) -> List[np.ndarray]:
+    # Frame sampling modes:
+    #   read: decode and convert every frame, keep the sampled ones (legacy)
+    #   grab: demux/decode every frame but only convert sampled ones to BGR
+    #   seek: jump straight to each sampled frame (best for long, sparse sampling)
+    #   auto: seek for videos longer than seek_min_duration, grab otherwise
+    #   adaptive: grab candidates at fps, keep those whose content changed (see AdaptiveSampler)
+    SAMPLING_MODES = ("read", "grab", "seek", "auto", "adaptive")
+    
+    def iter_frames(
+        self,
+        video_path: str,
+        fps: int = 1,
+        mode: str = "grab",
+        seek_min_duration: float = 600.0,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        sampler: Optional[AdaptiveSampler] = None,
+        buffers: Optional[FramePool] = None
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
         """
-        Extract frames from video at specified frame rate.
+        Lazily iterate over frames sampled at the specified frame rate.
+        
+        The video is opened eagerly so that missing or unreadable files raise
+        immediately; frames are then decoded one at a time as the caller
+        consumes the iterator, so only a single frame is held in memory.
         
         Args:
             video_path: Path to video file
-            fps: Frames per second to extract (default: 1)
-            
+            fps: Frames per second to extract (default: 1); the maximum rate in adaptive mode
+            mode: Sampling mode, one of SAMPLING_MODES (default: grab)
+            seek_min_duration: Minimum duration in seconds for auto mode to seek
+            start_frame: First source frame of the range to sample (default: 0)
+            end_frame: Source frame to stop before (default: end of video)
+            sampler: Sampler deciding which frames adaptive mode keeps
+                (default: AdaptiveSampler())
+            buffers: Pool to decode sampled frames into instead of allocating
+                a new array per frame; the caller releases each buffer back
+                to it once done with the frame
+                
         Returns:
-            List of frames as numpy arrays
+            Iterator of (frame_index, timestamp_seconds, frame) tuples, where
+            timestamp_seconds is the presentation timestamp of the frame and
+            frame is a FrameBuffer when buffers is given
+            
+        Raises:
+            FileNotFoundError: If video file doesn't exist
+            ValueError: If video file cannot be opened or mode is unknown
         """
+        if mode not in self.SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode: {mode}")
+        
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        frames = []
         video = cv2.VideoCapture(video_path)
         
         if not video.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
         
-        # Get video FPS
-        video_fps = video.get(cv2.CAP_PROP_FPS)
-        frame_interval = int(video_fps / fps) if fps < video_fps else 1
+        if mode == "auto":
+            video_fps = video.get(cv2.CAP_PROP_FPS)
+            frame_total = video.get(cv2.CAP_PROP_FRAME_COUNT)
+            duration = frame_total / video_fps if video_fps > 0 else 0.0
+            mode = "seek" if duration >= seek_min_duration else "grab"
+        
+        if mode == "seek":
+            return self._generate_seek_frames(video, fps, start_frame, end_frame, buffers)
+        
+        if mode == "adaptive":
+            return self._generate_adaptive_frames(
+                self._generate_frames(video, fps, start_frame, end_frame, buffers=buffers),
+                sampler if sampler is not None else AdaptiveSampler(),
+                buffers
+            )
+        
+        return self._generate_frames(video, fps, start_frame, end_frame, retrieve_all=(mode == "read"), buffers=buffers)
+    
+    @staticmethod
+    def _frame_interval(video_fps: float, fps: int) -> int:
+        """
+        Number of source frames between two sampled frames.
+        
+        Args:
+            video_fps: Nominal frame rate of the video
+            fps: Requested sampling rate
+            
+        Returns:
+            Frame interval (at least 1)
+        """
+        return max(int(video_fps / fps), 1) if fps < video_fps else 1
+    
+    def _generate_frames(
+        self,
+        video: cv2.VideoCapture,
+        fps: int,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        retrieve_all: bool = False,
+        buffers: Optional[FramePool] = None
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """
+        Sequential generator backing iter_frames; releases the capture when exhausted or closed.
+        
+        Skipped frames are only grabbed (demuxed and decoded without the
+        colour conversion and copy into a numpy array) unless retrieve_all
+        is set, which reproduces the legacy read-everything behaviour.
         
-        frame_count = 0
-        while True:
-            ret, frame = video.read()
-            if not ret:
-                break
+        Args:
+            video: Opened video capture
+            fps: Frames per second to extract
+            start_frame: First source frame of the range
+            end_frame: Source frame to stop before, or None for the end of the video
+            retrieve_all: Retrieve every frame, not just the sampled ones
+            buffers: Pool to decode sampled frames into
             
-            if frame_count % frame_interval == 0:
-                frames.append(frame)
+        Yields:
+            (frame_index, timestamp_seconds, frame) tuples
+        """
+        try:
+            # Get video FPS
+            video_fps = video.get(cv2.CAP_PROP_FPS)
+            frame_interval = self._frame_interval(video_fps, fps)
             
-            frame_count += 1
+            frame_count = 0
+            if start_frame > 0:
+                video.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+                frame_count = start_frame
+            
+            while end_frame is None or frame_count < end_frame:
+                if not video.grab():
+                    break
+                
+                sampled = frame_count % frame_interval == 0
+                if sampled and buffers is not None:
+                    frame = buffers.decode(video.retrieve)
+                    if frame is None:
+                        break
+                    
+                    yield frame_count, self._frame_timestamp(video, frame_count, video_fps), frame
+                elif sampled or retrieve_all:
+                    ret, frame = video.retrieve()
+                    if not ret:
+                        break
+                    
+                    if sampled:
+                        yield frame_count, self._frame_timestamp(video, frame_count, video_fps), frame
+                
+                frame_count += 1
+        finally:
+            video.release()
+    
+    def _generate_seek_frames(
+        self,
+        video: cv2.VideoCapture,
+        fps: int,
+        start_frame: int = 0,
+        end_frame: Optional[int] = None,
+        buffers: Optional[FramePool] = None
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """
+        Seeking generator backing iter_frames; releases the capture when exhausted or closed.
         
-        video.release()
-        return frames
+        Each sampled frame is reached by seeking (the decoder restarts at the
+        nearest preceding keyframe), so frames between keyframes and sample
+        points are never decoded when the sampling interval exceeds the GOP.
+        
+        Args:
+            video: Opened video capture
+            fps: Frames per second to extract
+            start_frame: First source frame of the range
+            end_frame: Source frame to stop before, or None for the end of the video
+            buffers: Pool to decode sampled frames into
+            
+        Yields:
+            (frame_index, timestamp_seconds, frame) tuples
+        """
+        try:
+            video_fps = video.get(cv2.CAP_PROP_FPS)
+            frame_total = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+            frame_interval = self._frame_interval(video_fps, fps)
+            
+            # Sample the same absolute frame indices as a full pass would
+            first_index = -(-start_frame // frame_interval) * frame_interval
+            stop_index = frame_total if end_frame is None else min(end_frame, frame_total)
+            
+            for frame_index in range(first_index, stop_index, frame_interval):
+                if frame_index > 0:
+                    video.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                
+                if buffers is not None:
+                    frame = buffers.decode(video.read)
+                    ret = frame is not None
+                else:
+                    ret, frame = video.read()
+                if not ret:
+                    break
+                
+                yield frame_index, self._frame_timestamp(video, frame_index, video_fps), frame
+        finally:
+            video.release()
+    
+    @staticmethod
+    def _generate_adaptive_frames(
+        candidates: Iterator[Tuple[int, float, np.ndarray]],
+        sampler: AdaptiveSampler,
+        buffers: Optional[FramePool] = None
+    ) -> Iterator[Tuple[int, float, np.ndarray]]:
+        """
+        Adaptive generator backing iter_frames: keep the candidates the sampler accepts.
+        
+        Args:
+            candidates: Frames sampled at the maximum rate
+            sampler: Sampler deciding which frames are kept
+            buffers: Pool the candidates were decoded into; skipped ones go back to it
+            
+        Yields:
+            (frame_index, timestamp_seconds, frame) tuples
+        """
+        try:
+            for frame_index, timestamp, frame in candidates:
+                image = frame.image if buffers is not None else frame
+                if sampler.should_keep(image, timestamp):
+                    yield frame_index, timestamp, frame
+                elif buffers is not None:
+                    buffers.release([frame])
+        finally:
+            candidates.close()
+    
+    def plan_segments(self, video_path: str, fps: int = 1, segment_seconds: float = 60.0) -> List[VideoSegment]:
+        """
+        Split a video into segments that can be processed independently.
+        
+        Segment boundaries fall on sampled frames, so processing every
+        segment samples exactly the frames a single pass would.
+        
+        Args:
+            video_path: Path to video file
+            fps: Frames per second that will be extracted
+            segment_seconds: Target segment length; 0 or less means one segment
+            
+        Returns:
+            List of segments in order
+        """
+        info = self.get_video_info(video_path)
+        video_fps = info["fps"]
+        frame_total = info["frame_count"]
+        frame_interval = self._frame_interval(video_fps, fps)
+        
+        if segment_seconds <= 0 or video_fps <= 0 or frame_total <= 0:
+            return [VideoSegment(0, None, 0.0, None)]
+        
+        segment_frames = max(int(segment_seconds * video_fps) // frame_interval, 1) * frame_interval
+        
+        # Pad time bounds by half an interval so timestamp jitter stays inside
+        return self._split_range(0, frame_total, segment_frames, frame_total, frame_interval / 2, video_fps)
+    
+    def plan_event_segments(
+        self,
+        video_path: str,
+        event_time: float,
+        window_seconds: float,
+        window_fps: int,
+        fps: int = 1,
+        segment_seconds: float = 60.0
+    ) -> Tuple[List[VideoSegment], List[VideoSegment]]:
+        """
+        Split a video into an event window sampled densely and the rest.
+        
+        The window boundaries fall on frames sampled at fps, so the backfill
+        segments sample exactly the frames a single pass would outside the
+        window. Time bounds of every segment are padded by half a window
+        sampling interval, so window and backfill segments never claim each
+        other's frames.
+        
+        Args:
+            video_path: Path to video file
+            event_time: Position of the event in the video in seconds
+            window_seconds: Seconds before and after the event in the window
+            window_fps: Frames per second extracted inside the window
+            fps: Frames per second extracted outside the window
+            segment_seconds: Target segment length; 0 or less means one segment per part
+            
+        Returns:
+            Tuple of (window segments, backfill segments); the window is empty
+            if the video has no usable frame rate or frame count
+        """
+        info = self.get_video_info(video_path)
+        video_fps = info["fps"]
+        frame_total = info["frame_count"]
+        
+        if video_fps <= 0 or frame_total <= 0:
+            return [], self.plan_segments(video_path, fps=fps, segment_seconds=segment_seconds)
+        
+        frame_interval = self._frame_interval(video_fps, fps)
+        padding = min(self._frame_interval(video_fps, window_fps), frame_interval) / 2
+        
+        # Keep the window inside the video even if the event time is not
+        last_sample = (frame_total - 1) // frame_interval * frame_interval
+        window_start = int((event_time - window_seconds) * video_fps) // frame_interval * frame_interval
+        window_start = min(max(window_start, 0), last_sample)
+        window_end = -(-int((event_time + window_seconds) * video_fps) // frame_interval) * frame_interval
+        window_end = min(max(window_end, window_start + frame_interval), frame_total)
+        
+        if segment_seconds > 0:
+            segment_frames = max(int(segment_seconds * video_fps) // frame_interval, 1) * frame_interval
+        else:
+            segment_frames = frame_total
+        
+        window = self._split_range(window_start, window_end, segment_frames, frame_total, padding, video_fps)
+        backfill = (
+            self._split_range(0, window_start, segment_frames, frame_total, padding, video_fps)
+            + self._split_range(window_end, frame_total, segment_frames, frame_total, padding, video_fps)
+        )
+        return window, backfill
+    
+    @staticmethod
+    def _split_range(
+        start: int,
+        stop: int,
+        segment_frames: int,
+        frame_total: int,
+        padding: float,
+        video_fps: float
+    ) -> List[VideoSegment]:
+        """
+        Split the frame range [start, stop) into segments of segment_frames.
+        
+        Args:
+            start: First frame of the range
+            stop: Frame to stop before
+            segment_frames: Frames per segment
+            frame_total: Frames in the video; a segment ending there runs to the end
+            padding: Frames the time bounds are moved back by
+            video_fps: Nominal frame rate of the video
+            
+        Returns:
+            List of segments in order
+        """
+        boundaries = list(range(start, stop, segment_frames)) + [stop]
+        return [
+            VideoSegment(
+                start_frame=segment_start,
+                end_frame=None if segment_end >= frame_total else segment_end,
+                start_time=max(segment_start - padding, 0) / video_fps,
+                end_time=None if segment_end >= frame_total else (segment_end - padding) / video_fps
+            )
+            for segment_start, segment_end in zip(boundaries, boundaries[1:])
+        ]
+    
+    @staticmethod
+    def _frame_timestamp(video: cv2.VideoCapture, frame_index: int, video_fps: float) -> float:
+        """
+        Get the presentation timestamp (in seconds) of the frame just decoded.
+        
+        Falls back to frame_index / fps when the container does not report
+        timestamps.
+        
+        Args:
+            video: Video capture positioned after the decoded frame
+            frame_index: Index of the decoded frame
+            video_fps: Nominal frame rate of the video
+            
+        Returns:
+            Timestamp in seconds
+        """
+        position_ms = video.get(cv2.CAP_PROP_POS_MSEC)
+        if position_ms > 0 or frame_index == 0:
+            return position_ms / 1000.0
+        
+        return frame_index / video_fps if video_fps > 0 else 0.0
+    
+    def extract_frames(self, video_path: str, fps: int = 1, mode: str = "grab") -> List[np.ndarray]:
+        """
+        Extract frames from video at specified frame rate.
+        
+        Materializes every sampled frame; prefer iter_frames for long videos.
+        
+        Args:
+            video_path: Path to video file
+            fps: Frames per second to extract (default: 1)
+            mode: Sampling mode, see iter_frames (default: grab)
+            
+        Returns:
+            List of frames as numpy arrays
+        """
+        return [frame for _, _, frame in self.iter_frames(video_path, fps=fps, mode=mode)]
     
     def get_video_info(self, video_path: str) -> Dict[str, Any]:
         """
@@ -68,11 +434,15 @@ class VideoProcessor:
         if not video.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
         
+        video_fps = video.get(cv2.CAP_PROP_FPS)
+        frame_total = video.get(cv2.CAP_PROP_FRAME_COUNT)
+        
         info = {
-            "duration": video.get(cv2.CAP_PROP_FRAME_COUNT) / video.get(cv2.CAP_PROP_FPS),
+            # Some streams report no frame rate; callers fall back on fps <= 0
+            "duration": frame_total / video_fps if video_fps > 0 else 0.0,
             "width": int(video.get(cv2.CAP_PROP_FRAME_WIDTH)),
             "height": int(video.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-            "fps": video.get(cv2.CAP_PROP_FPS),
+            "fps": video_fps,
             "frame_count": int(video.get(cv2.CAP_PROP_FRAME_COUNT)),
             "codec": int(video.get(cv2.CAP_PROP_FOURCC))
         }
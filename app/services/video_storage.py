@@ -0,0 +1,324 @@
+"""
+Video storage service for persisting uploaded videos.
+
+Videos are stored content-addressed by their SHA-256 digest under
+objects/<first two hex digits>/<digest>/raw.mp4, so identical uploads share
+one file. Uploads are first written to a staging directory on the same
+filesystem and then renamed into place.
+
+A shared video is never deleted in place: once no incident references it,
+its directory is moved to trash/<digest>.<unix time>.<random> and only
+removed by purge_video_trash after a grace period, when references are
+checked again. A concurrent report that found the object just before it
+was trashed moves it back with restore_video.
+"""
+import hashlib
+import os
+import shutil
+import time
+import uuid
+from typing import AsyncIterator, List, Tuple
+
+import aiofiles
+from fastapi import UploadFile
+from starlette.requests import ClientDisconnect
+
+from app.core.config import settings
+
+
+OBJECTS_DIR = "objects"
+STAGING_DIR = "staging"
+TRASH_DIR = "trash"
+VIDEO_FILENAME = "raw.mp4"
+THUMBNAIL_FILENAME = "thumbnail.jpg"
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the maximum allowed size."""
+
+
+def incident_storage_dir(user_id: str, incident_id: str) -> str:
+    """
+    Get (and create) the storage directory for an incident's files.
+    
+    Args:
+        user_id: UUID of the reporting user
+        incident_id: UUID of the incident
+        
+    Returns:
+        Path to the incident storage directory
+    """
+    storage_dir = os.path.join(settings.VIDEO_STORAGE_PATH, user_id, incident_id)
+    os.makedirs(storage_dir, exist_ok=True)
+    return storage_dir
+
+
+def staging_path(name: str) -> str:
+    """
+    Get a path in the staging directory for an upload in progress.
+    
+    Args:
+        name: Unique file name, e.g. the incident ID
+        
+    Returns:
+        Path to write the upload to before it is stored
+    """
+    staging_dir = os.path.join(settings.VIDEO_STORAGE_PATH, STAGING_DIR)
+    os.makedirs(staging_dir, exist_ok=True)
+    return os.path.join(staging_dir, f"{name}.part")
+
+
+def object_path(sha256: str) -> str:
+    """
+    Get the content-addressed path of a video.
+    
+    Args:
+        sha256: Hex SHA-256 digest of the video
+        
+    Returns:
+        Path of the stored video
+    """
+    return os.path.join(settings.VIDEO_STORAGE_PATH, OBJECTS_DIR, sha256[:2], sha256, VIDEO_FILENAME)
+
+
+def store_object(source_path: str, sha256: str) -> str:
+    """
+    Move a fully written video into content-addressed storage.
+    
+    If a video with the same digest is already stored, the new copy is
+    discarded and the existing file is shared.
+    
+    Args:
+        source_path: Path of the written video (on the storage filesystem)
+        sha256: Hex SHA-256 digest of the video
+        
+    Returns:
+        Path of the stored video
+    """
+    path = object_path(sha256)
+    
+    if os.path.exists(path):
+        os.remove(source_path)
+        return path
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(source_path, path)
+    return path
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 digest of a file without loading it into memory.
+    
+    Args:
+        path: Path of the file
+        chunk_size: Number of bytes read per chunk
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def remove_video(video_path: str) -> None:
+    """
+    Delete a stored video, its thumbnail and its directory if left empty.
+    
+    Args:
+        video_path: Path of the stored video
+    """
+    video_dir = os.path.dirname(video_path)
+    
+    for path in (video_path, os.path.join(video_dir, THUMBNAIL_FILENAME)):
+        if os.path.exists(path):
+            os.remove(path)
+    
+    if os.path.exists(video_dir) and not os.listdir(video_dir):
+        os.rmdir(video_dir)
+
+
+def trash_video(video_path: str) -> None:
+    """
+    Move a content-addressed video's directory (with its thumbnail) to the trash.
+    
+    Args:
+        video_path: Path of the stored video
+    """
+    video_dir = os.path.dirname(video_path)
+    trash_dir = os.path.join(settings.VIDEO_STORAGE_PATH, TRASH_DIR)
+    os.makedirs(trash_dir, exist_ok=True)
+    
+    try:
+        os.replace(video_dir, os.path.join(trash_dir, f"{os.path.basename(video_dir)}.{int(time.time())}.{uuid.uuid4().hex}"))
+    except FileNotFoundError:
+        pass
+
+
+def trashed_videos() -> List[Tuple[str, str, float]]:
+    """
+    List the trashed video directories.
+    
+    Returns:
+        List of (path, SHA-256 digest, unix time trashed) tuples
+    """
+    trash_dir = os.path.join(settings.VIDEO_STORAGE_PATH, TRASH_DIR)
+    if not os.path.isdir(trash_dir):
+        return []
+    
+    entries = []
+    for name in os.listdir(trash_dir):
+        sha256, _, rest = name.partition(".")
+        trashed_at = rest.partition(".")[0]
+        if trashed_at.isdigit():
+            entries.append((os.path.join(trash_dir, name), sha256, float(trashed_at)))
+    return entries
+
+
+def restore_video(sha256: str) -> bool:
+    """
+    Make sure a content-addressed video is in object storage, moving a trashed copy back if needed.
+    
+    Args:
+        sha256: Hex SHA-256 digest of the video
+        
+    Returns:
+        True if the video is stored
+    """
+    path = object_path(sha256)
+    
+    for trashed_path, trashed_sha256, _ in trashed_videos():
+        if os.path.exists(path):
+            break
+        if trashed_sha256 != sha256:
+            continue
+        
+        os.makedirs(os.path.dirname(os.path.dirname(path)), exist_ok=True)
+        try:
+            os.replace(trashed_path, os.path.dirname(path))
+        except OSError:
+            # Another request restored or re-stored it first
+            continue
+    
+    return os.path.exists(path)
+
+
+def purge_trashed_video(trashed_path: str) -> None:
+    """
+    Permanently delete a trashed video directory.
+    
+    Args:
+        trashed_path: Path from trashed_videos
+    """
+    shutil.rmtree(trashed_path, ignore_errors=True)
+
+
+def remove_upload_part(part_path: str) -> None:
+    """
+    Delete the partial file of an abandoned resumable upload and its directory if left empty.
+    
+    Args:
+        part_path: Path of the partially uploaded file
+    """
+    if os.path.exists(part_path):
+        os.remove(part_path)
+    
+    upload_dir = os.path.dirname(part_path)
+    if os.path.exists(upload_dir) and not os.listdir(upload_dir):
+        os.rmdir(upload_dir)
+
+
+async def save_upload(
+    upload: UploadFile,
+    destination: str,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024
+) -> Tuple[int, str]:
+    """
+    Stream an uploaded file to disk in fixed-size chunks.
+    
+    Only one chunk is held in memory at a time and the SHA-256 digest is
+    computed on the fly. Starlette has already spooled the upload by the
+    time this runs, so the size limit here only guards the copy;
+    BodySizeLimitMiddleware enforces it while the request arrives.
+    
+    Args:
+        upload: Uploaded file
+        destination: Path to write the file to
+        max_bytes: Maximum allowed size in bytes
+        chunk_size: Number of bytes read and written per chunk
+        
+    Returns:
+        Tuple of (size in bytes, hex SHA-256 digest)
+        
+    Raises:
+        UploadTooLargeError: If the upload exceeds max_bytes; the partial file is removed
+    """
+    # Reject early when the client-declared size is already too large
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(f"Upload of {upload.size} bytes exceeds {max_bytes} bytes")
+    
+    size = 0
+    digest = hashlib.sha256()
+    
+    try:
+        async with aiofiles.open(destination, "wb") as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                
+                digest.update(chunk)
+                await f.write(chunk)
+    except BaseException:
+        # Never leave a partial video behind
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+    
+    return size, digest.hexdigest()
+
+
+async def write_range(path: str, offset: int, chunks: AsyncIterator[bytes], length: int) -> int:
+    """
+    Write a byte range of a resumable upload in place at the given offset.
+    
+    Parts are written straight into the final file, so assembling the
+    upload never copies data. If the client disconnects mid-range, the
+    bytes received so far are kept and counted so the upload can resume
+    from there.
+    
+    Args:
+        path: Path of the partially uploaded file
+        offset: Byte offset to start writing at
+        chunks: Async iterator of body chunks
+        length: Number of bytes the client declared for this range
+        
+    Returns:
+        Number of bytes written
+        
+    Raises:
+        UploadTooLargeError: If the body is longer than length; nothing is counted
+    """
+    written = 0
+    
+    async with aiofiles.open(path, "r+b") as f:
+        await f.seek(offset)
+        try:
+            async for chunk in chunks:
+                if written + len(chunk) > length:
+                    raise UploadTooLargeError(f"Body exceeds declared range of {length} bytes")
+                
+                await f.write(chunk)
+                written += len(chunk)
+        except ClientDisconnect:
+            pass
+    
+    return written
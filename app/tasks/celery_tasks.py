@@ -1,31 +1,588 @@
 """
 Celery tasks for background video processing.
 """
+import math
 import os
+import queue
+import threading
 import time
-import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from celery import chord
+from celery.signals import worker_process_init
+from sqlalchemy.orm import Session
 
 from app.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.core.config import settings
 from app.models.incident import Incident, ProcessingStatus
+from app.models.upload import UploadSession
 from app.models.vehicle import DetectedVehicle, LicensePlate
-from app.services.video_processor import VideoProcessor
-from app.services.ml_detector import MLDetector
-from app.services.ocr_service import OCRService
+from app.services.adaptive_sampler import AdaptiveSampler
+from app.services.detection_writer import DetectionWriter
+from app.services.detector_profiles import choose_profile, parse_profile_map
+from app.services.frame_buffer import FramePool
+from app.services.plate_consensus import PlateClusterer
+from app.services.plate_search import PlateSearch
+from app.services.tracker import VehicleTracker
+from app.services.video_storage import purge_trashed_video, remove_upload_part, restore_video, trashed_videos
+from app.services.video_processor import VideoProcessor, VideoSegment
+from app.services import model_registry
+from app.tasks import signatures
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most size items without materializing it.
+    
+    Args:
+        iterable: Items to group
+        size: Maximum batch size
+        
+    Yields:
+        Lists of consecutive items
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, max(size, 1)))
+        if not batch:
+            return
+        yield batch
+
+
+def _sampling_fps() -> int:
+    """
+    Rate at which frames (or adaptive sampling candidates) are taken.
+    
+    Returns:
+        ADAPTIVE_SAMPLING_MAX_FPS in adaptive mode, 1 otherwise
+    """
+    return settings.ADAPTIVE_SAMPLING_MAX_FPS if settings.FRAME_SAMPLING_MODE == "adaptive" else 1
+
+
+def _find_processed_duplicate(db: Session, incident: Incident) -> Optional[Incident]:
+    """
+    Find a completed incident with the same video content.
+    
+    Args:
+        db: Database session
+        incident: Incident about to be processed
+        
+    Returns:
+        Earliest completed incident sharing the video hash, or None
+    """
+    if not incident.video_sha256:
+        return None
+    
+    return db.query(Incident).filter(
+        Incident.video_sha256 == incident.video_sha256,
+        Incident.incident_id != incident.incident_id,
+        Incident.processing_status == ProcessingStatus.COMPLETED
+    ).order_by(Incident.created_at).first()
+
+
+@worker_process_init.connect
+def warm_up_models(**kwargs):
+    """
+    Load ML models once when a worker process starts so tasks reuse them.
+    
+    The parent waits up to WORKER_PROC_ALIVE_TIMEOUT for this to return
+    before killing the process, so the timeout must cover model loading.
+    """
+    if not settings.PRELOAD_MODELS:
+        return
+    
+    try:
+        model_registry.warm_up()
+    except Exception as e:
+        # Models are loaded lazily on first use if warm-up fails
+        print(f"Error warming up models: {e}")
+
+
+@celery_app.task(name="model_registry_stats")
+def model_registry_stats():
+    """
+    Report load time and memory of the models resident in the worker process.
+    
+    Returns:
+        Model registry statistics for the process that ran the task
+    """
+    return model_registry.get_stats()
+
+
+# Marks the end of a pipeline queue
+_PIPELINE_DONE = object()
+
+
+class _StageStats:
+    """
+    Timing counters of one pipeline stage.
+    
+    busy_s is time spent working, wait_s time starved waiting for input and
+    blocked_s time stalled on a full output queue (backpressure). The stage
+    with the highest utilization is the bottleneck.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy_s = 0.0
+        self.wait_s = 0.0
+        self.blocked_s = 0.0
+    
+    def as_dict(self, wall_s: float) -> Dict[str, float]:
+        """
+        Export the counters with utilization relative to the pipeline wall time.
+        
+        Args:
+            wall_s: Wall-clock duration of the pipeline
+            
+        Returns:
+            Dictionary of stage statistics
+        """
+        return {
+            "items": self.items,
+            "busy_s": round(self.busy_s, 3),
+            "wait_s": round(self.wait_s, 3),
+            "blocked_s": round(self.blocked_s, 3),
+            "utilization": round(self.busy_s / wall_s, 3) if wall_s > 0 else 0.0,
+        }
+
+
+def _queue_get(inbox: queue.Queue, stop: threading.Event, stats: _StageStats) -> Iterator:
+    """
+    Yield items from a pipeline queue until the end marker or a stop request.
+    
+    Args:
+        inbox: Queue to read from
+        stop: Event set when the pipeline is aborted
+        stats: Stats of the consuming stage (wait time is recorded)
+        
+    Yields:
+        Queued items
+    """
+    while True:
+        start_time = time.perf_counter()
+        item = _PIPELINE_DONE
+        while not stop.is_set():
+            try:
+                item = inbox.get(timeout=0.1)
+                break
+            except queue.Empty:
+                continue
+        stats.wait_s += time.perf_counter() - start_time
+        
+        if item is _PIPELINE_DONE:
+            return
+        yield item
+
+
+def _queue_put(outbox: queue.Queue, item, stop: threading.Event, stats: _StageStats) -> bool:
+    """
+    Put an item on a bounded pipeline queue, blocking while it is full.
+    
+    Args:
+        outbox: Queue to write to
+        item: Item to queue
+        stop: Event set when the pipeline is aborted
+        stats: Stats of the producing stage (blocked time is recorded)
+        
+    Returns:
+        True if the item was queued, False if the pipeline was aborted
+    """
+    start_time = time.perf_counter()
+    try:
+        while not stop.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    finally:
+        stats.blocked_s += time.perf_counter() - start_time
+
+
+def _run_stage(
+    stats: _StageStats,
+    items: Iterable,
+    process: Callable,
+    outbox: Optional[queue.Queue],
+    stop: threading.Event,
+    errors: List[BaseException],
+    finish: Optional[Callable] = None
+) -> None:
+    """
+    Apply process to every item and pass results downstream.
+    
+    Any error aborts the whole pipeline; the end marker is always sent so the
+    next stage finishes.
+    
+    Args:
+        stats: Stats of this stage
+        items: Input items (a source iterator or a _queue_get generator)
+        process: Work function applied to each item
+        outbox: Queue receiving results, or None for the last stage
+        stop: Event set when the pipeline is aborted
+        errors: List collecting the exception that aborted the pipeline
+        finish: Optional callable whose result is sent after the last item,
+            for stages that hold state (e.g. open tracks)
+    """
+    iterator = iter(items)
+    try:
+        while not stop.is_set():
+            start_time = time.perf_counter()
+            wait_before = stats.wait_s
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            result = process(item)
+            # Time spent waiting on the input queue is not work
+            stats.busy_s += time.perf_counter() - start_time - (stats.wait_s - wait_before)
+            stats.items += 1
+            
+            if outbox is not None and not _queue_put(outbox, result, stop, stats):
+                break
+        
+        if finish is not None and not stop.is_set():
+            start_time = time.perf_counter()
+            result = finish()
+            stats.busy_s += time.perf_counter() - start_time
+            if outbox is not None:
+                _queue_put(outbox, result, stop, stats)
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        if outbox is not None:
+            _queue_put(outbox, _PIPELINE_DONE, stop, stats)
+        if hasattr(iterator, "close"):
+            iterator.close()
+
+
+def _run_pipeline(
+    frames: Iterable,
+    writer: DetectionWriter,
+    ml_detector,
+    ocr_service,
+    frame_pool: Optional[FramePool] = None
+) -> Dict[str, Any]:
+    """
+    Detect and track vehicles and read license plates in sampled frames.
+    
+    Runs as a staged pipeline so decoding, YOLO inference and OCR overlap:
+    decode (thread) -> detect (thread) -> track + OCR (thread) -> write
+    (calling thread, which owns the database session). Stages are connected
+    by bounded queues of PIPELINE_QUEUE_SIZE batches, so a slow stage stalls
+    its producers instead of buffering frames without limit.
+    
+    Vehicles are tracked across frames and written once per track when it
+    ends. A track's plate is read until its readings reach consensus and is
+    stored once; plates read on the full frame (per PLATE_SEARCH_STRATEGY)
+    are clustered and stored once per cluster at the end. The plate crops of
+    a whole frame batch are read with one batched OCR call.
+    
+    With a frame pool, frames are FrameBuffers: the detector gets their
+    letterboxed inputs, crops are cut from their full-resolution images,
+    and the OCR stage returns them to the pool once their batch is read.
+    
+    Args:
+        frames: Iterable of (frame_index, timestamp_seconds, frame) tuples
+        writer: Detection writer receiving the rows
+        ml_detector: Vehicle detector
+        ocr_service: License plate OCR service
+        frame_pool: Pool the frames were decoded into, if any
+        
+    Returns:
+        Dictionary with frames, tracks, ocr_calls and full_frame_searches
+        counts and per-stage statistics under stages
+        
+    Raises:
+        Exception: The first error raised by any stage
+    """
+    stages = {name: _StageStats(name) for name in ("decode", "detect", "ocr", "write")}
+    queues = [queue.Queue(maxsize=max(settings.PIPELINE_QUEUE_SIZE, 1)) for _ in range(3)]
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    
+    tracker = VehicleTracker(
+        iou_threshold=settings.TRACKER_IOU_THRESHOLD,
+        max_age=settings.TRACKER_MAX_AGE,
+        high_confidence=settings.TRACKER_HIGH_CONFIDENCE,
+        plate_min_weight=settings.PLATE_CONSENSUS_MIN_WEIGHT,
+        plate_min_agreement=settings.PLATE_CONSENSUS_MIN_AGREEMENT
+    )
+    unassociated_plates = PlateClusterer(
+        max_distance=settings.PLATE_CLUSTER_MAX_DISTANCE,
+        min_weight=settings.PLATE_CONSENSUS_MIN_WEIGHT,
+        min_agreement=settings.PLATE_CONSENSUS_MIN_AGREEMENT
+    )
+    plate_search = PlateSearch(
+        strategy=settings.PLATE_SEARCH_STRATEGY,
+        roi_fraction=settings.PLATE_SEARCH_ROI_FRACTION,
+        full_frame_interval=settings.PLATE_SEARCH_FULL_FRAME_INTERVAL,
+        full_frame_max_width=settings.PLATE_SEARCH_FULL_FRAME_MAX_WIDTH
+    )
+    counts = {"frames": 0, "tracks": 0, "ocr_calls": 0, "full_frame_searches": 0}
+    
+    def detect(frame_batch):
+        # Detect vehicles in the whole batch with one forward pass
+        if frame_pool is None:
+            return frame_batch, ml_detector.detect_vehicles_batch(
+                [frame for _, _, frame in frame_batch],
+                batch_size=settings.DETECTOR_BATCH_SIZE
+            )
+        return frame_batch, ml_detector.detect_vehicles_batch(
+            [frame.image for _, _, frame in frame_batch],
+            batch_size=settings.DETECTOR_BATCH_SIZE,
+            letterboxed=[frame.letterboxed for _, _, frame in frame_batch]
+        )
+    
+    # Fewest readings that could reach consensus (confidences are at most 1)
+    reads_per_batch = max(math.ceil(settings.PLATE_CONSENSUS_MIN_WEIGHT), 1)
+    
+    def ocr(detected_batch):
+        frame_batch, batch_detections = detected_batch
+        # (track or None for a full-frame plate, timestamp, crop) read in one OCR batch
+        reads = []
+        pending: Dict[int, int] = {}
+        
+        for (frame_idx, frame_timestamp, frame), vehicle_detections in zip(frame_batch, batch_detections):
+            if frame_pool is not None:
+                frame = frame.image
+            frame_number = counts["frames"]
+            counts["frames"] += 1
+            
+            # Read plates only on tracks whose readings have not reached consensus
+            for track, detection in tracker.update(vehicle_detections, frame_timestamp):
+                if track.needs_ocr() and pending.get(track.track_id, 0) < reads_per_batch:
+                    pending[track.track_id] = pending.get(track.track_id, 0) + 1
+                    counts["ocr_calls"] += 1
+                    reads.append((track, frame_timestamp, plate_search.vehicle_crop(frame, detection["bounding_box"])))
+            
+            if plate_search.searches_full_frame(frame_number):
+                counts["full_frame_searches"] += 1
+                for plate_crop in _find_unassociated_plates(frame_idx, frame, plate_search, ocr_service):
+                    reads.append((None, frame_timestamp, plate_crop))
+        
+        plate_results = _read_plates(ocr_service, [crop for _, _, crop in reads])
+        for (track, frame_timestamp, _), plate_result in zip(reads, plate_results):
+            if track is not None:
+                track.add_plate_reading(plate_result, frame_timestamp)
+            elif plate_result:
+                unassociated_plates.add(plate_result, frame_timestamp)
+        
+        # Every crop of the batch has been read; the frames can be decoded over
+        if frame_pool is not None:
+            frame_pool.release(frame for _, _, frame in frame_batch)
+        
+        return tracker.pop_finished(), []
+    
+    def finish_tracks():
+        return tracker.finish(), unassociated_plates.results()
+    
+    def write(results):
+        tracks, plates = results
+        for track in tracks:
+            detection_id = writer.add_vehicle(track.to_detection(), track.timestamp)
+            plate = track.plate
+            if plate:
+                writer.add_plate(plate, plate["frame_timestamp"], detection_id=detection_id)
+        
+        for plate in plates:
+            # Not associated with specific vehicle
+            writer.add_plate(plate, plate["frame_timestamp"])
+        
+        counts["tracks"] += len(tracks)
+    
+    threads = [
+        threading.Thread(
+            target=_run_stage,
+            args=(stages[name], items, process, outbox, stop, errors, finish),
+            name=f"pipeline-{name}",
+            daemon=True
+        )
+        for name, items, process, outbox, finish in (
+            ("decode", _batched(frames, settings.DETECTOR_BATCH_SIZE), lambda batch: batch, queues[0], None),
+            ("detect", _queue_get(queues[0], stop, stages["detect"]), detect, queues[1], None),
+            ("ocr", _queue_get(queues[1], stop, stages["ocr"]), ocr, queues[2], finish_tracks),
+        )
+    ]
+    
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    
+    # The writer runs here: the database session must stay on this thread
+    written = _queue_get(queues[2], stop, stages["write"])
+    try:
+        while True:
+            step_time = time.perf_counter()
+            wait_before = stages["write"].wait_s
+            results = next(written, None)
+            if results is None:
+                break
+            write(results)
+            stages["write"].busy_s += time.perf_counter() - step_time - (stages["write"].wait_s - wait_before)
+            stages["write"].items += 1
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+        # Closing _batched leaves its source open; release the video capture now, not on GC
+        if hasattr(frames, "close"):
+            frames.close()
+    
+    if errors:
+        raise errors[0]
+    
+    wall_s = time.perf_counter() - start_time
+    return {**counts, "stages": {name: stats.as_dict(wall_s) for name, stats in stages.items()}}
+
+
+def _read_plates(ocr_service, crops: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Read license plates on many crops with one batched OCR call.
+    
+    Args:
+        ocr_service: License plate OCR service
+        crops: BGR vehicle or plate crops
+        
+    Returns:
+        Plate dictionary from OCRService, or None, for each crop
+    """
+    if not crops:
+        return []
+    
+    try:
+        return ocr_service.read_plate_texts(crops, batch_size=settings.OCR_BATCH_SIZE)
+    except Exception as e:
+        print(f"Error in batched plate OCR: {e}")
+        return [None] * len(crops)
+
+
+def _find_unassociated_plates(frame_idx: int, frame, plate_search: PlateSearch, ocr_service) -> List[Any]:
+    """
+    Detect license plate regions across the full frame.
+    
+    Args:
+        frame_idx: Index of the frame
+        frame: BGR frame
+        plate_search: Plate search strategy
+        ocr_service: License plate OCR service
+        
+    Returns:
+        Plate crops not associated with a specific vehicle
+    """
+    try:
+        return plate_search.full_frame_crops(frame, ocr_service)
+    except Exception as e:
+        print(f"Error in general plate detection on frame {frame_idx}: {e}")
+        return []
+
+
+def _delete_segment_detections(db: Session, incident_id: str, start_time: float, end_time: Optional[float]) -> None:
+    """
+    Delete detections an earlier attempt of a segment may have committed.
+    
+    Args:
+        db: Database session
+        incident_id: UUID of the incident
+        start_time: First timestamp of the segment in seconds
+        end_time: Timestamp the segment stops before, or None for the end of the video
+    """
+    for model in (LicensePlate, DetectedVehicle):
+        query = db.query(model).filter(model.incident_id == incident_id, model.frame_timestamp >= start_time)
+        if end_time is not None:
+            query = query.filter(model.frame_timestamp < end_time)
+        query.delete(synchronize_session=False)
+
+
+def _set_processing_status(incident_id: str, processing_status: ProcessingStatus) -> None:
+    """
+    Update the processing status of an incident in its own session.
+    
+    Args:
+        incident_id: UUID of the incident
+        processing_status: New status
+    """
+    db = SessionLocal()
+    try:
+        incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
+        if incident:
+            incident.processing_status = processing_status
+            db.commit()
+    except Exception as db_error:
+        print(f"Error updating incident status: {db_error}")
+    finally:
+        db.close()
 
 
-@celery_app.task(name="process_incident_video")
+def _segment_signatures(
+    incident_id: str,
+    segments: List[VideoSegment],
+    profile: str,
+    fps: Optional[int] = None,
+    priority: Optional[int] = None
+) -> list:
+    """
+    Build one process_video_segment signature per segment.
+    
+    Args:
+        incident_id: UUID of the incident
+        segments: Segments to process
+        profile: Detector profile name
+        fps: Sampling rate of the segments (default: the configured rate)
+        priority: Broker message priority (default: the task default)
+        
+    Returns:
+        List of Celery signatures
+    """
+    header = []
+    for segment in segments:
+        segment_signature = process_video_segment.s(incident_id, *segment, profile=profile, fps=fps)
+        if priority is not None:
+            segment_signature = segment_signature.set(priority=priority)
+        header.append(segment_signature)
+    return header
+
+
+def _queued_task_count() -> int:
+    """
+    Count the tasks waiting in the default Celery queue.
+    
+    Returns:
+        Number of queued messages, or 0 if the broker cannot be asked
+    """
+    try:
+        with celery_app.connection_for_read() as connection:
+            return connection.default_channel.queue_declare(
+                queue=celery_app.conf.task_default_queue,
+                passive=True
+            ).message_count
+    except Exception as e:
+        print(f"Error reading queue length: {e}")
+        return 0
+
+
+@celery_app.task(name=signatures.PROCESS_INCIDENT_VIDEO)
 def process_incident_video(incident_id: str):
     """
     Process incident video: extract frames, detect vehicles, and read license plates.
     
+    The video is split into time segments processed in parallel by
+    process_video_segment; finalize_incident_processing runs once every
+    segment has finished and marks the incident completed.
+    
     Args:
         incident_id: UUID of the incident to process
     """
     db = SessionLocal()
-    start_time = time.time()
     
     try:
         # Get incident from database
@@ -41,110 +598,254 @@ def process_incident_video(incident_id: str):
         
         print(f"Starting processing for incident {incident_id}")
         
-        # Initialize services
-        video_processor = VideoProcessor()
-        ml_detector = MLDetector(settings.YOLO_MODEL)
-        ocr_service = OCRService(languages=[settings.OCR_LANGUAGES])
+        # Reuse the results of an earlier run on the same video
+        source = _find_processed_duplicate(db, incident)
+        if source is not None:
+            writer = DetectionWriter(db, incident_id, chunk_size=settings.DETECTION_INSERT_CHUNK_SIZE)
+            writer.copy_from(source.incident_id)
+            writer.flush()
+            incident.processing_status = ProcessingStatus.COMPLETED
+            db.commit()
+            print(f"Reused detections of incident {source.incident_id} for incident {incident_id}: "
+                  f"{writer.vehicles_written} vehicles, {writer.plates_written} plates")
+            return
         
-        # Extract frames from video
+        # Split the video into segments on sampled frames
         try:
-            frames = video_processor.extract_frames(incident.video_path, fps=1)
-            print(f"Extracted {len(frames)} frames from video")
+            processor = VideoProcessor()
+            if settings.EVENT_FIRST_PROCESSING:
+                window, backfill = processor.plan_event_segments(
+                    incident.video_path,
+                    event_time=processor.get_video_info(incident.video_path)["duration"] * settings.EVENT_POSITION,
+                    window_seconds=settings.EVENT_WINDOW_SECONDS,
+                    window_fps=settings.EVENT_WINDOW_FPS,
+                    fps=_sampling_fps(),
+                    segment_seconds=settings.VIDEO_SEGMENT_SECONDS
+                )
+            else:
+                window, backfill = [], processor.plan_segments(
+                    incident.video_path,
+                    fps=_sampling_fps(),
+                    segment_seconds=settings.VIDEO_SEGMENT_SECONDS
+                )
         except Exception as e:
             print(f"Error extracting frames: {e}")
             incident.processing_status = ProcessingStatus.FAILED
             db.commit()
             return
         
-        # Process each frame
-        for frame_idx, frame in enumerate(frames):
-            frame_timestamp = float(frame_idx)
-            
-            try:
-                # Detect vehicles in frame
-                vehicle_detections = ml_detector.detect_vehicles(frame)
-                
-                # Save detected vehicles
-                for detection in vehicle_detections:
-                    detected_vehicle = DetectedVehicle(
-                        detection_id=str(uuid.uuid4()),
-                        incident_id=incident_id,
-                        vehicle_type=detection["vehicle_type"],
-                        make=detection.get("make"),
-                        model=detection.get("model"),
-                        color=detection.get("color"),
-                        confidence=detection["confidence"],
-                        bounding_box=detection["bounding_box"],
-                        frame_timestamp=frame_timestamp
-                    )
-                    db.add(detected_vehicle)
-                    
-                    # Try to detect license plates on vehicle
-                    bbox = detection["bounding_box"]
-                    try:
-                        # Crop vehicle region
-                        vehicle_crop = frame[
-                            bbox["y1"]:bbox["y2"],
-                            bbox["x1"]:bbox["x2"]
-                        ]
-                        
-                        # Run OCR on vehicle region
-                        if vehicle_crop.size > 0:
-                            plate_result = ocr_service.read_plate_text(vehicle_crop)
-                            
-                            if plate_result:
-                                license_plate = LicensePlate(
-                                    plate_id=str(uuid.uuid4()),
-                                    incident_id=incident_id,
-                                    detection_id=detected_vehicle.detection_id,
-                                    plate_number=plate_result["plate_number"],
-                                    confidence=plate_result["confidence"],
-                                    state_region=None,
-                                    country=None,
-                                    frame_timestamp=frame_timestamp,
-                                    bounding_box=plate_result["bounding_box"]
-                                )
-                                db.add(license_plate)
-                    
-                    except Exception as e:
-                        print(f"Error detecting plate on vehicle: {e}")
-                
-                # Also try general license plate detection on full frame
-                try:
-                    plate_detections = ocr_service.detect_license_plate(frame)
-                    
-                    for plate_det in plate_detections:
-                        bbox = plate_det["bounding_box"]
-                        plate_crop = frame[
-                            bbox["y1"]:bbox["y2"],
-                            bbox["x1"]:bbox["x2"]
-                        ]
-                        
-                        if plate_crop.size > 0:
-                            plate_result = ocr_service.read_plate_text(plate_crop)
-                            
-                            if plate_result:
-                                license_plate = LicensePlate(
-                                    plate_id=str(uuid.uuid4()),
-                                    incident_id=incident_id,
-                                    detection_id=None,  # Not associated with specific vehicle
-                                    plate_number=plate_result["plate_number"],
-                                    confidence=plate_result["confidence"],
-                                    state_region=None,
-                                    country=None,
-                                    frame_timestamp=frame_timestamp,
-                                    bounding_box=plate_result["bounding_box"]
-                                )
-                                db.add(license_plate)
-                
-                except Exception as e:
-                    print(f"Error in general plate detection: {e}")
-            
-            except Exception as e:
-                print(f"Error processing frame {frame_idx}: {e}")
+        profile = choose_profile(
+            incident.type.value if incident.type else None,
+            _queued_task_count() if settings.DETECTOR_PEAK_QUEUE_LENGTH > 0 else 0,
+            default=settings.DETECTOR_PROFILE,
+            by_incident_type=parse_profile_map(settings.DETECTOR_PROFILE_BY_INCIDENT_TYPE),
+            peak_profile=settings.DETECTOR_PEAK_PROFILE,
+            peak_queue_length=settings.DETECTOR_PEAK_QUEUE_LENGTH
+        )
+        started_at = time.time()
+        
+        if window and backfill:
+            # Event window first; its callback marks the incident partial and queues the rest
+            header = _segment_signatures(incident_id, window, profile.name, fps=settings.EVENT_WINDOW_FPS)
+            callback = finish_event_window.s(incident_id, started_at, backfill, profile.name)
+        else:
+            # Fan out one subtask per segment; the reducer runs when all succeed
+            header = (
+                _segment_signatures(incident_id, window, profile.name, fps=settings.EVENT_WINDOW_FPS)
+                + _segment_signatures(incident_id, backfill, profile.name)
+            )
+            callback = finalize_incident_processing.s(incident_id, started_at)
+        chord(header)(callback.on_error(mark_incident_failed.si(incident_id)))
+        
+        print(f"Queued {len(header)} segments for incident {incident_id} with the {profile.name} detector profile"
+              + (f", {len(backfill)} more after the event window" if window and backfill else ""))
+    
+    except Exception as e:
+        print(f"Error processing incident {incident_id}: {e}")
+        
+        # Update status to failed
+        _set_processing_status(incident_id, ProcessingStatus.FAILED)
+    
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="process_video_segment",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=settings.SEGMENT_MAX_RETRIES
+)
+def process_video_segment(
+    incident_id: str,
+    start_frame: int,
+    end_frame: Optional[int],
+    start_time: float,
+    end_time: Optional[float],
+    profile: Optional[str] = None,
+    fps: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Detect vehicles and read license plates in one segment of an incident video.
+    
+    Detections are committed together at the end, and rows left in the
+    segment's time range by an earlier attempt are replaced, so the task
+    can be retried safely.
+    
+    Args:
+        incident_id: UUID of the incident
+        start_frame: First source frame of the segment
+        end_frame: Source frame to stop before, or None for the end of the video
+        start_time: First timestamp of the segment in seconds
+        end_time: Timestamp the segment stops before, or None for the end of the video
+        profile: Detector profile name (default DETECTOR_PROFILE)
+        fps: Sampling rate, e.g. denser inside the event window (default: the configured rate)
+        
+    Returns:
+        Dictionary with frames, vehicles, plates and ocr_calls counts and
+        per-stage pipeline statistics for the segment
+    """
+    db = SessionLocal()
+    
+    try:
+        incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
+        
+        if not incident:
+            print(f"Incident {incident_id} not found")
+            return {"frames": 0, "vehicles": 0, "plates": 0, "ocr_calls": 0, "stages": {}}
+        
+        ml_detector = model_registry.get_ml_detector(profile)
+        ocr_service = model_registry.get_ocr_service()
+        
+        # Open video for streaming frame extraction
+        sampler = AdaptiveSampler(
+            min_fps=settings.ADAPTIVE_SAMPLING_MIN_FPS,
+            motion_threshold=settings.ADAPTIVE_MOTION_THRESHOLD,
+            scene_threshold=settings.ADAPTIVE_SCENE_THRESHOLD
+        )
+        frame_pool = FramePool(detector_size=ml_detector.letterbox_size) if settings.FRAME_BUFFER_REUSE else None
+        frames = VideoProcessor().iter_frames(
+            incident.video_path,
+            fps=fps or _sampling_fps(),
+            mode=settings.FRAME_SAMPLING_MODE,
+            seek_min_duration=settings.FRAME_SEEK_MIN_DURATION_SECONDS,
+            start_frame=start_frame,
+            end_frame=end_frame,
+            sampler=sampler,
+            buffers=frame_pool
+        )
+        
+        _delete_segment_detections(db, incident_id, start_time, end_time)
         
-        # Commit all detections
+        # Buffer detections and insert them in bulk
+        writer = DetectionWriter(db, incident_id, chunk_size=settings.DETECTION_INSERT_CHUNK_SIZE)
+        summary = _run_pipeline(frames, writer, ml_detector, ocr_service, frame_pool)
+        
+        # Write remaining detections and commit
+        writer.flush()
         db.commit()
+        print(f"Processed {summary['frames']} frames of incident {incident_id} "
+              f"[{start_frame}, {end_frame if end_frame is not None else 'end'}): "
+              f"{writer.vehicles_written} tracked vehicles, {writer.plates_written} plates, "
+              f"{summary['ocr_calls']} vehicle OCR calls")
+        if settings.FRAME_SAMPLING_MODE == "adaptive":
+            print(f"Adaptive sampling kept {sampler.kept} of {sampler.kept + sampler.skipped} candidate frames")
+        if frame_pool is not None:
+            print(f"Frame buffers: {frame_pool.allocations} allocated for {summary['frames']} frames "
+                  f"({frame_pool.allocations / max(summary['frames'], 1):.2f} per frame)")
+        print("Pipeline utilization: " + ", ".join(
+            f"{name} {stats['utilization']:.0%}" for name, stats in summary["stages"].items()
+        ))
+        
+        return {
+            "frames": summary["frames"],
+            "vehicles": writer.vehicles_written,
+            "plates": writer.plates_written,
+            "ocr_calls": summary["ocr_calls"],
+            "stages": summary["stages"],
+        }
+    
+    finally:
+        db.close()
+
+
+@celery_app.task(name="finish_event_window")
+def finish_event_window(
+    segment_results: List[Dict[str, Any]],
+    incident_id: str,
+    started_at: float,
+    backfill: List[List[Any]],
+    profile: Optional[str] = None
+):
+    """
+    Mark an incident partially processed once its event window is done, then queue the backfill.
+    
+    Backfill segments are queued at EVENT_BACKFILL_PRIORITY, so event windows
+    of newer incidents overtake them.
+    
+    Args:
+        segment_results: Counts returned by each event window segment task
+        incident_id: UUID of the incident
+        started_at: Time the processing was queued (epoch seconds)
+        backfill: Remaining segments as VideoSegment fields
+        profile: Detector profile name
+    """
+    _set_processing_status(incident_id, ProcessingStatus.PARTIAL)
+    print(f"Event window of incident {incident_id} ready in {time.time() - started_at:.2f} seconds: "
+          f"{sum(result['vehicles'] for result in segment_results)} tracked vehicles, "
+          f"{sum(result['plates'] for result in segment_results)} plates")
+    
+    header = _segment_signatures(
+        incident_id,
+        [VideoSegment(*segment) for segment in backfill],
+        profile,
+        priority=settings.EVENT_BACKFILL_PRIORITY
+    )
+    callback = finalize_incident_processing.s(incident_id, started_at, earlier_results=segment_results)
+    chord(header)(callback.on_error(mark_incident_failed.si(incident_id)))
+
+
+@celery_app.task(name="finalize_incident_processing")
+def finalize_incident_processing(
+    segment_results: List[Dict[str, Any]],
+    incident_id: str,
+    started_at: float,
+    earlier_results: Optional[List[Dict[str, Any]]] = None
+):
+    """
+    Merge segment results, generate the thumbnail and mark the incident completed.
+    
+    Args:
+        segment_results: Counts returned by each process_video_segment task
+        incident_id: UUID of the incident
+        started_at: Time the processing was queued (epoch seconds)
+        earlier_results: Counts of segments processed before, e.g. the event window
+    """
+    segment_results = (earlier_results or []) + segment_results
+    db = SessionLocal()
+    
+    try:
+        incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
+        
+        if not incident:
+            print(f"Incident {incident_id} not found")
+            return
+        
+        totals = {
+            key: sum(result[key] for result in segment_results)
+            for key in ("frames", "vehicles", "plates", "ocr_calls")
+        }
+        print(f"Processed {totals['frames']} frames from video in {len(segment_results)} segments: "
+              f"{totals['vehicles']} tracked vehicles, {totals['plates']} plates, "
+              f"{totals['ocr_calls']} vehicle OCR calls")
+        
+        # Total busy time per pipeline stage shows where processing time goes
+        stage_busy = {}
+        for result in segment_results:
+            for name, stats in result.get("stages", {}).items():
+                stage_busy[name] = stage_busy.get(name, 0.0) + stats["busy_s"]
+        if stage_busy:
+            print("Pipeline busy time: " + ", ".join(f"{name} {busy_s:.1f}s" for name, busy_s in stage_busy.items()))
         
         # Generate thumbnail
         try:
@@ -152,7 +853,7 @@ def process_incident_video(incident_id: str):
                 os.path.dirname(incident.video_path),
                 "thumbnail.jpg"
             )
-            video_processor.generate_thumbnail(incident.video_path, thumbnail_path)
+            VideoProcessor().generate_thumbnail(incident.video_path, thumbnail_path)
             print(f"Generated thumbnail at {thumbnail_path}")
         except Exception as e:
             print(f"Error generating thumbnail: {e}")
@@ -161,20 +862,91 @@ def process_incident_video(incident_id: str):
         incident.processing_status = ProcessingStatus.COMPLETED
         db.commit()
         
-        processing_time = time.time() - start_time
+        processing_time = time.time() - started_at
         print(f"Completed processing incident {incident_id} in {processing_time:.2f} seconds")
     
     except Exception as e:
         print(f"Error processing incident {incident_id}: {e}")
         
         # Update status to failed
-        try:
-            incident = db.query(Incident).filter(Incident.incident_id == incident_id).first()
-            if incident:
-                incident.processing_status = ProcessingStatus.FAILED
-                db.commit()
-        except Exception as db_error:
-            print(f"Error updating incident status: {db_error}")
+        _set_processing_status(incident_id, ProcessingStatus.FAILED)
+    
+    finally:
+        db.close()
+
+
+@celery_app.task(name="mark_incident_failed")
+def mark_incident_failed(incident_id: str):
+    """
+    Mark an incident failed, e.g. when a segment exhausted its retries.
+    
+    Args:
+        incident_id: UUID of the incident
+    """
+    print(f"Processing failed for incident {incident_id}")
+    _set_processing_status(incident_id, ProcessingStatus.FAILED)
+
+
+@celery_app.task(name="cleanup_expired_uploads")
+def cleanup_expired_uploads() -> int:
+    """
+    Delete resumable upload sessions idle for UPLOAD_SESSION_EXPIRE_HOURS and their partial files.
+    
+    Runs periodically from Celery beat.
+    
+    Returns:
+        Number of sessions deleted
+    """
+    db = SessionLocal()
+    
+    try:
+        cutoff = datetime.utcnow() - timedelta(hours=settings.UPLOAD_SESSION_EXPIRE_HOURS)
+        expired = db.query(UploadSession).filter(UploadSession.updated_at < cutoff).all()
+        
+        for upload in expired:
+            remove_upload_part(upload.part_path)
+            db.delete(upload)
+        
+        db.commit()
+        if expired:
+            print(f"Deleted {len(expired)} expired upload sessions")
+        return len(expired)
+    
+    finally:
+        db.close()
+
+
+@celery_app.task(name="purge_video_trash")
+def purge_video_trash() -> int:
+    """
+    Delete trashed videos older than VIDEO_TRASH_GRACE_MINUTES that no incident references.
+    
+    References are checked again first, so a video a report started using
+    while it was in the trash is restored instead. Runs periodically from
+    Celery beat.
+    
+    Returns:
+        Number of videos deleted
+    """
+    db = SessionLocal()
+    
+    try:
+        cutoff = time.time() - settings.VIDEO_TRASH_GRACE_MINUTES * 60
+        purged = 0
+        
+        for trashed_path, video_sha256, trashed_at in trashed_videos():
+            if trashed_at >= cutoff:
+                continue
+            if db.query(Incident).filter(Incident.video_sha256 == video_sha256).count():
+                restore_video(video_sha256)
+            # Restored entries are gone; what is left is unreferenced or a duplicate of the stored object
+            if os.path.exists(trashed_path):
+                purge_trashed_video(trashed_path)
+                purged += 1
+        
+        if purged:
+            print(f"Purged {purged} trashed videos")
+        return purged
     
     finally:
         db.close()
@@ -0,0 +1,25 @@
+"""
+Signatures for enqueueing background tasks by name.
+
+The API imports this module instead of app.tasks.celery_tasks, so API
+processes never load the ML stack (torch, OpenCV, EasyOCR) the tasks
+themselves need. Task names must match the names registered by the worker.
+"""
+from celery import Signature
+
+from app.celery_app import celery_app
+
+PROCESS_INCIDENT_VIDEO = "process_incident_video"
+
+
+def process_incident_video(incident_id: str) -> Signature:
+    """
+    Build the signature of the video processing task.
+    
+    Args:
+        incident_id: UUID of the incident to process
+        
+    Returns:
+        Celery signature; call .delay() to enqueue it
+    """
+    return celery_app.signature(PROCESS_INCIDENT_VIDEO, args=(incident_id,))
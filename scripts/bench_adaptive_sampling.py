@@ -0,0 +1,115 @@
+"""
+Benchmark adaptive vs. fixed-rate frame sampling.
+
+Usage:
+    python scripts/bench_adaptive_sampling.py [video_path --event START END] [--max-fps 5] [--min-fps 0.2]
+
+Reports the frames each strategy hands to the detector (overall and inside
+the event window) and the decode CPU time. Without a video path a synthetic
+60 s clip is generated: a parked, noisy static scene with a 5 s burst of
+motion starting at 25 s.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.adaptive_sampler import AdaptiveSampler  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+
+def write_event_video(path: str, seconds: int = 60, fps: int = 30, event=(25, 30), size=(640, 360)) -> str:
+    """
+    Write a static clip with sensor noise and one burst of motion.
+
+    Args:
+        path: Output path
+        seconds: Clip length in seconds
+        fps: Clip frame rate
+        event: Start and end of the motion in seconds
+        size: Frame (width, height)
+
+    Returns:
+        Path to the written clip
+    """
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.default_rng(0)
+    background = rng.integers(40, 200, (height, width, 3), dtype=np.uint8)
+
+    for i in range(seconds * fps):
+        frame = cv2.add(background, rng.integers(0, 4, background.shape, dtype=np.uint8))
+        if event[0] * fps <= i < event[1] * fps:
+            # Camera shake and a vehicle crossing the frame
+            frame = np.roll(frame, (i % 7) * 6, axis=1)
+            x = int((i - event[0] * fps) * 12 % width)
+            cv2.rectangle(frame, (x, 120), (x + 160, 260), (0, 0, 255), -1)
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+
+def run(video_path: str, fps: int, mode: str, sampler=None) -> tuple:
+    """
+    Consume every sampled frame and measure CPU time.
+
+    Returns:
+        Tuple of (timestamps of the emitted frames, CPU seconds)
+    """
+    cpu_start = time.process_time()
+    timestamps = [
+        timestamp
+        for _, timestamp, _ in VideoProcessor().iter_frames(video_path, fps=fps, mode=mode, sampler=sampler)
+    ]
+    return timestamps, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--event", type=float, nargs=2, default=(25.0, 30.0), metavar=("START", "END"))
+    parser.add_argument("--max-fps", type=int, default=5)
+    parser.add_argument("--min-fps", type=float, default=0.2)
+    parser.add_argument("--motion-threshold", type=float, default=6.0)
+    parser.add_argument("--scene-threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    cv2.setNumThreads(1)
+
+    temp_dir = None
+    video_path = args.video_path
+    if video_path is None:
+        temp_dir = tempfile.mkdtemp()
+        video_path = write_event_video(os.path.join(temp_dir, "event.mp4"), event=args.event)
+
+    strategies = [
+        ("fixed 1 fps", 1, "grab", None),
+        (f"fixed {args.max_fps} fps", args.max_fps, "grab", None),
+        (f"adaptive {args.min_fps:g}-{args.max_fps} fps", args.max_fps, "adaptive", AdaptiveSampler(
+            min_fps=args.min_fps,
+            motion_threshold=args.motion_threshold,
+            scene_threshold=args.scene_threshold
+        )),
+    ]
+
+    start, end = args.event
+    print(f"{'strategy':24s} {'frames':>7s} {'in event':>9s} {'outside':>8s} {'cpu s':>7s}")
+    for label, fps, mode, sampler in strategies:
+        timestamps, cpu_s = run(video_path, fps, mode, sampler)
+        in_event = sum(start <= timestamp < end for timestamp in timestamps)
+        print(f"{label:24s} {len(timestamps):7d} {in_event:9d} {len(timestamps) - in_event:8d} {cpu_s:7.2f}")
+
+    if temp_dir:
+        os.remove(video_path)
+        os.rmdir(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark the histogram color classifier against the mean-RGB thresholds.
+
+Usage:
+    python scripts/bench_color_classifier.py [--vehicles 1 4 8 16] [--repeats 200]
+
+Draws synthetic 1280x720 frames with vehicles of known body color (with
+dark windows and tires on a gray road) and reports, per number of vehicles
+in the frame, the per-frame latency of labelling every box and the share
+of boxes labelled correctly. The legacy classifier is the previous
+MLDetector.detect_vehicle_color, called once per crop; it read OpenCV's BGR
+pixels as RGB, so red and blue vehicles swap.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.color_classifier import ColorClassifier  # noqa: E402
+
+BODIES = {
+    "red": (30, 30, 190),
+    "blue": (170, 60, 20),
+    "green": (40, 150, 30),
+    "yellow": (20, 200, 220),
+    "white": (235, 235, 235),
+    "black": (25, 25, 25),
+    "gray": (140, 140, 140),
+}
+
+
+def legacy_detect_vehicle_color(cropped_image: np.ndarray) -> str:
+    """
+    The previous mean-color classifier, kept verbatim for comparison.
+    """
+    if cropped_image.size == 0:
+        return "unknown"
+
+    small = cropped_image[::4, ::4]
+    if len(small.shape) == 3:
+        pixels = small.reshape(-1, 3)
+        avg_color = pixels.mean(axis=0)
+        r, g, b = avg_color
+
+        if r > 200 and g > 200 and b > 200:
+            return "white"
+        elif r < 50 and g < 50 and b < 50:
+            return "black"
+        elif r > 150 and g < 100 and b < 100:
+            return "red"
+        elif r < 100 and g > 150 and b < 100:
+            return "green"
+        elif r < 100 and g < 100 and b > 150:
+            return "blue"
+        elif r > 150 and g > 150 and b < 100:
+            return "yellow"
+        elif r > 100 and g > 100 and b > 100:
+            return "gray"
+        else:
+            return "other"
+
+    return "unknown"
+
+
+def draw_frame(count: int, rng: np.random.Generator) -> tuple:
+    """
+    Draw a road frame with count (at most 16) vehicles.
+
+    Returns:
+        Tuple of (frame, (N, 4) boxes, true color labels)
+    """
+    frame = np.clip(rng.normal(100, 12, (720, 1280, 3)), 0, 255).astype(np.uint8)
+    boxes, labels = [], []
+    # One vehicle per cell of a 4x4 grid, so vehicles never overlap
+    for cell in rng.permutation(16)[:count].tolist():
+        label = rng.choice(list(BODIES))
+        width, height = int(rng.integers(120, 300)), int(rng.integers(80, 160))
+        x1 = cell % 4 * 320 + int(rng.integers(8, 320 - width - 8))
+        y1 = cell // 4 * 180 + int(rng.integers(8, 180 - height - 8))
+        body = np.array(BODIES[label]) + rng.normal(0, 6, (height, width, 3))
+        # Windows across the upper third, tires at the bottom corners
+        body[height // 6:height // 3, width // 5:-width // 5] = 35
+        body[-height // 5:, width // 10:width // 4] = 15
+        body[-height // 5:, -width // 4:-width // 10] = 15
+        frame[y1:y1 + height, x1:x1 + width] = np.clip(body, 0, 255).astype(np.uint8)
+        # Detector boxes include some road around the vehicle
+        boxes.append([max(x1 - 8, 0), max(y1 - 8, 0), min(x1 + width + 8, 1280), min(y1 + height + 8, 720)])
+        labels.append(label)
+    return frame, np.array(boxes), labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    classifier = ColorClassifier()
+    rng = np.random.default_rng(0)
+
+    print(f"{'vehicles':>8s} {'legacy ms':>10s} {'legacy acc':>11s} {'histogram ms':>13s} {'histogram acc':>14s}")
+    for count in args.vehicles:
+        scenes = [draw_frame(count, rng) for _ in range(20)]
+        legacy_s = histogram_s = 0.0
+        legacy_correct = histogram_correct = 0
+
+        for repeat in range(args.repeats):
+            frame, boxes, labels = scenes[repeat % len(scenes)]
+
+            start = time.perf_counter()
+            legacy = [legacy_detect_vehicle_color(frame[y1:y2, x1:x2]) for x1, y1, x2, y2 in boxes.tolist()]
+            legacy_s += time.perf_counter() - start
+
+            start = time.perf_counter()
+            histogram = classifier.classify(frame, boxes)
+            histogram_s += time.perf_counter() - start
+
+            legacy_correct += sum(a == b for a, b in zip(legacy, labels))
+            histogram_correct += sum(a == b for a, b in zip(histogram, labels))
+
+        total = count * args.repeats
+        print(f"{count:8d} {legacy_s * 1000 / args.repeats:10.3f} {legacy_correct / total:11.0%} "
+              f"{histogram_s * 1000 / args.repeats:13.3f} {histogram_correct / total:14.0%}")
+
+
+if __name__ == "__main__":
+    main()
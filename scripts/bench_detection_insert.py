@@ -0,0 +1,140 @@
+"""
+Benchmark detection persistence: per-object ORM adds vs DetectionWriter bulk inserts.
+
+Usage:
+    python scripts/bench_detection_insert.py [--rows 20000] [--chunk-size 1000] [--database-url URL]
+
+Defaults to a temporary SQLite database; pass a MySQL URL to measure the
+production driver. Tables are created and dropped by the script, so never
+point it at a live database.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("API_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.models.incident import Incident, IncidentType, ProcessingStatus  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.vehicle import DetectedVehicle, LicensePlate  # noqa: E402
+from app.services.detection_writer import DetectionWriter  # noqa: E402
+
+DETECTION = {
+    "vehicle_type": "car",
+    "confidence": 0.87,
+    "color": "white",
+    "bounding_box": {"x1": 100, "y1": 200, "x2": 300, "y2": 400},
+}
+PLATE = {
+    "plate_number": "ABC1234",
+    "confidence": 0.74,
+    "bounding_box": {"x1": 10, "y1": 20, "x2": 60, "y2": 40},
+}
+
+
+def create_incident(session_factory) -> str:
+    """
+    Create the user and incident the benchmark rows point at.
+
+    Args:
+        session_factory: Session factory bound to the benchmark engine
+
+    Returns:
+        Incident ID
+    """
+    db = session_factory()
+    user_id = str(uuid.uuid4())
+    incident_id = str(uuid.uuid4())
+    db.add(User(user_id=user_id, email=f"{user_id}@bench", username=user_id,
+                password_hash="x", created_at=datetime.utcnow(), is_active=True))
+    db.add(Incident(incident_id=incident_id, user_id=user_id, type=IncidentType.CRASH,
+                    latitude=0.0, longitude=0.0, timestamp=datetime.utcnow(),
+                    video_path="/dev/null", video_size=0,
+                    processing_status=ProcessingStatus.PROCESSING, created_at=datetime.utcnow()))
+    db.commit()
+    db.close()
+    return incident_id
+
+
+def bench_orm(session_factory, incident_id: str, rows: int) -> float:
+    """
+    Persist rows the way the task used to: one ORM object per detection, one commit.
+    """
+    db = session_factory()
+    start_time = time.perf_counter()
+    for i in range(rows):
+        vehicle = DetectedVehicle(detection_id=str(uuid.uuid4()), incident_id=incident_id,
+                                  frame_timestamp=float(i), **DETECTION)
+        db.add(vehicle)
+        if i % 4 == 0:
+            db.add(LicensePlate(plate_id=str(uuid.uuid4()), incident_id=incident_id,
+                                detection_id=vehicle.detection_id, frame_timestamp=float(i), **PLATE))
+    db.commit()
+    elapsed = time.perf_counter() - start_time
+    db.close()
+    return elapsed
+
+
+def bench_writer(session_factory, incident_id: str, rows: int, chunk_size: int) -> float:
+    """
+    Persist rows through DetectionWriter bulk inserts.
+    """
+    db = session_factory()
+    start_time = time.perf_counter()
+    writer = DetectionWriter(db, incident_id, chunk_size=chunk_size)
+    for i in range(rows):
+        detection_id = writer.add_vehicle(DETECTION, float(i))
+        if i % 4 == 0:
+            writer.add_plate(PLATE, float(i), detection_id=detection_id)
+    writer.flush()
+    db.commit()
+    elapsed = time.perf_counter() - start_time
+    db.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    temp_dir = None
+    database_url = args.database_url
+    if database_url is None:
+        temp_dir = tempfile.mkdtemp()
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+
+    engine = create_engine(database_url)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    try:
+        total_rows = args.rows + (args.rows + 3) // 4
+        orm_s = bench_orm(session_factory, create_incident(session_factory), args.rows)
+        writer_s = bench_writer(session_factory, create_incident(session_factory), args.rows, args.chunk_size)
+
+        print(f"ORM add:          {total_rows / orm_s:10.0f} rows/s ({orm_s:.2f}s)")
+        print(f"DetectionWriter:  {total_rows / writer_s:10.0f} rows/s ({writer_s:.2f}s, "
+              f"chunk {args.chunk_size}, {orm_s / writer_s:.1f}x)")
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+        if temp_dir:
+            os.remove(os.path.join(temp_dir, "bench.db"))
+            os.rmdir(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
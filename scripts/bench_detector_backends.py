@@ -0,0 +1,118 @@
+"""
+Benchmark detector backends: load time, latency, throughput and memory.
+
+Usage:
+    python scripts/bench_detector_backends.py [video_path] [--model yolov8n] [--frames 32] [--threads 0]
+
+Runs every installed backend (ultralytics on <model>.pt, onnxruntime and
+openvino on <model>.onnx, exported with
+`yolo export model=yolov8n.pt format=onnx dynamic=True`) in its own process
+on the same frames, so resident memory is measured per backend. Without a
+video path random 720p frames are used.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BACKEND_SUFFIXES = {"ultralytics": ".pt", "onnxruntime": ".onnx", "openvino": ".onnx"}
+
+
+def current_rss_mb() -> float:
+    """
+    Get the current resident set size of this process in megabytes.
+
+    Returns:
+        RSS in MB from /proc/self/statm
+    """
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def run_backend(backend: str, args) -> dict:
+    """
+    Measure one backend in this process.
+
+    Args:
+        backend: Detector backend name
+        args: Parsed command line arguments
+
+    Returns:
+        Dictionary of measurements, or an error
+    """
+    from bench_detector_batch import load_frames
+    from app.services.ml_detector import MLDetector
+
+    frames = load_frames(args.video_path, args.frames)
+    rss_before = current_rss_mb()
+
+    start_time = time.perf_counter()
+    detector = MLDetector(args.model + BACKEND_SUFFIXES[backend], backend=backend, threads=args.threads)
+    load_s = time.perf_counter() - start_time
+    if detector.model is None:
+        return {"error": "not available"}
+
+    # Warm up so lazy initialisation is not timed
+    detector.detect_vehicles_batch(frames[:2], batch_size=2)
+
+    latencies = []
+    for frame in frames:
+        start_time = time.perf_counter()
+        detector.detect_vehicles(frame)
+        latencies.append(time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    results = detector.detect_vehicles_batch(frames, batch_size=8)
+    batch_s = time.perf_counter() - start_time
+
+    return {
+        "load_s": load_s,
+        "p50_ms": float(np.percentile(latencies, 50)) * 1000,
+        "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+        "batch8_fps": len(frames) / batch_s,
+        "detections": sum(len(r) for r in results),
+        "rss_model_mb": current_rss_mb() - rss_before,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--model", default="yolov8n", help="model path without suffix")
+    parser.add_argument("--frames", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--backend", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(run_backend(args.backend, args)))
+        return
+
+    print(f"{'backend':12s} {'load s':>7s} {'p50 ms':>8s} {'p95 ms':>8s} {'batch8 fps':>11s} "
+          f"{'dets':>6s} {'model MB':>9s} {'peak MB':>8s}")
+    for backend in BACKEND_SUFFIXES:
+        command = [sys.executable, os.path.abspath(__file__), "--backend", backend,
+                   "--model", args.model, "--frames", str(args.frames), "--threads", str(args.threads)]
+        if args.video_path:
+            command.insert(2, args.video_path)
+        output = subprocess.run(command, capture_output=True, text=True).stdout.strip().splitlines()
+        result = json.loads(output[-1]) if output else {"error": "crashed"}
+
+        if "error" in result:
+            print(f"{backend:12s} {result['error']}")
+            continue
+        print(f"{backend:12s} {result['load_s']:7.2f} {result['p50_ms']:8.1f} {result['p95_ms']:8.1f} "
+              f"{result['batch8_fps']:11.2f} {result['detections']:6d} {result['rss_model_mb']:9.0f} "
+              f"{result['peak_rss_mb']:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark per-frame vs batched YOLO vehicle detection throughput.
+
+Usage:
+    python scripts/bench_detector_batch.py [video_path] [--model yolov8n.pt] [--frames 64]
+
+Requires ultralytics. Without a video path random 720p frames are used,
+which measures inference and post-processing cost but detects nothing.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ml_detector import MLDetector  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+
+def load_frames(video_path: str, count: int) -> list:
+    """
+    Load benchmark frames from a video, or generate random ones.
+
+    Args:
+        video_path: Optional path to a video file
+        count: Number of frames
+
+    Returns:
+        List of BGR frames
+    """
+    if video_path is None:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8) for _ in range(count)]
+
+    frames = []
+    for _, _, frame in VideoProcessor().iter_frames(video_path, fps=1):
+        frames.append(frame)
+        if len(frames) == count:
+            break
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--model", default="yolov8n.pt")
+    parser.add_argument("--frames", type=int, default=64)
+    args = parser.parse_args()
+
+    detector = MLDetector(args.model)
+    if detector.model is None:
+        sys.exit("YOLO model could not be loaded (is ultralytics installed?)")
+
+    frames = load_frames(args.video_path, args.frames)
+
+    # Warm up so lazy initialisation is not timed
+    detector.detect_vehicles_batch(frames[:2], batch_size=2)
+
+    start_time = time.perf_counter()
+    per_frame_count = sum(len(detector.detect_vehicles(frame)) for frame in frames)
+    per_frame_s = time.perf_counter() - start_time
+    print(f"per-frame:  {len(frames) / per_frame_s:6.2f} frames/s  ({per_frame_count} detections)")
+
+    for batch_size in (4, 8, 16):
+        start_time = time.perf_counter()
+        results = detector.detect_vehicles_batch(frames, batch_size=batch_size)
+        elapsed = time.perf_counter() - start_time
+        print(f"batch {batch_size:3d}: {len(frames) / elapsed:6.2f} frames/s  "
+              f"({sum(len(r) for r in results)} detections, {per_frame_s / elapsed:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
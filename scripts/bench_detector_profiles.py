@@ -0,0 +1,120 @@
+"""
+Benchmark detector profiles: latency and throughput vs. vehicle recall.
+
+Usage:
+    python scripts/bench_detector_profiles.py clips_dir [--backend onnxruntime --model yolov8n.onnx] [--frames 30]
+
+Runs every detector profile over the same sampled frames of a fixed set of
+local clips (every video file in clips_dir). Without ground truth labels the
+accurate profile is the reference: recall is the share of its vehicles that
+a profile also finds (same type, IoU >= 0.5), precision the share of a
+profile's vehicles the reference also found.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.detector_profiles import PROFILES, quantized_model_path  # noqa: E402
+from app.services.ml_detector import MLDetector  # noqa: E402
+from app.services.tracker import greedy_match, iou_matrix  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi", ".mkv")
+
+
+def load_clip_frames(clips_dir: str, frames_per_clip: int) -> list:
+    """
+    Sample frames from every clip in a directory.
+
+    Args:
+        clips_dir: Directory of video files
+        frames_per_clip: Maximum sampled frames per clip
+
+    Returns:
+        List of BGR frames
+    """
+    frames = []
+    for name in sorted(os.listdir(clips_dir)):
+        if not name.lower().endswith(VIDEO_EXTENSIONS):
+            continue
+        for frame_number, (_, _, frame) in enumerate(VideoProcessor().iter_frames(os.path.join(clips_dir, name), fps=1)):
+            if frame_number == frames_per_clip:
+                break
+            frames.append(frame)
+    return frames
+
+
+def match_count(reference: list, detections: list) -> int:
+    """
+    Count detections matching a reference detection of the same type.
+
+    Args:
+        reference: Reference detections of one frame
+        detections: Detections of the same frame
+
+    Returns:
+        Number of one-to-one matches with IoU >= 0.5
+    """
+    def boxes(group, vehicle_type):
+        return np.array([
+            [d["bounding_box"][key] for key in ("x1", "y1", "x2", "y2")]
+            for d in group if d["vehicle_type"] == vehicle_type
+        ]).reshape(-1, 4)
+
+    return sum(
+        len(greedy_match(iou_matrix(boxes(reference, vehicle_type), boxes(detections, vehicle_type)), 0.5))
+        for vehicle_type in {d["vehicle_type"] for d in reference}
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("clips_dir")
+    parser.add_argument("--backend", default="ultralytics")
+    parser.add_argument("--model", default="yolov8n.pt")
+    parser.add_argument("--frames", type=int, default=30, help="sampled frames per clip")
+    parser.add_argument("--threads", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = load_clip_frames(args.clips_dir, args.frames)
+    if not frames:
+        sys.exit(f"No video clips in {args.clips_dir}")
+    print(f"{len(frames)} frames from {args.clips_dir}, backend {args.backend}")
+
+    reference = None
+    print(f"{'profile':10s} {'size':>5s} {'prec':>5s} {'p50 ms':>8s} {'fps':>7s} {'vehicles':>9s} "
+          f"{'recall':>7s} {'precision':>10s}")
+    for profile in sorted(PROFILES.values(), key=lambda p: -p.input_size):
+        model_path = quantized_model_path(args.model) if profile.precision == "int8" else args.model
+        detector = MLDetector(model_path, backend=args.backend, threads=args.threads, input_size=profile.input_size)
+        if detector.model is None:
+            sys.exit(f"Detector backend {args.backend} could not load {model_path}")
+
+        # Warm up so lazy initialisation is not timed
+        detector.detect_vehicles(frames[0])
+
+        latencies = []
+        results = []
+        for frame in frames:
+            start_time = time.perf_counter()
+            results.append(detector.detect_vehicles(frame))
+            latencies.append(time.perf_counter() - start_time)
+
+        if reference is None:
+            reference = results
+        found = sum(len(r) for r in results)
+        expected = sum(len(r) for r in reference)
+        matched = sum(match_count(ref, res) for ref, res in zip(reference, results))
+
+        print(f"{profile.name:10s} {profile.input_size:5d} {profile.precision:>5s} "
+              f"{np.percentile(latencies, 50) * 1000:8.1f} {len(frames) / sum(latencies):7.2f} {found:9d} "
+              f"{matched / expected if expected else 1.0:7.0%} {matched / found if found else 1.0:10.0%}")
+
+
+if __name__ == "__main__":
+    main()
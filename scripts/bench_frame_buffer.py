@@ -0,0 +1,130 @@
+"""
+Benchmark per-frame allocations of decoding and detector input preparation.
+
+Usage:
+    python scripts/bench_frame_buffer.py [video_path] [--fps 5] [--size 640] [--in-flight 56]
+
+Compares decoding each sampled frame into a new array and letterboxing it
+into another (what the detector did per frame) with decoding into pooled
+FrameBuffers. Up to --in-flight frames are held at once, as the pipeline
+queues do (default (2 * PIPELINE_QUEUE_SIZE + 3) * DETECTOR_BATCH_SIZE).
+Reports new buffers per frame, bytes allocated per frame (tracemalloc
+peak while decoding and letterboxing one frame) and CPU time per frame.
+Without a video path a synthetic 60 s 1280x720 clip is generated.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.frame_buffer import FramePool, letterbox  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+
+def write_video(path: str, seconds: int = 60, fps: int = 30, size=(1280, 720)) -> str:
+    """
+    Write a noisy synthetic clip.
+
+    Args:
+        path: Output path
+        seconds: Clip length in seconds
+        fps: Clip frame rate
+        size: Frame (width, height)
+
+    Returns:
+        Path to the written clip
+    """
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+    for i in range(seconds * fps):
+        writer.write(np.roll(background, i * 4, axis=1))
+    writer.release()
+    return path
+
+
+def run(video_path: str, fps: int, size: int, in_flight: int, pooled: bool) -> dict:
+    """
+    Decode and letterbox every sampled frame, holding in_flight frames at once.
+
+    Returns:
+        Dictionary with frames, buffers (new frame arrays), bytes_per_frame
+        and cpu_ms_per_frame
+    """
+    pool = FramePool(detector_size=size) if pooled else None
+    frames = VideoProcessor().iter_frames(video_path, fps=fps, buffers=pool)
+    held = deque()
+    allocated = []
+    count = 0
+
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    while True:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        item = next(frames, None)
+        if item is None:
+            break
+        frame = item[2]
+        if pooled:
+            detector_input = frame.letterboxed[0]
+        else:
+            detector_input = letterbox(frame, size)[0]
+        allocated.append(tracemalloc.get_traced_memory()[1] - before)
+        count += 1
+
+        held.append((frame, detector_input))
+        if len(held) > in_flight:
+            done = held.popleft()
+            if pooled:
+                pool.release([done[0]])
+    cpu_s = time.process_time() - cpu_start
+    tracemalloc.stop()
+
+    return {
+        "frames": count,
+        "buffers": pool.allocations if pooled else count,
+        "bytes_per_frame": sum(allocated) / max(count, 1),
+        "cpu_ms_per_frame": cpu_s * 1000 / max(count, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--fps", type=int, default=5)
+    parser.add_argument("--size", type=int, default=640)
+    parser.add_argument("--in-flight", type=int, default=(2 * 2 + 3) * 8)
+    args = parser.parse_args()
+
+    cv2.setNumThreads(1)
+
+    temp_dir = None
+    video_path = args.video_path
+    if video_path is None:
+        temp_dir = tempfile.mkdtemp()
+        video_path = write_video(os.path.join(temp_dir, "clip.mp4"))
+
+    print(f"{'decode':10s} {'frames':>7s} {'buffers':>8s} {'per frame':>10s} {'KiB/frame':>10s} {'cpu ms/frame':>13s}")
+    for label, pooled in (("allocate", False), ("pooled", True)):
+        result = run(video_path, args.fps, args.size, args.in_flight, pooled)
+        print(f"{label:10s} {result['frames']:7d} {result['buffers']:8d} "
+              f"{result['buffers'] / max(result['frames'], 1):10.2f} "
+              f"{result['bytes_per_frame'] / 1024:10.1f} {result['cpu_ms_per_frame']:13.2f}")
+
+    if temp_dir:
+        os.remove(video_path)
+        os.rmdir(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark decode CPU time per frame sampling mode.
+
+Usage:
+    python scripts/bench_frame_sampling.py [video_path] [--fps 1]
+
+Without a video path a synthetic 720p clip is generated in a temp directory.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+
+def write_synthetic_video(path: str, seconds: int = 30, fps: int = 30, size=(1280, 720)) -> str:
+    """
+    Write a synthetic clip with moving content so the encoder cannot collapse frames.
+
+    Args:
+        path: Output path
+        seconds: Clip length in seconds
+        fps: Clip frame rate
+        size: Frame (width, height)
+
+    Returns:
+        Path to the written clip
+    """
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+    for i in range(seconds * fps):
+        frame = np.roll(background, i * 8, axis=1)
+        cv2.rectangle(frame, (i % width, 100), (i % width + 200, 300), (0, 0, 255), -1)
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+
+def bench_mode(video_path: str, mode: str, fps: int) -> dict:
+    """
+    Consume every sampled frame in one mode and measure CPU and wall time.
+
+    Args:
+        video_path: Path to video file
+        mode: Sampling mode
+        fps: Sampling rate
+
+    Returns:
+        Dictionary with frame count, CPU seconds and wall seconds
+    """
+    processor = VideoProcessor()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    frame_count = sum(1 for _ in processor.iter_frames(video_path, fps=fps, mode=mode))
+
+    return {
+        "frames": frame_count,
+        "cpu_s": time.process_time() - cpu_start,
+        "wall_s": time.perf_counter() - wall_start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--fps", type=int, default=1)
+    args = parser.parse_args()
+
+    # Keep OpenCV single threaded so CPU time reflects work done, not parallelism
+    cv2.setNumThreads(1)
+
+    temp_dir = None
+    video_path = args.video_path
+    if video_path is None:
+        temp_dir = tempfile.mkdtemp()
+        video_path = write_synthetic_video(os.path.join(temp_dir, "synthetic.mp4"))
+
+    info = VideoProcessor().get_video_info(video_path)
+    print(f"{video_path}: {info['frame_count']} frames @ {info['fps']:.1f} fps, "
+          f"{info['width']}x{info['height']}, sampling {args.fps} fps")
+
+    baseline = None
+    for mode in ("read", "grab", "seek"):
+        result = bench_mode(video_path, mode, args.fps)
+        baseline = baseline or result["cpu_s"]
+        print(f"{mode:>5}: {result['frames']:5d} frames  cpu {result['cpu_s']:7.2f}s  "
+              f"wall {result['wall_s']:7.2f}s  cpu vs read {result['cpu_s'] / baseline:5.2f}x")
+
+    if temp_dir:
+        os.remove(video_path)
+        os.rmdir(temp_dir)
+
+
+if __name__ == "__main__":
+    main()
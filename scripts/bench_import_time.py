@@ -0,0 +1,86 @@
+"""
+Measure API import time with `python -X importtime` and check for ML imports.
+
+Usage:
+    python scripts/bench_import_time.py [--module app.main] [--top 15] [--max-ms 0]
+
+Imports the module in a fresh interpreter, prints the total and the slowest
+top-level imports, and exits non-zero if a worker-only module (torch, cv2,
+ultralytics, easyocr) was imported or the total exceeds --max-ms.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_ONLY_MODULES = ("torch", "cv2", "ultralytics", "onnxruntime", "openvino", "easyocr")
+
+
+def import_times(module: str) -> list:
+    """
+    Import a module with -X importtime in a subprocess.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        List of (cumulative_us, depth, name) tuples in import order
+    """
+    env = dict(os.environ)
+    env.setdefault("API_SECRET_KEY", "benchmark")
+    env.setdefault("DATABASE_URL", "sqlite://")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        entries.append((int(cumulative), (len(name) - len(name.lstrip())) // 2, name.strip()))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=0, help="fail above this total (0 disables)")
+    args = parser.parse_args()
+
+    entries = import_times(args.module)
+    top_level = [entry for entry in entries if entry[1] == 0]
+    total_ms = sum(cumulative for cumulative, _, _ in top_level) / 1000
+
+    # Attribute time to top-level packages (their first, outermost import)
+    packages = {}
+    for cumulative, _, name in entries:
+        package = name.split(".")[0]
+        packages[package] = max(packages.get(package, 0), cumulative)
+
+    print(f"import {args.module}: {total_ms:.1f} ms total, {len(entries)} modules")
+    for package, cumulative in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {package}")
+
+    loaded = sorted({name.split(".")[0] for _, _, name in entries} & set(WORKER_ONLY_MODULES))
+    failures = []
+    if loaded:
+        failures.append(f"worker-only modules imported (or attempted): {', '.join(loaded)}")
+    if args.max_ms and total_ms > args.max_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds {args.max_ms:.1f} ms")
+
+    if failures:
+        sys.exit("FAIL: " + "; ".join(failures))
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark bcrypt login throughput: inline verification vs the hashing process pool.
+
+Usage:
+    python scripts/bench_login.py [--logins 64] [--workers 2] [--concurrency 32]
+
+Both modes verify from --concurrency threads, like the sync login endpoint
+running in FastAPI's thread pool. "inline" calls verify_password in the
+API process itself; "pool" calls verify_password_pooled, which waits on
+PASSWORD_HASH_WORKERS processes.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("API_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.core import security  # noqa: E402
+from app.core.config import settings  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+def run_threads(verify, password_hash: str, logins: int, concurrency: int) -> float:
+    """Verify passwords from a pool of request threads and return the elapsed time."""
+    def login(_):
+        assert verify(PASSWORD, password_hash)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as threads:
+        start_time = time.perf_counter()
+        list(threads.map(login, range(logins)))
+        return time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    settings.PASSWORD_HASH_WORKERS = args.workers
+    password_hash = security.hash_password(PASSWORD)
+
+    inline_s = run_threads(security.verify_password, password_hash, args.logins, args.concurrency)
+
+    # Start the pool processes outside the timed region
+    run_threads(security.verify_password_pooled, password_hash, args.workers, args.workers)
+    pool_s = run_threads(security.verify_password_pooled, password_hash, args.logins, args.concurrency)
+    security.shutdown_hash_executor()
+
+    print(f"inline:           {args.logins / inline_s:6.2f} logins/s (hashing in the API process)")
+    print(f"pool ({args.workers} workers): {args.logins / pool_s:6.2f} logins/s "
+          f"({args.logins / pool_s / args.workers:.2f} per core, hashing in pool processes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark per-crop vs batched EasyOCR plate reading throughput.
+
+Usage:
+    python scripts/bench_ocr_batch.py [video_path] [--frames 16]
+
+Requires easyocr, and ultralytics when a video is given. With a video the
+crops are the vehicles YOLO detects in the first sampled frames; without one
+random vehicle-sized crops are used, which measures detection and
+recognition cost but reads nothing.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ml_detector import MLDetector  # noqa: E402
+from app.services.ocr_service import OCRService  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+
+
+def load_crops(video_path: str, frame_count: int) -> list:
+    """
+    Crop detected vehicles from a video, or generate random crops.
+
+    Args:
+        video_path: Optional path to a video file
+        frame_count: Number of sampled frames to crop vehicles from
+
+    Returns:
+        List of BGR crops
+    """
+    if video_path is None:
+        rng = np.random.default_rng(0)
+        return [
+            rng.integers(0, 255, (int(rng.integers(80, 300)), int(rng.integers(120, 400)), 3), dtype=np.uint8)
+            for _ in range(frame_count * 4)
+        ]
+
+    detector = MLDetector()
+    if detector.model is None:
+        sys.exit("YOLO model could not be loaded (is ultralytics installed?)")
+
+    crops = []
+    for frame_number, (_, _, frame) in enumerate(VideoProcessor().iter_frames(video_path, fps=1)):
+        if frame_number == frame_count:
+            break
+        for detection in detector.detect_vehicles(frame):
+            bbox = detection["bounding_box"]
+            crops.append(frame[bbox["y1"]:bbox["y2"], bbox["x1"]:bbox["x2"]])
+    return crops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path", nargs="?")
+    parser.add_argument("--frames", type=int, default=16)
+    args = parser.parse_args()
+
+    ocr_service = OCRService()
+    if ocr_service.reader is None:
+        sys.exit("EasyOCR could not be loaded (is easyocr installed?)")
+
+    crops = load_crops(args.video_path, args.frames)
+    if not crops:
+        sys.exit("No vehicles detected")
+
+    # Warm up so lazy initialisation is not timed
+    ocr_service.read_plate_texts(crops[:2], batch_size=2)
+
+    start_time = time.perf_counter()
+    per_crop = [ocr_service.read_plate_text(crop) for crop in crops]
+    per_crop_s = time.perf_counter() - start_time
+    print(f"per-crop:  {len(crops) / per_crop_s:6.2f} crops/s  ({sum(p is not None for p in per_crop)} plates)")
+
+    for batch_size in (4, 8, 16):
+        start_time = time.perf_counter()
+        results = ocr_service.read_plate_texts(crops, batch_size=batch_size)
+        elapsed = time.perf_counter() - start_time
+        agree = sum(
+            (a and a["plate_number"]) == (b and b["plate_number"]) for a, b in zip(per_crop, results)
+        )
+        print(f"batch {batch_size:3d}: {len(crops) / elapsed:6.2f} crops/s  "
+              f"({sum(r is not None for r in results)} plates, {agree}/{len(crops)} match per-crop, "
+              f"{per_crop_s / elapsed:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
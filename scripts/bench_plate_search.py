@@ -0,0 +1,110 @@
+"""
+Benchmark license plate search strategies: OCR cost vs. plate recall.
+
+Usage:
+    python scripts/bench_plate_search.py video_path [--frames 120]
+
+Requires ultralytics and easyocr. Runs the processing pipeline on the first
+sampled frames of a dashcam video once per strategy and reports wall time,
+time spent in EasyOCR, OCR calls, and recall of distinct plate numbers
+relative to the most expensive configuration (full frame at native
+resolution on every frame).
+"""
+import argparse
+import os
+import sys
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("API_SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.core.config import settings  # noqa: E402
+from app.services import model_registry  # noqa: E402
+from app.services.video_processor import VideoProcessor  # noqa: E402
+from app.tasks.celery_tasks import _run_pipeline  # noqa: E402
+
+# (label, strategy, full frame interval, full frame max width)
+CONFIGURATIONS = [
+    ("full_frame native every frame", "full_frame", 1, 0),
+    ("full_frame 960px every frame", "full_frame", 1, 960),
+    ("full_frame 960px every 5th", "full_frame", 5, 960),
+    ("vehicle crop only", "vehicle", 1, 0),
+    ("vehicle lower ROI only", "vehicle_roi", 1, 0),
+]
+
+
+class TimedOCR:
+    """OCR service proxy counting calls and time spent in EasyOCR."""
+
+    def __init__(self, ocr_service):
+        self.ocr_service = ocr_service
+        self.calls = 0
+        self.seconds = 0.0
+
+    def _timed(self, method, *args):
+        start_time = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.calls += 1
+            self.seconds += time.perf_counter() - start_time
+
+    def detect_license_plate(self, frame):
+        return self._timed(self.ocr_service.detect_license_plate, frame)
+
+    def read_plate_texts(self, plate_images, batch_size=8):
+        return self._timed(self.ocr_service.read_plate_texts, plate_images, batch_size)
+
+
+class CollectingWriter:
+    """Detection writer stand-in that keeps plate numbers in memory."""
+
+    def __init__(self):
+        self.plate_numbers = set()
+
+    def add_vehicle(self, detection, frame_timestamp):
+        return None
+
+    def add_plate(self, plate_result, frame_timestamp, detection_id=None):
+        self.plate_numbers.add(plate_result["plate_number"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("video_path")
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    ml_detector = model_registry.get_ml_detector()
+    ocr_service = model_registry.get_ocr_service()
+    if ml_detector.model is None or ocr_service.reader is None:
+        sys.exit("YOLO or EasyOCR could not be loaded (are ultralytics and easyocr installed?)")
+
+    frames = list(islice(VideoProcessor().iter_frames(args.video_path, fps=1), args.frames))
+
+    reference = None
+    print(f"{len(frames)} sampled frames")
+    print(f"{'configuration':32s} {'wall s':>8s} {'ocr s':>8s} {'ocr calls':>10s} {'plates':>7s} {'recall':>7s}")
+    for label, strategy, interval, max_width in CONFIGURATIONS:
+        settings.PLATE_SEARCH_STRATEGY = strategy
+        settings.PLATE_SEARCH_FULL_FRAME_INTERVAL = interval
+        settings.PLATE_SEARCH_FULL_FRAME_MAX_WIDTH = max_width
+
+        timed_ocr = TimedOCR(ocr_service)
+        writer = CollectingWriter()
+        start_time = time.perf_counter()
+        _run_pipeline(iter(frames), writer, ml_detector, timed_ocr)
+        wall_s = time.perf_counter() - start_time
+
+        if reference is None:
+            reference = writer.plate_numbers
+        recall = len(writer.plate_numbers & reference) / len(reference) if reference else 1.0
+
+        print(f"{label:32s} {wall_s:8.2f} {timed_ocr.seconds:8.2f} {timed_ocr.calls:10d} "
+              f"{len(writer.plate_numbers):7d} {recall:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Tests for content-gated frame sampling.
+"""
+import numpy as np
+
+from app.services.adaptive_sampler import AdaptiveSampler
+
+
+def frame(value, size=(72, 128)):
+    """Helper to build a uniform BGR frame."""
+    return np.full((*size, 3), value, dtype=np.uint8)
+
+
+def test_static_footage_is_kept_at_the_minimum_rate():
+    """Test that identical frames are only kept once per minimum interval."""
+    sampler = AdaptiveSampler(min_fps=0.5)
+    
+    kept = [timestamp for timestamp in np.arange(0, 5, 0.25) if sampler.should_keep(frame(100), timestamp)]
+    
+    assert kept == [0.0, 2.0, 4.0]
+    assert (sampler.kept, sampler.skipped) == (3, 17)
+
+
+def test_motion_keeps_frames():
+    """Test that a moving object keeps frames at the candidate rate."""
+    sampler = AdaptiveSampler(min_fps=0.1, motion_threshold=6.0, scene_threshold=1.0)
+    background = frame(50)
+    
+    kept = []
+    for step in range(6):
+        moving = background.copy()
+        moving[20:50, step * 20:step * 20 + 30] = 250
+        kept.append(sampler.should_keep(moving, step * 0.2))
+    
+    assert all(kept)
+
+
+def test_scene_change_keeps_frames():
+    """Test that a histogram change keeps a frame even without much mean difference."""
+    sampler = AdaptiveSampler(min_fps=0.1, motion_threshold=255.0, scene_threshold=0.2)
+    
+    assert sampler.should_keep(frame(100), 0.0)
+    assert not sampler.should_keep(frame(101), 0.2)
+    assert sampler.should_keep(frame(140), 0.4)
@@ -0,0 +1,262 @@
+"""
+Tests for the video processing tasks.
+"""
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+import numpy as np  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.celery_app import celery_app  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base  # noqa: E402
+from app.models.incident import Incident, IncidentType, ProcessingStatus  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.vehicle import DetectedVehicle, LicensePlate  # noqa: E402
+from app.tasks import celery_tasks  # noqa: E402
+
+# Setup test database
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db(monkeypatch):
+    """Run tasks eagerly against a test database holding one incident with a 3.5s video."""
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(celery_tasks, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setitem(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(settings, "VIDEO_SEGMENT_SECONDS", 1.0)
+    
+    temp_dir = tempfile.mkdtemp()
+    video_path = os.path.join(temp_dir, "raw.mp4")
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 10, (64, 48))
+    for i in range(35):
+        writer.write(np.full((48, 64, 3), i * 5, dtype=np.uint8))
+    writer.release()
+    
+    session = TestingSessionLocal()
+    session.add(User(
+        user_id="user-1",
+        email="test@example.com",
+        username="testuser",
+        password_hash="x",
+        created_at=datetime.utcnow(),
+        is_active=True
+    ))
+    session.add(Incident(
+        incident_id="incident-1",
+        user_id="user-1",
+        type=IncidentType.CRASH,
+        latitude=37.7749,
+        longitude=-122.4194,
+        timestamp=datetime.utcnow(),
+        video_path=video_path,
+        video_size=os.path.getsize(video_path),
+        processing_status=ProcessingStatus.PENDING,
+        created_at=datetime.utcnow()
+    ))
+    session.commit()
+    
+    yield session
+    
+    session.close()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_process_incident_video_fans_out_segments(db):
+    """Test that segment results are reduced and the incident completed."""
+    celery_tasks.process_incident_video("incident-1")
+    
+    db.expire_all()
+    incident = db.query(Incident).one()
+    assert incident.processing_status == ProcessingStatus.COMPLETED
+    assert os.path.exists(os.path.join(os.path.dirname(incident.video_path), "thumbnail.jpg"))
+
+
+def test_process_incident_video_uses_incident_type_profile(db, monkeypatch):
+    """Test that every segment loads the detector profile chosen for the incident type."""
+    monkeypatch.setattr(settings, "DETECTOR_PROFILE_BY_INCIDENT_TYPE", "crash:balanced")
+    requested = []
+    monkeypatch.setattr(
+        celery_tasks.model_registry,
+        "get_ml_detector",
+        lambda profile=None: requested.append(profile) or FakeDetector()
+    )
+    monkeypatch.setattr(celery_tasks.model_registry, "get_ocr_service", lambda: FakeOCR())
+    
+    celery_tasks.process_incident_video("incident-1")
+    
+    assert requested and set(requested) == {"balanced"}
+
+
+def test_process_incident_video_event_window_first(db, monkeypatch):
+    """Test that the event window is processed densely and marked partial before the backfill."""
+    monkeypatch.setattr(settings, "EVENT_FIRST_PROCESSING", True)
+    monkeypatch.setattr(settings, "EVENT_WINDOW_SECONDS", 0.5)
+    monkeypatch.setattr(settings, "EVENT_WINDOW_FPS", 5)
+    statuses = []
+    set_status = celery_tasks._set_processing_status
+    monkeypatch.setattr(
+        celery_tasks,
+        "_set_processing_status",
+        lambda incident_id, status: statuses.append(status) or set_status(incident_id, status)
+    )
+    frame_counts = []
+    finalize = celery_tasks.finalize_incident_processing.run
+    monkeypatch.setattr(
+        celery_tasks.finalize_incident_processing,
+        "run",
+        lambda results, *args, **kwargs: frame_counts.extend(
+            result["frames"] for result in (kwargs.get("earlier_results") or []) + results
+        ) or finalize(results, *args, **kwargs)
+    )
+    
+    celery_tasks.process_incident_video("incident-1")
+    
+    assert statuses == [ProcessingStatus.PARTIAL]
+    # Window [1.2, 2.2] s of the 3.5 s video rounds out to frames 10-29 at 5 fps; the rest at 1 fps
+    assert frame_counts == [5, 5, 1, 1]
+    db.expire_all()
+    assert db.query(Incident).one().processing_status == ProcessingStatus.COMPLETED
+
+
+def test_process_video_segment_replaces_previous_attempt(db):
+    """Test that a retried segment drops the rows of an earlier attempt in its range only."""
+    for detection_id, frame_timestamp in (("inside", 1.0), ("outside", 2.0)):
+        db.add(DetectedVehicle(
+            detection_id=detection_id,
+            incident_id="incident-1",
+            vehicle_type="car",
+            confidence=0.9,
+            bounding_box={"x1": 0, "y1": 0, "x2": 10, "y2": 10},
+            frame_timestamp=frame_timestamp
+        ))
+    db.commit()
+    
+    result = celery_tasks.process_video_segment("incident-1", 10, 20, 0.5, 1.5)
+    
+    assert result["frames"] == 1
+    db.expire_all()
+    assert [vehicle.detection_id for vehicle in db.query(DetectedVehicle).all()] == ["outside"]
+
+
+class FakeDetector:
+    """Detector returning one vehicle per frame."""
+    
+    letterbox_size = 32
+    
+    def __init__(self, fail=False, confidence=0.9):
+        self.fail = fail
+        self.confidence = confidence
+    
+    def detect_vehicles_batch(self, frames, batch_size=8, letterboxed=None):
+        if letterboxed is not None:
+            assert all(image.shape == (32, 32, 3) for image, _, _, _ in letterboxed)
+        if self.fail:
+            raise RuntimeError("stage failure")
+        return [[{
+            "vehicle_type": "car",
+            "confidence": self.confidence,
+            "color": "white",
+            "bounding_box": {"x1": 0, "y1": 0, "x2": 32, "y2": 24}
+        }] for _ in frames]
+
+
+class FakeOCR:
+    """OCR service reading a fixed plate on vehicles and nothing on full frames."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def read_plate_texts(self, images, batch_size=8):
+        self.batches.append(len(images))
+        return [
+            {"plate_number": "ABC123", "confidence": 0.8, "bounding_box": {"x1": 0, "y1": 0, "x2": 5, "y2": 5}}
+            for _ in images
+        ]
+    
+    def detect_license_plate(self, frame):
+        return []
+
+
+def test_run_pipeline_writes_one_row_per_track(db, monkeypatch):
+    """Test that the staged pipeline tracks a vehicle through every frame under backpressure."""
+    monkeypatch.setattr(settings, "PIPELINE_QUEUE_SIZE", 1)
+    monkeypatch.setattr(settings, "DETECTOR_BATCH_SIZE", 2)
+    frames = [(i, float(i), np.zeros((48, 64, 3), dtype=np.uint8)) for i in range(7)]
+    writer = celery_tasks.DetectionWriter(db, "incident-1")
+    
+    ocr = FakeOCR()
+    
+    summary = celery_tasks._run_pipeline(iter(frames), writer, FakeDetector(), ocr)
+    writer.flush()
+    db.commit()
+    
+    assert summary["frames"] == 7
+    assert summary["tracks"] == 1
+    # Two agreeing readings reach consensus, so OCR stops after two calls
+    assert summary["ocr_calls"] == 2
+    # Both readings came from the first frame batch and were read in one call
+    assert ocr.batches == [2]
+    assert writer.plates_written == 1
+    plate = db.query(LicensePlate).one()
+    assert (plate.plate_number, plate.support_count) == ("ABC123", 2)
+    
+    vehicle = db.query(DetectedVehicle).one()
+    assert (vehicle.first_timestamp, vehicle.last_timestamp, vehicle.frame_count) == (0.0, 6.0, 7)
+    
+    stats = summary["stages"]
+    assert set(stats) == {"decode", "detect", "ocr", "write"}
+    assert stats["detect"]["items"] == 4
+    assert all(0.0 <= stage["utilization"] <= 1.0 for stage in stats.values())
+
+
+def test_run_pipeline_writes_low_confidence_vehicle(db):
+    """Test that a vehicle detected only below the tracker's high confidence is still written."""
+    frames = [(0, 0.0, np.zeros((48, 64, 3), dtype=np.uint8))]
+    writer = celery_tasks.DetectionWriter(db, "incident-1")
+    
+    summary = celery_tasks._run_pipeline(iter(frames), writer, FakeDetector(confidence=0.55), FakeOCR())
+    writer.flush()
+    db.commit()
+    
+    assert summary["tracks"] == 1
+    vehicle = db.query(DetectedVehicle).one()
+    assert vehicle.confidence == pytest.approx(0.55)
+    assert vehicle.frame_count == 1
+
+
+def test_run_pipeline_propagates_stage_errors(db):
+    """Test that an error in a worker stage aborts the pipeline and is re-raised."""
+    frames = [(i, float(i), np.zeros((48, 64, 3), dtype=np.uint8)) for i in range(20)]
+    writer = celery_tasks.DetectionWriter(db, "incident-1")
+    
+    with pytest.raises(RuntimeError):
+        celery_tasks._run_pipeline(iter(frames), writer, FakeDetector(fail=True), FakeOCR())
+
+
+def test_run_pipeline_closes_frame_source_on_error(db):
+    """Test that an aborted pipeline closes the frame generator holding the capture."""
+    closed = []
+    
+    def frames():
+        try:
+            for i in range(20):
+                yield i, float(i), np.zeros((48, 64, 3), dtype=np.uint8)
+        finally:
+            closed.append(True)
+    
+    writer = celery_tasks.DetectionWriter(db, "incident-1")
+    
+    with pytest.raises(RuntimeError):
+        celery_tasks._run_pipeline(frames(), writer, FakeDetector(fail=True), FakeOCR())
+    assert closed == [True]
@@ -0,0 +1,75 @@
+"""
+Tests for the vehicle color classifier.
+"""
+import numpy as np
+import pytest
+
+from app.services.color_classifier import COLOR_LABELS, ColorClassifier, build_color_lut
+from app.services.ml_detector import MLDetector
+
+
+def vehicle(body_bgr, size=(40, 80)):
+    """Helper to draw a vehicle crop: a colored body with dark windows and tires."""
+    height, width = size
+    crop = np.zeros((height, width, 3), dtype=np.uint8)
+    crop[:] = body_bgr
+    crop[8:16, 16:64] = (30, 30, 30)  # windows
+    crop[32:, 8:20] = (10, 10, 10)  # tires
+    crop[32:, 60:72] = (10, 10, 10)
+    return crop
+
+
+@pytest.mark.parametrize("body, color", [
+    ((0, 0, 200), "red"),
+    ((200, 0, 0), "blue"),
+    ((0, 160, 0), "green"),
+    ((0, 210, 230), "yellow"),
+    ((0, 120, 240), "orange"),
+    ((240, 240, 240), "white"),
+    ((20, 20, 20), "black"),
+    ((128, 128, 128), "gray"),
+])
+def test_classify_crop(body, color):
+    """Test the label of each color on BGR crops (red is not mistaken for blue)."""
+    assert ColorClassifier().classify_crop(vehicle(body)) == color
+
+
+def test_classify_boxes_of_a_frame_in_one_call():
+    """Test that every box of a frame gets the label its crop gets alone."""
+    classifier = ColorClassifier()
+    frame = np.full((120, 300, 3), 90, dtype=np.uint8)
+    frame[10:50, 10:90] = vehicle((0, 0, 200))
+    frame[60:100, 110:190] = vehicle((240, 240, 240))
+    frame[20:60, 200:280] = vehicle((200, 0, 0))
+    boxes = np.array([[10, 10, 90, 50], [110, 60, 190, 100], [200, 20, 280, 60], [5, 5, 5, 40]])
+    
+    colors = classifier.classify(frame, boxes)
+    
+    assert colors == ["red", "white", "blue", "unknown"]
+    assert colors[:3] == [classifier.classify_crop(frame[y1:y2, x1:x2]) for x1, y1, x2, y2 in boxes[:3]]
+
+
+def test_chromatic_share_decides_against_background():
+    """Test that a colored body beats a larger gray background only above chromatic_share."""
+    crop = np.full((40, 80, 3), 128, dtype=np.uint8)
+    crop[:, :32] = (0, 0, 200)
+    
+    assert ColorClassifier(margin=0, chromatic_share=0.3).classify_crop(crop) == "red"
+    assert ColorClassifier(margin=0, chromatic_share=0.5).classify_crop(crop) == "gray"
+
+
+def test_build_color_lut_covers_every_cell():
+    """Test the table size and that every entry is a label."""
+    lut = build_color_lut(bits=4)
+    
+    assert lut.shape == (4096,)
+    assert lut.max() < len(COLOR_LABELS)
+
+
+def test_detect_vehicle_color_handles_empty_and_grayscale_crops():
+    """Test the single-crop detector API."""
+    detector = MLDetector("missing.onnx", backend="onnxruntime")
+    
+    assert detector.detect_vehicle_color(np.zeros((0, 0, 3), dtype=np.uint8)) == "unknown"
+    assert detector.detect_vehicle_color(np.zeros((40, 80), dtype=np.uint8)) == "unknown"
+    assert detector.detect_vehicle_color(vehicle((0, 0, 200))) == "red"
@@ -0,0 +1,141 @@
+"""
+Tests for the bulk detection writer.
+"""
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.incident import Incident, IncidentType, ProcessingStatus
+from app.models.user import User
+from app.models.vehicle import DetectedVehicle, LicensePlate
+from app.services.detection_writer import DetectionWriter
+
+# Setup test database
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create tables and yield a session with one incident."""
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    
+    session.add(User(
+        user_id="user-1",
+        email="test@example.com",
+        username="testuser",
+        password_hash="x",
+        created_at=datetime.utcnow(),
+        is_active=True
+    ))
+    session.add(Incident(
+        incident_id="incident-1",
+        user_id="user-1",
+        type=IncidentType.CRASH,
+        latitude=37.7749,
+        longitude=-122.4194,
+        timestamp=datetime.utcnow(),
+        video_path="/tmp/raw.mp4",
+        video_size=0,
+        processing_status=ProcessingStatus.PROCESSING,
+        created_at=datetime.utcnow()
+    ))
+    session.commit()
+    
+    yield session
+    
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_writer_flushes_in_chunks(db):
+    """Test that rows are written once the chunk size is reached."""
+    writer = DetectionWriter(db, "incident-1", chunk_size=3)
+    detection = {
+        "vehicle_type": "car",
+        "confidence": 0.9,
+        "color": "white",
+        "bounding_box": {"x1": 0, "y1": 0, "x2": 10, "y2": 10}
+    }
+    
+    writer.add_vehicle(detection, 0.0)
+    writer.add_vehicle(detection, 1.0)
+    assert writer.vehicles_written == 0
+    
+    writer.add_vehicle(detection, 2.0)
+    assert writer.vehicles_written == 3
+    assert db.query(DetectedVehicle).count() == 3
+
+
+def test_writer_links_plates_to_vehicles(db):
+    """Test that plates reference the generated detection IDs."""
+    writer = DetectionWriter(db, "incident-1", chunk_size=100)
+    detection_id = writer.add_vehicle({
+        "vehicle_type": "truck",
+        "confidence": 0.8,
+        "bounding_box": {"x1": 0, "y1": 0, "x2": 10, "y2": 10}
+    }, 4.0)
+    writer.add_plate({
+        "plate_number": "ABC1234",
+        "confidence": 0.7,
+        "bounding_box": {"x1": 1, "y1": 1, "x2": 5, "y2": 3}
+    }, 4.0, detection_id=detection_id)
+    writer.flush()
+    db.commit()
+    
+    vehicle = db.query(DetectedVehicle).one()
+    plate = db.query(LicensePlate).one()
+    assert uuid.UUID(vehicle.detection_id)
+    assert plate.detection_id == vehicle.detection_id
+    assert plate.incident_id == "incident-1"
+    assert vehicle.bounding_box == {"x1": 0, "y1": 0, "x2": 10, "y2": 10}
+    assert writer.plates_written == 1
+
+
+def test_writer_copies_detections_from_incident(db):
+    """Test that copied detections get new IDs and keep plate links."""
+    writer = DetectionWriter(db, "incident-1", chunk_size=100)
+    detection_id = writer.add_vehicle({
+        "vehicle_type": "car",
+        "confidence": 0.9,
+        "bounding_box": {"x1": 0, "y1": 0, "x2": 10, "y2": 10}
+    }, 2.0)
+    writer.add_plate({
+        "plate_number": "XYZ987",
+        "confidence": 0.6,
+        "bounding_box": {"x1": 1, "y1": 1, "x2": 5, "y2": 3}
+    }, 2.0, detection_id=detection_id)
+    writer.flush()
+    
+    source = db.query(Incident).one()
+    db.add(Incident(
+        incident_id="incident-2",
+        user_id="user-1",
+        type=IncidentType.CRASH,
+        latitude=source.latitude,
+        longitude=source.longitude,
+        timestamp=source.timestamp,
+        video_path=source.video_path,
+        video_size=0,
+        processing_status=ProcessingStatus.PROCESSING,
+        created_at=datetime.utcnow()
+    ))
+    db.commit()
+    
+    copier = DetectionWriter(db, "incident-2")
+    copier.copy_from("incident-1")
+    copier.flush()
+    db.commit()
+    
+    vehicle = db.query(DetectedVehicle).filter(DetectedVehicle.incident_id == "incident-2").one()
+    plate = db.query(LicensePlate).filter(LicensePlate.incident_id == "incident-2").one()
+    assert vehicle.detection_id != detection_id
+    assert vehicle.frame_timestamp == 2.0
+    assert plate.detection_id == vehicle.detection_id
+    assert plate.plate_number == "XYZ987"
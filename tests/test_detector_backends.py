@@ -0,0 +1,130 @@
+"""
+Tests for detector inference backends.
+"""
+import numpy as np
+import pytest
+
+from app.services.detector_backends import (
+    DetectorBackend,
+    ExportedYoloBackend,
+    create_backend,
+    decode_yolo_output,
+    letterbox,
+)
+from app.services.ml_detector import MLDetector
+
+
+def raw_output(boxes, num_classes=80, anchors=16):
+    """Helper to build a YOLOv8 head output with the given (cx, cy, w, h, class, score) anchors."""
+    output = np.zeros((4 + num_classes, anchors), dtype=np.float32)
+    for anchor, (center_x, center_y, width, height, class_id, score) in enumerate(boxes):
+        output[:4, anchor] = center_x, center_y, width, height
+        output[4 + class_id, anchor] = score
+    return output
+
+
+def test_letterbox_keeps_aspect_ratio():
+    """Test that a wide frame is scaled to fit and padded top and bottom."""
+    frame = np.full((360, 640, 3), 7, dtype=np.uint8)
+    
+    image, scale, pad_x, pad_y = letterbox(frame, 320)
+    
+    assert image.shape == (320, 320, 3)
+    assert (scale, pad_x, pad_y) == (0.5, 0, 70)
+    assert image[0, 0, 0] == 114
+    assert image[70, 0, 0] == 7
+
+
+def test_decode_yolo_output_filters_classes_and_suppresses_overlaps():
+    """Test class filtering, confidence filtering and class-aware NMS."""
+    output = raw_output([
+        (100, 100, 40, 20, 2, 0.9),   # car
+        (101, 100, 40, 20, 2, 0.8),   # duplicate car, suppressed
+        (101, 100, 40, 20, 7, 0.7),   # truck on the same spot, kept
+        (300, 300, 40, 20, 0, 0.95),  # person, not a requested class
+        (200, 200, 40, 20, 2, 0.3),   # below threshold
+    ])
+    
+    boxes = decode_yolo_output(output, np.array([2, 3, 5, 7]), 0.5)
+    
+    assert boxes[:, 5].tolist() == [2, 7]
+    np.testing.assert_allclose(boxes[0], [80, 90, 120, 110, 0.9, 2], rtol=1e-6)
+
+
+class FakeGraph(ExportedYoloBackend):
+    """Exported backend whose graph reports one car in the middle of the input."""
+    
+    def __init__(self):
+        super().__init__(320, dynamic_batch=False)
+        self.runs = 0
+    
+    def _infer(self, blob):
+        self.runs += 1
+        return raw_output([(160, 160, 80, 40, 2, 0.9)])[None].repeat(len(blob), axis=0)
+
+
+def test_exported_backend_maps_boxes_to_frame_pixels():
+    """Test that boxes are mapped back through the letterbox to each frame."""
+    backend = FakeGraph()
+    detector = MLDetector("missing.onnx", backend="onnxruntime")
+    detector.model = backend
+    frames = [np.zeros((360, 640, 3), dtype=np.uint8)] * 3
+    
+    detections = detector.detect_vehicles_batch(frames, batch_size=3)
+    
+    # A graph with a fixed batch dimension runs once per frame
+    assert backend.runs == 3
+    assert [d[0]["bounding_box"] for d in detections] == [{"x1": 240, "y1": 140, "x2": 400, "y2": 220}] * 3
+    assert detections[0][0]["vehicle_type"] == "car"
+
+
+def test_exported_backend_uses_prepared_letterbox():
+    """Test that frames letterboxed ahead of time are not resized again."""
+    backend = FakeGraph()
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    prepared = letterbox(frame, 320)
+    backend._canvas = None  # letterboxing inside predict would fail
+    
+    predictions = backend.predict([frame], np.array([2]), 0.5, letterboxed=[prepared])
+    
+    assert predictions[0][:, :4].tolist() == [[240, 140, 400, 220]]
+
+
+class FakeEagerBackend(DetectorBackend):
+    """Backend that resizes frames itself, like ultralytics."""
+    
+    input_size = 640
+    
+    def predict(self, frames, class_ids, confidence_threshold, letterboxed=None):
+        return [np.zeros((0, 6), dtype=np.float32) for _ in frames]
+
+
+def test_letterbox_size_only_for_backends_using_letterboxes():
+    """Test that frames are only letterboxed ahead for backends that take them."""
+    detector = MLDetector("missing.onnx", backend="onnxruntime")
+    
+    detector.model = FakeEagerBackend()
+    assert detector.letterbox_size is None
+    
+    detector.model = FakeGraph()
+    assert detector.letterbox_size == 320
+
+
+def test_create_backend():
+    """Test unknown and uninstalled backends."""
+    with pytest.raises(ValueError):
+        create_backend("tensorrt", "yolov8n.onnx")
+    
+    assert create_backend("onnxruntime", "missing.onnx") is None
+
+
+def test_backends_must_implement_inference():
+    """Test that the backend interfaces cannot be instantiated without inference."""
+    with pytest.raises(TypeError):
+        DetectorBackend()
+    
+    class NoGraph(ExportedYoloBackend):
+        pass
+    
+    with pytest.raises(TypeError):
+        NoGraph(320, dynamic_batch=False)
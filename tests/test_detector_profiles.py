@@ -0,0 +1,44 @@
+"""
+Tests for detector profile selection.
+"""
+import pytest
+
+from app.services.detector_profiles import choose_profile, parse_profile_map, quantized_model_path
+
+
+def test_parse_profile_map():
+    """Test parsing of the per-incident-type setting."""
+    assert parse_profile_map("") == {}
+    assert parse_profile_map(" crash:accurate, hazard:fast ") == {"crash": "accurate", "hazard": "fast"}
+    
+    with pytest.raises(ValueError):
+        parse_profile_map("crash")
+    with pytest.raises(ValueError):
+        parse_profile_map("crash:tiny")
+
+
+def test_choose_profile_by_type_then_load():
+    """Test that incident types win over queue load, which wins over the default."""
+    options = {
+        "default": "accurate",
+        "by_incident_type": {"crash": "accurate", "hazard": "balanced"},
+        "peak_profile": "fast",
+        "peak_queue_length": 50,
+    }
+    
+    assert choose_profile("other", 10, **options).name == "accurate"
+    assert choose_profile("other", 50, **options).name == "fast"
+    assert choose_profile("crash", 500, **options).name == "accurate"
+    assert choose_profile("hazard", 0, **options).name == "balanced"
+    assert choose_profile("other", 500, **{**options, "peak_queue_length": 0}).name == "accurate"
+
+
+def test_quantized_model_path(tmp_path):
+    """Test that an existing int8 graph is used and other models fall back to fp32."""
+    model_path = tmp_path / "yolov8n.onnx"
+    model_path.write_bytes(b"fp32")
+    
+    assert quantized_model_path("yolov8n.pt") == "yolov8n.pt"
+    
+    (tmp_path / "yolov8n-int8.onnx").write_bytes(b"int8")
+    assert quantized_model_path(str(model_path)) == str(tmp_path / "yolov8n-int8.onnx")
@@ -0,0 +1,86 @@
+"""
+Tests for the reusable frame buffers.
+"""
+import numpy as np
+
+from app.services.frame_buffer import FramePool
+
+
+def reader(value, shape=(48, 64, 3)):
+    """Helper mimicking VideoCapture.read: decode a constant frame into the given array."""
+    def read(out):
+        if out is None or out.shape != shape:
+            out = np.empty(shape, dtype=np.uint8)
+        out.fill(value)
+        return True, out
+    return read
+
+
+def test_pool_reuses_released_buffers():
+    """Test that decoding after a release writes into the same memory."""
+    pool = FramePool()
+    
+    first = pool.decode(reader(1))
+    image = first.image
+    pool.release([first])
+    second = pool.decode(reader(2))
+    
+    assert second.image is image
+    assert second.image[0, 0, 0] == 2
+    assert pool.allocations == 1
+
+
+def test_pool_allocates_while_frames_are_in_flight():
+    """Test that held buffers are never handed out again."""
+    pool = FramePool()
+    
+    held = [pool.decode(reader(value)) for value in range(3)]
+    
+    assert len({id(buffer.image) for buffer in held}) == 3
+    assert [buffer.image[0, 0, 0] for buffer in held] == [0, 1, 2]
+    assert pool.allocations == 3
+
+
+def test_pool_replaces_buffer_when_frame_size_changes():
+    """Test that a frame of another size gets a new buffer."""
+    pool = FramePool()
+    pool.release([pool.decode(reader(1))])
+    
+    buffer = pool.decode(reader(2, shape=(96, 128, 3)))
+    
+    assert buffer.image.shape == (96, 128, 3)
+    assert pool.allocations == 2
+
+
+def test_failed_decode_keeps_buffer():
+    """Test that a buffer is returned to the pool when decoding fails."""
+    pool = FramePool()
+    pool.release([pool.decode(reader(1))])
+    
+    assert pool.decode(lambda out: (False, out)) is None
+    assert pool.decode(reader(2)) is not None
+    assert pool.allocations == 1
+
+
+def test_letterbox_is_computed_once_per_decoded_frame():
+    """Test that the detector input is letterboxed lazily and refreshed after a new decode."""
+    pool = FramePool(detector_size=32)
+    
+    buffer = pool.decode(reader(10))
+    image, scale, pad_x, pad_y = buffer.letterboxed
+    
+    assert image.shape == (32, 32, 3)
+    assert (scale, pad_x, pad_y) == (0.5, 0, 4)
+    assert image[4, 0, 0] == 10
+    assert buffer.letterboxed[0] is image
+    
+    pool.release([buffer])
+    buffer = pool.decode(reader(20))
+    
+    assert buffer.letterboxed[0] is image
+    assert image[4, 0, 0] == 20
+
+
+def test_pool_without_detector_size_only_decodes():
+    """Test that no detector input is prepared without a detector size."""
+    assert FramePool().decode(reader(1)).letterboxed is None
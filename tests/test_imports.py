@@ -0,0 +1,45 @@
+"""
+Tests guarding what the API process imports.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only Celery workers need
+WORKER_ONLY_MODULES = ["torch", "cv2", "ultralytics", "onnxruntime", "openvino", "easyocr", "app.tasks.celery_tasks"]
+
+
+def test_api_does_not_import_ml_stack():
+    """Test that importing the API app never loads the ML libraries."""
+    code = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {WORKER_ONLY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, API_SECRET_KEY="x", DATABASE_URL="sqlite://")
+    
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    assert result.stdout.strip() == ""
+
+
+def test_process_incident_video_signature_matches_task():
+    """Test that the API signature targets the registered worker task."""
+    pytest.importorskip("cv2")
+    from app.tasks.celery_tasks import process_incident_video
+    from app.tasks.signatures import process_incident_video as process_incident_video_signature
+    
+    signature = process_incident_video_signature("incident-1")
+    
+    assert signature.task == process_incident_video.name
+    assert signature.args == ("incident-1",)
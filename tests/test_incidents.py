@@ -2,9 +2,13 @@
 Tests for incident endpoints.
 """
 import pytest
+import hashlib
+import math
 import os
 import tempfile
+from datetime import datetime
 from io import BytesIO
+import numpy as np
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -12,6 +16,13 @@ from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.core.database import Base, get_db
 from app.core.config import settings
+from app.api.v1.endpoints.incidents import (
+    EARTH_RADIUS_KM,
+    bounding_box,
+    haversine_distance,
+    haversine_distances,
+    nearest_indices,
+)
 
 # Setup test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -220,7 +231,8 @@ def test_get_nearby_incidents_with_results():
                 "type": "crash",
                 "latitude": "37.7749",
                 "longitude": "-122.4194",
-                "timestamp": "2024-01-13T12:00:00Z"
+                # Inside the default 24 hour window of /nearby
+                "timestamp": datetime.utcnow().isoformat() + "Z"
             },
             files={"video": ("test1.mp4", BytesIO(b"fake1" * 100), "video/mp4")}
         )
@@ -324,3 +336,380 @@ def test_delete_incident_not_found():
     )
     
     assert response.status_code == 404
+
+
+def test_get_nearby_incidents_filters_by_radius():
+    """Test that nearby incidents are limited to the radius and sorted by distance."""
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    now = datetime.utcnow().isoformat()
+    
+    try:
+        # 0 km, ~3.3 km and ~111 km from the search center
+        for latitude in ["37.80", "37.77", "38.77"]:
+            client.post(
+                "/api/v1/incidents/report",
+                headers={"Authorization": f"Bearer {token}"},
+                data={
+                    "type": "hazard",
+                    "latitude": latitude,
+                    "longitude": "-122.42",
+                    "timestamp": now
+                },
+                files={"video": ("test.mp4", BytesIO(b"fake video content"), "video/mp4")}
+            )
+        
+        response = client.get(
+            "/api/v1/incidents/nearby",
+            headers={"Authorization": f"Bearer {token}"},
+            params={
+                "latitude": 37.80,
+                "longitude": -122.42,
+                "radius_km": 5
+            }
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [incident["latitude"] for incident in data] == [37.80, 37.77]
+        assert data[0]["distance_km"] == pytest.approx(0.0)
+        assert data[1]["distance_km"] == pytest.approx(3.34, abs=0.01)
+        
+        # Only the nearest incident when limited
+        response = client.get(
+            "/api/v1/incidents/nearby",
+            headers={"Authorization": f"Bearer {token}"},
+            params={
+                "latitude": 37.80,
+                "longitude": -122.42,
+                "radius_km": 5,
+                "limit": 1
+            }
+        )
+        assert [incident["latitude"] for incident in response.json()] == [37.80]
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("latitude,longitude", [
+    (37.7749, -122.4194),
+    (-33.86, 151.21),
+    (0.0, 179.99),
+    (0.0, -179.99),
+    (89.99, 0.0),
+])
+def test_bounding_box_contains_circle(latitude, longitude):
+    """Test that points on the search circle fall inside the bounding box."""
+    radius_km = 50.0
+    min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius_km)
+    
+    for bearing in range(0, 360, 10):
+        # Destination point at radius_km along the bearing (slightly inside)
+        angular = (radius_km * 0.999) / EARTH_RADIUS_KM
+        lat1, lon1, theta = math.radians(latitude), math.radians(longitude), math.radians(bearing)
+        lat2 = math.asin(math.sin(lat1) * math.cos(angular) + math.cos(lat1) * math.sin(angular) * math.cos(theta))
+        lon2 = lon1 + math.atan2(
+            math.sin(theta) * math.sin(angular) * math.cos(lat1),
+            math.cos(angular) - math.sin(lat1) * math.sin(lat2)
+        )
+        point_lat = math.degrees(lat2)
+        point_lon = (math.degrees(lon2) + 540) % 360 - 180
+        
+        assert haversine_distance(latitude, longitude, point_lat, point_lon) <= radius_km
+        assert min_lat <= point_lat <= max_lat
+        if lon_ranges is not None:
+            assert any(min_lon <= point_lon <= max_lon for min_lon, max_lon in lon_ranges)
+
+
+def test_haversine_distances_matches_scalar():
+    """Test that the vectorized distance kernel matches the scalar formula."""
+    latitudes = np.array([37.7749, 40.7128, -33.8688, 37.7749])
+    longitudes = np.array([-122.4194, -74.0060, 151.2093, -122.4194])
+    
+    distances = haversine_distances(37.7749, -122.4194, latitudes, longitudes)
+    
+    expected = [haversine_distance(37.7749, -122.4194, lat, lon) for lat, lon in zip(latitudes, longitudes)]
+    assert distances == pytest.approx(expected)
+
+
+def test_nearest_indices_partial_sort():
+    """Test that nearest_indices returns the k nearest in ascending order."""
+    distances = np.array([5.0, 1.0, 4.0, 0.5, 3.0, 2.0])
+    
+    assert nearest_indices(distances, 3).tolist() == [3, 1, 5]
+    assert nearest_indices(distances).tolist() == [3, 1, 5, 4, 2, 0]
+    assert nearest_indices(distances, 10).tolist() == [3, 1, 5, 4, 2, 0]
+
+
+def test_report_incident_video_too_large():
+    """Test that oversized uploads are rejected and not left on disk."""
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    original_max_size = settings.MAX_VIDEO_SIZE_MB
+    original_chunk_size = settings.UPLOAD_CHUNK_SIZE_KB
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    settings.MAX_VIDEO_SIZE_MB = 1
+    settings.UPLOAD_CHUNK_SIZE_KB = 64
+    
+    try:
+        response = client.post(
+            "/api/v1/incidents/report",
+            headers={"Authorization": f"Bearer {token}"},
+            data={
+                "type": "crash",
+                "latitude": "37.7749",
+                "longitude": "-122.4194",
+                "timestamp": "2024-01-13T12:00:00Z"
+            },
+            files={"video": ("test.mp4", BytesIO(b"x" * (1024 * 1024 + 1)), "video/mp4")}
+        )
+        
+        assert response.status_code == 413
+        leftover = [files for _, _, files in os.walk(temp_dir) if files]
+        assert leftover == []
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        settings.MAX_VIDEO_SIZE_MB = original_max_size
+        settings.UPLOAD_CHUNK_SIZE_KB = original_chunk_size
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_report_incident_rejected_before_form_parsing(monkeypatch):
+    """Test that a body over the limit is refused before the endpoint parses it."""
+    token = get_auth_token()
+    monkeypatch.setattr(settings, "MAX_VIDEO_SIZE_MB", 1)
+    
+    from app.api.v1.endpoints import incidents
+    
+    async def fail_save_upload(*args, **kwargs):
+        raise AssertionError("endpoint ran")
+    
+    monkeypatch.setattr(incidents, "save_upload", fail_save_upload)
+    
+    response = client.post(
+        "/api/v1/incidents/report",
+        headers={"Authorization": f"Bearer {token}"},
+        data={
+            "type": "crash",
+            "latitude": "37.7749",
+            "longitude": "-122.4194",
+            "timestamp": "2024-01-13T12:00:00Z"
+        },
+        files={"video": ("test.mp4", BytesIO(b"x" * (2 * 1024 * 1024)), "video/mp4")}
+    )
+    
+    assert response.status_code == 413
+    assert "request body" in response.json()["detail"].lower()
+
+
+def test_report_incident_chunked_body_stops_at_limit(monkeypatch):
+    """Test that a body without Content-Length is cut off once it passes the limit."""
+    token = get_auth_token()
+    monkeypatch.setattr(settings, "MAX_VIDEO_SIZE_MB", 1)
+    
+    from app.api.v1.endpoints import incidents
+    
+    async def fail_save_upload(*args, **kwargs):
+        raise AssertionError("endpoint ran")
+    
+    monkeypatch.setattr(incidents, "save_upload", fail_save_upload)
+    
+    def body():
+        yield (
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="video"; filename="test.mp4"\r\n'
+            b"Content-Type: video/mp4\r\n\r\n"
+        )
+        for _ in range(64):
+            yield b"x" * (64 * 1024)
+        yield b"\r\n--boundary--\r\n"
+    
+    response = client.post(
+        "/api/v1/incidents/report",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "multipart/form-data; boundary=boundary"
+        },
+        content=body()
+    )
+    
+    assert response.status_code == 413
+
+def test_report_incident_streams_video_to_disk():
+    """Test that the stored video matches the uploaded bytes."""
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    original_chunk_size = settings.UPLOAD_CHUNK_SIZE_KB
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    settings.UPLOAD_CHUNK_SIZE_KB = 1
+    video_content = os.urandom(10 * 1024 + 123)
+    
+    try:
+        response = client.post(
+            "/api/v1/incidents/report",
+            headers={"Authorization": f"Bearer {token}"},
+            data={
+                "type": "crash",
+                "latitude": "37.7749",
+                "longitude": "-122.4194",
+                "timestamp": "2024-01-13T12:00:00Z"
+            },
+            files={"video": ("test.mp4", BytesIO(video_content), "video/mp4")}
+        )
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["video_size"] == len(video_content)
+        with open(data["video_path"], "rb") as f:
+            assert f.read() == video_content
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        settings.UPLOAD_CHUNK_SIZE_KB = original_chunk_size
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_duplicate_videos_share_storage():
+    """Test that identical uploads share one file that outlives all but the last incident."""
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    video_content = os.urandom(4096)
+    
+    try:
+        incidents = []
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/incidents/report",
+                headers={"Authorization": f"Bearer {token}"},
+                data={
+                    "type": "crash",
+                    "latitude": "37.7749",
+                    "longitude": "-122.4194",
+                    "timestamp": "2024-01-13T12:00:00Z"
+                },
+                files={"video": ("test.mp4", BytesIO(video_content), "video/mp4")}
+            )
+            assert response.status_code == 201
+            incidents.append(response.json())
+        
+        video_path = incidents[0]["video_path"]
+        assert incidents[1]["video_path"] == video_path
+        assert hashlib.sha256(video_content).hexdigest() in video_path
+        
+        # The first delete only drops a reference
+        client.delete(
+            f"/api/v1/incidents/{incidents[0]['incident_id']}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert os.path.exists(video_path)
+        
+        # The last delete removes the file
+        client.delete(
+            f"/api/v1/incidents/{incidents[1]['incident_id']}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert not os.path.exists(video_path)
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_deleted_video_is_trashed_then_purged(monkeypatch):
+    """Test that the last delete trashes the video and purge_video_trash deletes it."""
+    celery_tasks = pytest.importorskip("app.tasks.celery_tasks")
+    from app.services.video_storage import trashed_videos
+    monkeypatch.setattr(celery_tasks, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(settings, "VIDEO_TRASH_GRACE_MINUTES", -1)
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    video_content = os.urandom(4096)
+    
+    try:
+        response = client.post(
+            "/api/v1/incidents/report",
+            headers={"Authorization": f"Bearer {token}"},
+            data={
+                "type": "crash",
+                "latitude": "37.7749",
+                "longitude": "-122.4194",
+                "timestamp": "2024-01-13T12:00:00Z"
+            },
+            files={"video": ("test.mp4", BytesIO(video_content), "video/mp4")}
+        )
+        incident = response.json()
+        
+        client.delete(
+            f"/api/v1/incidents/{incident['incident_id']}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert not os.path.exists(incident["video_path"])
+        assert [entry[1] for entry in trashed_videos()] == [hashlib.sha256(video_content).hexdigest()]
+        
+        assert celery_tasks.purge_video_trash() == 1
+        assert trashed_videos() == []
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_trashed_video_restored_for_concurrent_report(monkeypatch):
+    """Test that a video trashed while a report used it is moved back instead of purged."""
+    celery_tasks = pytest.importorskip("app.tasks.celery_tasks")
+    from app.services.video_storage import restore_video, trash_video, trashed_videos
+    monkeypatch.setattr(celery_tasks, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(settings, "VIDEO_TRASH_GRACE_MINUTES", -1)
+    token = get_auth_token()
+    
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    video_content = os.urandom(4096)
+    video_sha256 = hashlib.sha256(video_content).hexdigest()
+    
+    try:
+        response = client.post(
+            "/api/v1/incidents/report",
+            headers={"Authorization": f"Bearer {token}"},
+            data={
+                "type": "crash",
+                "latitude": "37.7749",
+                "longitude": "-122.4194",
+                "timestamp": "2024-01-13T12:00:00Z"
+            },
+            files={"video": ("test.mp4", BytesIO(video_content), "video/mp4")}
+        )
+        video_path = response.json()["video_path"]
+        
+        # A delete that counted no references before this report committed
+        trash_video(video_path)
+        assert not os.path.exists(video_path)
+        assert restore_video(video_sha256)
+        assert os.path.exists(video_path)
+        
+        # The purge job checks references again before deleting
+        trash_video(video_path)
+        assert celery_tasks.purge_video_trash() == 0
+        assert os.path.exists(video_path)
+        assert trashed_videos() == []
+    finally:
+        settings.VIDEO_STORAGE_PATH = original_video_path
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,86 @@
+"""
+Tests for the process-wide model registry.
+"""
+import pytest
+
+from app.core.config import settings
+from app.services import model_registry
+
+
+class FakeDetector:
+    """Stands in for MLDetector and records its arguments."""
+    
+    def __init__(self, model_path, backend="ultralytics", threads=0, input_size=None):
+        self.model_path = model_path
+        self.input_size = input_size
+
+
+@pytest.fixture(autouse=True)
+def empty_registry(monkeypatch):
+    """Give every test an empty registry and a detector that loads nothing."""
+    monkeypatch.setattr(model_registry, "_models", {})
+    monkeypatch.setattr(model_registry, "_stats", {})
+    monkeypatch.setattr(model_registry, "MLDetector", FakeDetector)
+
+
+def test_get_or_load_loads_once():
+    """Test that a model is built on first use and reused afterwards."""
+    calls = []
+    
+    def loader():
+        calls.append(1)
+        return object()
+    
+    first = model_registry._get_or_load("model", loader)
+    assert model_registry._get_or_load("model", loader) is first
+    assert len(calls) == 1
+
+
+def test_get_ml_detector_cached_per_profile(monkeypatch):
+    """Test that each detector profile gets its own shared instance."""
+    monkeypatch.setattr(settings, "YOLO_MODEL", "yolov8n.pt")
+    
+    accurate = model_registry.get_ml_detector("accurate")
+    assert model_registry.get_ml_detector("accurate") is accurate
+    assert accurate.input_size == 640
+    
+    balanced = model_registry.get_ml_detector("balanced")
+    assert balanced is not accurate
+    assert balanced.input_size == 480
+
+
+def test_get_stats_reports_loaded_models():
+    """Test that load time and RSS growth are recorded for every loaded model."""
+    assert model_registry.get_stats()["models"] == {}
+    
+    model_registry._get_or_load("model", object)
+    stats = model_registry.get_stats()
+    
+    assert set(stats["models"]) == {"model"}
+    assert stats["models"]["model"]["load_time_s"] >= 0
+    assert "rss_delta_mb" in stats["models"]["model"]
+    assert stats["rss_mb"] > 0
+    assert stats["max_rss_mb"] > 0
+    
+    # Stats are copies, not the registry's own dictionaries
+    stats["models"]["model"]["load_time_s"] = -1
+    assert model_registry.get_stats()["models"]["model"]["load_time_s"] >= 0
+
+
+def test_rss_delta_measures_current_memory_after_earlier_peak():
+    """Test that a model loaded below an earlier memory peak still reports its growth."""
+    peak = b"\x01" * (128 * 1024 * 1024)
+    del peak
+    
+    model = model_registry._get_or_load("model", lambda: b"\x01" * (64 * 1024 * 1024))
+    
+    assert len(model) == 64 * 1024 * 1024
+    assert model_registry.get_stats()["models"]["model"]["rss_delta_mb"] >= 48
+
+
+def test_worker_startup_timeout_covers_warm_up():
+    """Test that worker processes get longer than Celery's 4 s default to load models."""
+    from app.celery_app import celery_app
+    
+    assert celery_app.conf.worker_proc_alive_timeout == settings.WORKER_PROC_ALIVE_TIMEOUT
+    assert celery_app.conf.worker_proc_alive_timeout > 4
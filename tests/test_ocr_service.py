@@ -0,0 +1,50 @@
+"""
+Tests for the OCR service.
+"""
+import numpy as np
+
+from app.services.ocr_service import OCRService
+
+
+class FakeReader:
+    """EasyOCR reader stand-in that reads the crop height back as plate text."""
+    
+    def __init__(self):
+        self.batches = []
+    
+    def readtext_batched(self, images, batch_size=1):
+        self.batches.append(images.shape)
+        results = []
+        for image in images:
+            # Padding is zero, so the crop's own rows are the non-zero ones
+            height = int(np.count_nonzero(image[:, 0, 0]))
+            box = [[0, 0], [10, 0], [10, 5], [0, 5]]
+            results.append([(box, f"AB{height}", 0.9)])
+        return results
+
+
+def test_read_plate_texts_batches_and_aligns_results():
+    """Test that crops are read in padded batches and results follow input order."""
+    service = OCRService()
+    service.reader = FakeReader()
+    crops = [
+        np.full((30, 40, 3), 255, dtype=np.uint8),
+        np.zeros((0, 40, 3), dtype=np.uint8),
+        np.full((10, 80, 3), 255, dtype=np.uint8),
+        np.full((20, 20, 3), 255, dtype=np.uint8),
+    ]
+    
+    plates = service.read_plate_texts(crops, batch_size=2)
+    
+    assert [plate and plate["plate_number"] for plate in plates] == ["AB30", None, "AB10", "AB20"]
+    assert plates[0]["bounding_box"] == {"x1": 0, "y1": 0, "x2": 10, "y2": 5}
+    # Sorted by area: (20x20, 10x80) share a canvas, then 30x40 alone
+    assert service.reader.batches == [(2, 20, 80, 3), (1, 30, 40, 3)]
+
+
+def test_read_plate_texts_without_reader():
+    """Test that every crop gets None when EasyOCR is not available."""
+    service = OCRService()
+    service.reader = None
+    
+    assert service.read_plate_texts([np.zeros((5, 5, 3), dtype=np.uint8)] * 2) == [None, None]
@@ -0,0 +1,96 @@
+"""
+Tests for license plate consensus voting.
+"""
+import pytest
+
+from app.services.plate_consensus import PlateClusterer, PlateVoter, hamming_distance
+
+
+def make_reading(plate_number, confidence):
+    """Helper to build an OCR reading."""
+    return {
+        "plate_number": plate_number,
+        "confidence": confidence,
+        "bounding_box": {"x1": 0, "y1": 0, "x2": 10, "y2": 5}
+    }
+
+
+def test_voter_corrects_characters_by_weighted_vote():
+    """Test that per-character voting fixes single-frame OCR errors."""
+    voter = PlateVoter(min_weight=1.5, min_agreement=0.6)
+    
+    voter.add(make_reading("ABC1234", 0.9), 0.0)
+    voter.add(make_reading("A8C1234", 0.4), 1.0)
+    voter.add(make_reading("ABC1Z34", 0.5), 2.0)
+    voter.add(make_reading("ABC1234", 0.8), 3.0)
+    
+    result = voter.result()
+    assert result["plate_number"] == "ABC1234"
+    assert result["support_count"] == 4
+    assert result["frame_timestamp"] == 0.0
+    assert 0.0 < result["confidence"] <= 1.0
+
+
+def test_voter_picks_length_by_weight():
+    """Test that readings with a dropped character are outvoted."""
+    voter = PlateVoter()
+    
+    voter.add(make_reading("XYZ789", 0.9), 0.0)
+    voter.add(make_reading("XYZ78", 0.5), 1.0)
+    voter.add(make_reading("XYZ789", 0.7), 2.0)
+    
+    result = voter.result()
+    assert result["plate_number"] == "XYZ789"
+    assert result["support_count"] == 2
+
+
+def test_voter_confidence_ignores_readings_of_other_lengths():
+    """Test that readings outside the vote do not dilute the confidence."""
+    voter = PlateVoter()
+    
+    voter.add(make_reading("XYZ789", 0.9), 0.0)
+    voter.add(make_reading("XYZ789", 0.7), 1.0)
+    result = voter.result()
+    
+    voter.add(make_reading("XYZ78", 0.5), 2.0)
+    voter.add(make_reading("XY", 0.3), 3.0)
+    voter.add(make_reading("XYZ7890", 0.2), 4.0)
+    
+    assert voter.result()["confidence"] == pytest.approx(result["confidence"])
+    assert result["confidence"] == pytest.approx(0.8)
+
+
+def test_voter_consensus_requires_weight_and_agreement():
+    """Test when OCR can stop."""
+    voter = PlateVoter(min_weight=1.5, min_agreement=0.6)
+    assert not voter.has_consensus
+    assert voter.result() is None
+    
+    voter.add(make_reading("ABC123", 0.95), 0.0)
+    assert not voter.has_consensus
+    
+    voter.add(make_reading("ABC128", 0.9), 1.0)
+    assert not voter.has_consensus
+    
+    voter.add(make_reading("ABC123", 0.9), 2.0)
+    voter.add(make_reading("ABC123", 0.9), 3.0)
+    assert voter.has_consensus
+
+
+def test_clusterer_merges_similar_readings():
+    """Test that near-identical unassociated readings form one plate."""
+    clusterer = PlateClusterer(max_distance=1)
+    
+    clusterer.add(make_reading("ABC123", 0.9), 0.0)
+    clusterer.add(make_reading("ABC128", 0.4), 1.0)
+    clusterer.add(make_reading("XYZ789", 0.8), 1.0)
+    clusterer.add(make_reading("ABC123", 0.7), 2.0)
+    
+    results = clusterer.results()
+    assert [(r["plate_number"], r["support_count"]) for r in results] == [("ABC123", 3), ("XYZ789", 1)]
+
+
+@pytest.mark.parametrize("a, b, expected", [("ABC123", "ABC123", 0), ("ABC123", "A8C128", 2), ("ABC", "ABCD", 4)])
+def test_hamming_distance(a, b, expected):
+    """Test character distance between readings."""
+    assert hamming_distance(a, b) == expected
@@ -0,0 +1,58 @@
+"""
+Tests for license plate search strategies.
+"""
+import numpy as np
+import pytest
+
+from app.services.plate_search import PlateSearch
+
+
+class RecordingOCR:
+    """OCR service that reports one text box and records the frames it searches."""
+    
+    def __init__(self, box):
+        self.box = box
+        self.searched = []
+    
+    def detect_license_plate(self, frame):
+        self.searched.append(frame.shape)
+        return [{"bounding_box": self.box, "confidence": 0.9}]
+
+
+def test_vehicle_roi_crops_lower_part():
+    """Test that vehicle_roi only keeps the lower share of the vehicle box."""
+    frame = np.arange(100 * 200 * 3, dtype=np.uint32).reshape(100, 200, 3)
+    bbox = {"x1": 10, "y1": 20, "x2": 110, "y2": 80}
+    
+    full = PlateSearch("vehicle").vehicle_crop(frame, bbox)
+    lower = PlateSearch("vehicle_roi", roi_fraction=0.5).vehicle_crop(frame, bbox)
+    
+    assert full.shape == (60, 100, 3)
+    assert lower.shape == (30, 100, 3)
+    assert np.array_equal(lower, full[30:])
+
+
+def test_full_frame_search_interval_and_strategy():
+    """Test which sampled frames get a full frame search."""
+    search = PlateSearch("full_frame", full_frame_interval=3)
+    
+    assert [search.searches_full_frame(n) for n in range(6)] == [True, False, False, True, False, False]
+    assert not PlateSearch("vehicle").searches_full_frame(0)
+    assert not PlateSearch("vehicle_roi").searches_full_frame(0)
+
+
+def test_full_frame_search_downscales_and_crops_at_full_resolution():
+    """Test that text boxes found on the small frame are cropped from the full frame."""
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    ocr = RecordingOCR({"x1": 100, "y1": 50, "x2": 200, "y2": 80})
+    
+    crops = PlateSearch("full_frame", full_frame_max_width=960).full_frame_crops(frame, ocr)
+    
+    assert ocr.searched == [(540, 960, 3)]
+    assert [crop.shape for crop in crops] == [(60, 200, 3)]
+
+
+def test_unknown_strategy():
+    """Test that an unknown strategy is rejected."""
+    with pytest.raises(ValueError):
+        PlateSearch("everywhere")
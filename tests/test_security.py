@@ -0,0 +1,58 @@
+"""
+Tests for password hashing in the hashing pool.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core import security
+from app.core.config import settings
+
+
+@pytest.fixture(params=[0, 1], ids=["thread_pool", "process_pool"])
+def hash_workers(request, monkeypatch):
+    """Run a test with bcrypt in the default thread pool and in a one-process pool."""
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", request.param)
+    yield request.param
+    security.shutdown_hash_executor()
+
+
+def test_hash_and_verify_password_pooled(hash_workers):
+    """Test that the sync helpers used by the endpoints wait on the pool."""
+    hashed = security.hash_password_pooled("secret123")
+    
+    assert security.verify_password_pooled("secret123", hashed)
+    assert not security.verify_password_pooled("wrong", hashed)
+    assert (security._hash_executor is not None) == (hash_workers > 0)
+
+
+def test_hash_executor_created_once_under_concurrency(monkeypatch):
+    """Test that concurrent first requests share one process pool."""
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        executors = list(threads.map(lambda _: security._get_hash_executor(), range(8)))
+    
+    assert all(executor is security._hash_executor for executor in executors)
+    security.shutdown_hash_executor()
+
+
+def test_shutdown_hash_executor(monkeypatch):
+    """Test that shutdown stops the pool, is idempotent, and a later hash starts a new pool."""
+    security.shutdown_hash_executor()
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    security.hash_password_pooled("secret123")
+    executor = security._hash_executor
+    
+    security.shutdown_hash_executor()
+    security.shutdown_hash_executor()
+    
+    assert security._hash_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(security.hash_password, "secret123")
+    
+    security.hash_password_pooled("secret123")
+    assert security._hash_executor is not None and security._hash_executor is not executor
+    security.shutdown_hash_executor()
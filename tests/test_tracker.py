@@ -0,0 +1,108 @@
+"""
+Tests for the vehicle tracker.
+"""
+import numpy as np
+import pytest
+
+from app.services.tracker import VehicleTracker, greedy_match, iou_matrix
+
+
+def make_detection(x1, y1, x2, y2, confidence=0.9):
+    """Helper to build a detection dictionary."""
+    return {
+        "vehicle_type": "car",
+        "confidence": confidence,
+        "color": "white",
+        "bounding_box": {"x1": x1, "y1": y1, "x2": x2, "y2": y2}
+    }
+
+
+def test_iou_matrix():
+    """Test pairwise IoU values."""
+    iou = iou_matrix(
+        np.array([[0, 0, 10, 10], [20, 20, 30, 30]]),
+        np.array([[0, 0, 10, 10], [5, 0, 15, 10], [100, 100, 110, 110]])
+    )
+    
+    assert iou.shape == (2, 3)
+    assert iou[0] == pytest.approx([1.0, 50 / 150, 0.0])
+    assert iou[1] == pytest.approx([0.0, 0.0, 0.0])
+
+
+def test_greedy_match_prefers_highest_iou():
+    """Test that each row and column is matched at most once, best IoU first."""
+    iou = np.array([[0.9, 0.8], [0.85, 0.1]])
+    
+    assert greedy_match(iou, 0.3) == [(0, 0)]
+    assert greedy_match(iou, 0.05) == [(0, 0), (1, 1)]
+
+
+def test_tracker_follows_moving_vehicle():
+    """Test that a vehicle moving steadily keeps one track."""
+    tracker = VehicleTracker(iou_threshold=0.3, max_age=1)
+    
+    for step in range(10):
+        x = 20 * step
+        seen = tracker.update([make_detection(x, 50, x + 100, 110, confidence=0.7 + step / 100)], float(step))
+        assert [track.track_id for track, _ in seen] == [1]
+    
+    tracks = tracker.finish()
+    assert len(tracks) == 1
+    detection = tracks[0].to_detection()
+    assert (detection["first_timestamp"], detection["last_timestamp"], detection["frame_count"]) == (0.0, 9.0, 10)
+    # The most confident detection represents the track
+    assert detection["confidence"] == pytest.approx(0.79)
+    assert tracks[0].timestamp == 9.0
+
+
+def test_tracker_separates_vehicles_and_ends_stale_tracks():
+    """Test that distant vehicles get their own tracks and missed ones finish."""
+    tracker = VehicleTracker(iou_threshold=0.3, max_age=1)
+    
+    tracker.update([make_detection(0, 0, 50, 50), make_detection(200, 200, 260, 260)], 0.0)
+    tracker.update([make_detection(0, 0, 50, 50)], 1.0)
+    assert tracker.pop_finished() == []
+    
+    tracker.update([make_detection(0, 0, 50, 50)], 2.0)
+    finished = tracker.pop_finished()
+    assert [track.frame_count for track in finished] == [1]
+    assert len(tracker.tracks) == 1
+
+
+def test_tracker_matches_confident_detections_first():
+    """Test ByteTrack-style handling of weak detections."""
+    tracker = VehicleTracker(high_confidence=0.6)
+    
+    tracker.update([make_detection(0, 0, 50, 50, confidence=0.9)], 0.0)
+    seen = tracker.update([make_detection(2, 0, 52, 50, confidence=0.5)], 1.0)
+    assert len(seen) == 1
+    assert seen[0][0].frame_count == 2
+
+
+def test_tracker_unmatched_low_confidence_detection_starts_track():
+    """Test that a vehicle only ever scored below high_confidence still gets a track."""
+    tracker = VehicleTracker(high_confidence=0.6)
+    
+    seen = tracker.update([make_detection(0, 0, 50, 50, confidence=0.55)], 0.0)
+    assert [track.track_id for track, _ in seen] == [1]
+    
+    tracks = tracker.finish()
+    assert [track.detection["confidence"] for track in tracks] == [0.55]
+
+
+def test_track_stops_needing_ocr_after_plate_consensus():
+    """Test that OCR stops once the track's readings agree."""
+    tracker = VehicleTracker(plate_min_weight=1.5, plate_min_agreement=0.6)
+    track, _ = tracker.update([make_detection(0, 0, 50, 50)], 0.0)[0]
+    
+    track.add_plate_reading(None, 0.0)
+    assert track.needs_ocr()
+    track.add_plate_reading({"plate_number": "ABC123", "confidence": 0.9, "bounding_box": {}}, 1.0)
+    assert track.needs_ocr()
+    track.add_plate_reading({"plate_number": "ABC123", "confidence": 0.8, "bounding_box": {}}, 2.0)
+    
+    assert not track.needs_ocr()
+    assert track.plate["plate_number"] == "ABC123"
+    assert track.plate["frame_timestamp"] == 1.0
+    assert track.plate["support_count"] == 2
+    assert track.ocr_attempts == 3
@@ -0,0 +1,207 @@
+"""
+Tests for resumable upload endpoints.
+"""
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core.database import Base, get_db
+from app.core.config import settings
+from app.models.upload import UploadSession
+from app.api.v1.endpoints.uploads import advance_upload_offset
+
+# Setup test database
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# Override the get_db dependency
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[get_db] = override_get_db
+
+# Create test client
+client = TestClient(app)
+
+INCIDENT_DATA = {
+    "type": "crash",
+    "latitude": 37.7749,
+    "longitude": -122.4194,
+    "timestamp": "2024-01-13T12:00:00Z",
+    "description": "Resumed upload"
+}
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_database():
+    """Setup and teardown test database and video storage for each test."""
+    Base.metadata.create_all(bind=engine)
+    temp_dir = tempfile.mkdtemp()
+    original_video_path = settings.VIDEO_STORAGE_PATH
+    settings.VIDEO_STORAGE_PATH = temp_dir
+    yield
+    settings.VIDEO_STORAGE_PATH = original_video_path
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def auth_headers():
+    """Register and login a user, returning authorization headers."""
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpassword123"
+        }
+    )
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "testpassword123"
+        }
+    )
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+def put_range(upload_id, headers, content, start, total):
+    """Helper to upload one byte range."""
+    return client.put(
+        f"/api/v1/uploads/{upload_id}",
+        headers={**headers, "Content-Range": f"bytes {start}-{start + len(content) - 1}/{total}"},
+        content=content
+    )
+
+
+def test_resumable_upload_success(auth_headers):
+    """Test uploading a video in ranges and completing the incident."""
+    video_content = os.urandom(3000)
+    
+    response = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 3000})
+    assert response.status_code == 201
+    upload_id = response.json()["upload_id"]
+    assert response.json()["offset"] == 0
+    
+    response = put_range(upload_id, auth_headers, video_content[:1000], 0, 3000)
+    assert response.status_code == 200
+    assert response.json()["offset"] == 1000
+    
+    # Resume from the offset reported by the server
+    response = client.get(f"/api/v1/uploads/{upload_id}", headers=auth_headers)
+    offset = response.json()["offset"]
+    response = put_range(upload_id, auth_headers, video_content[offset:], offset, 3000)
+    assert response.json()["complete"] is True
+    
+    response = client.post(f"/api/v1/uploads/{upload_id}/complete", headers=auth_headers, json=INCIDENT_DATA)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["video_size"] == 3000
+    assert data["processing_status"] == "pending"
+    with open(data["video_path"], "rb") as f:
+        assert f.read() == video_content
+    
+    # The session is gone once the incident exists
+    response = client.get(f"/api/v1/uploads/{upload_id}", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_resumable_upload_rejects_wrong_offset(auth_headers):
+    """Test that ranges must continue from the current offset."""
+    response = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100})
+    upload_id = response.json()["upload_id"]
+    
+    response = put_range(upload_id, auth_headers, b"x" * 10, 50, 100)
+    
+    assert response.status_code == 409
+
+
+def test_resumable_upload_complete_requires_all_bytes(auth_headers):
+    """Test that an incomplete upload cannot be finalized."""
+    response = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100})
+    upload_id = response.json()["upload_id"]
+    put_range(upload_id, auth_headers, b"x" * 10, 0, 100)
+    
+    response = client.post(f"/api/v1/uploads/{upload_id}/complete", headers=auth_headers, json=INCIDENT_DATA)
+    
+    assert response.status_code == 409
+
+
+def test_resumable_upload_too_large(auth_headers):
+    """Test that sessions larger than the maximum video size are rejected."""
+    response = client.post(
+        "/api/v1/uploads",
+        headers=auth_headers,
+        json={"total_size": settings.MAX_VIDEO_SIZE_MB * 1024 * 1024 + 1}
+    )
+    
+    assert response.status_code == 413
+
+
+def age_upload(upload_id, hours):
+    """Helper to move an upload session's last activity into the past."""
+    db = TestingSessionLocal()
+    upload = db.query(UploadSession).filter(UploadSession.upload_id == upload_id).one()
+    upload.updated_at = datetime.utcnow() - timedelta(hours=hours)
+    db.commit()
+    part_path = upload.part_path
+    db.close()
+    return part_path
+
+
+def test_advance_upload_offset_only_from_expected_offset(auth_headers):
+    """Test that of two writers of the same range only the first advances the offset."""
+    response = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100})
+    upload_id = response.json()["upload_id"]
+    db = TestingSessionLocal()
+    
+    assert advance_upload_offset(db, upload_id, 0, 10)
+    assert not advance_upload_offset(db, upload_id, 0, 10)
+    db.close()
+    
+    response = client.get(f"/api/v1/uploads/{upload_id}", headers=auth_headers)
+    assert response.json()["offset"] == 10
+
+
+def test_resumable_upload_expired(auth_headers):
+    """Test that an idle session can no longer be resumed."""
+    response = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100})
+    upload_id = response.json()["upload_id"]
+    age_upload(upload_id, settings.UPLOAD_SESSION_EXPIRE_HOURS + 1)
+    
+    response = put_range(upload_id, auth_headers, b"x" * 10, 0, 100)
+    
+    assert response.status_code == 410
+
+
+def test_cleanup_expired_uploads(auth_headers, monkeypatch):
+    """Test that expired sessions and their partial files are deleted and active ones kept."""
+    celery_tasks = pytest.importorskip("app.tasks.celery_tasks")
+    monkeypatch.setattr(celery_tasks, "SessionLocal", TestingSessionLocal)
+    expired_id = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100}).json()["upload_id"]
+    active_id = client.post("/api/v1/uploads", headers=auth_headers, json={"total_size": 100}).json()["upload_id"]
+    expired_path = age_upload(expired_id, settings.UPLOAD_SESSION_EXPIRE_HOURS + 1)
+    active_path = age_upload(active_id, 1)
+    
+    assert celery_tasks.cleanup_expired_uploads() == 1
+    
+    assert not os.path.exists(os.path.dirname(expired_path))
+    assert os.path.exists(active_path)
+    assert client.get(f"/api/v1/uploads/{expired_id}", headers=auth_headers).status_code == 404
+    assert client.get(f"/api/v1/uploads/{active_id}", headers=auth_headers).status_code == 200
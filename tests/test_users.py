@@ -0,0 +1,147 @@
+"""
+Tests for user endpoints.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.core.database import Base, get_db
+from app.core.user_cache import UserCache, user_cache, user_from_cache, user_to_cache
+from app.models.user import User
+
+# Setup test database
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# Override the get_db dependency
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+
+app.dependency_overrides[get_db] = override_get_db
+
+# Create test client
+client = TestClient(app)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_database():
+    """Setup and teardown test database for each test."""
+    Base.metadata.create_all(bind=engine)
+    user_cache.clear()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+def get_auth_token():
+    """Helper function to register and login a user, returning access token."""
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "username": "testuser",
+            "password": "testpassword123"
+        }
+    )
+    
+    login_response = client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": "test@example.com",
+            "password": "testpassword123"
+        }
+    )
+    return login_response.json()["access_token"]
+
+
+def test_current_user_is_cached():
+    """Test that repeated authenticated requests hit the user cache."""
+    token = get_auth_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    first = client.get("/api/v1/auth/me", headers=headers)
+    second = client.get("/api/v1/auth/me", headers=headers)
+    
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    stats = user_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_update_profile_invalidates_cached_user():
+    """Test that a profile update is visible on the next request."""
+    token = get_auth_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/api/v1/auth/me", headers=headers)
+    
+    response = client.patch(
+        "/api/v1/users/me",
+        headers=headers,
+        json={"username": "renamed"}
+    )
+    assert response.status_code == 200
+    assert response.json()["username"] == "renamed"
+    
+    response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.json()["username"] == "renamed"
+
+
+def test_cached_user_excludes_password_hash():
+    """Test that the password hash is never cached but still loads for a cached user."""
+    token = get_auth_token()
+    client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    
+    db = TestingSessionLocal()
+    try:
+        user = db.query(User).filter(User.email == "test@example.com").first()
+        assert "password_hash" not in user_to_cache(user)
+        values = user_cache.get(user.user_id)
+        assert "password_hash" not in values
+    finally:
+        db.close()
+    
+    db = TestingSessionLocal()
+    try:
+        cached_user = db.merge(user_from_cache(values), load=False)
+        assert cached_user.password_hash
+    finally:
+        db.close()
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the Redis client shared by API workers."""
+    
+    def __init__(self):
+        self.values = {}
+    
+    def get(self, key):
+        return self.values.get(key)
+    
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+    
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_redis_backed_cache_sees_invalidation_from_other_workers():
+    """Test that local entries expire quickly when Redis is shared, so other workers' invalidations apply."""
+    shared = FakeRedis()
+    workers = [UserCache(ttl_seconds=30.0, local_ttl_seconds=0.0) for _ in range(2)]
+    for cache in workers:
+        cache._redis = shared
+    
+    workers[0].set("user-1", {"user_id": "user-1", "is_active": True})
+    assert workers[1].get("user-1") == {"user_id": "user-1", "is_active": True}
+    
+    workers[0].invalidate("user-1")
+    assert workers[1].get("user-1") is None
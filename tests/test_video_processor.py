@@ -0,0 +1,220 @@
+"""
+Tests for the video processing service.
+"""
+import os
+import shutil
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.adaptive_sampler import AdaptiveSampler
+from app.services.frame_buffer import FramePool
+from app.services.video_processor import VideoProcessor
+
+
+@pytest.fixture(scope="module")
+def sample_video():
+    """Write a short synthetic 10 FPS video and yield its path."""
+    temp_dir = tempfile.mkdtemp()
+    video_path = os.path.join(temp_dir, "sample.mp4")
+
+    writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*"mp4v"), 10, (64, 48))
+    for i in range(35):
+        writer.write(np.full((48, 64, 3), i * 5, dtype=np.uint8))
+    writer.release()
+
+    yield video_path
+
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_iter_frames_yields_index_and_timestamp(sample_video):
+    """Test that iter_frames yields sampled frames with presentation timestamps."""
+    frames = list(VideoProcessor().iter_frames(sample_video, fps=1))
+
+    assert [frame_idx for frame_idx, _, _ in frames] == [0, 10, 20, 30]
+    assert [timestamp for _, timestamp, _ in frames] == pytest.approx([0.0, 1.0, 2.0, 3.0])
+    assert frames[0][2].shape == (48, 64, 3)
+
+
+def test_iter_frames_is_lazy(sample_video):
+    """Test that iter_frames decodes frames on demand."""
+    frames = VideoProcessor().iter_frames(sample_video, fps=1)
+
+    frame_idx, timestamp, frame = next(frames)
+    assert frame_idx == 0
+    frames.close()
+
+
+@pytest.mark.parametrize("mode", ["grab", "seek"])
+def test_iter_frames_decodes_into_reused_buffers(sample_video, mode):
+    """Test that pooled decoding yields the same frames without allocating per frame."""
+    plain = list(VideoProcessor().iter_frames(sample_video, fps=5, mode=mode))
+    pool = FramePool(detector_size=32)
+
+    for (frame_idx, timestamp, frame), (plain_idx, plain_timestamp, plain_frame) in zip(
+        VideoProcessor().iter_frames(sample_video, fps=5, mode=mode, buffers=pool), plain
+    ):
+        assert (frame_idx, timestamp) == (plain_idx, plain_timestamp)
+        assert np.array_equal(frame.image, plain_frame)
+        assert frame.letterboxed[0].shape == (32, 32, 3)
+        pool.release([frame])
+
+    assert len(plain) == 18
+    assert pool.allocations == 1
+
+
+def test_iter_frames_adaptive_releases_skipped_buffers(sample_video):
+    """Test that candidates the sampler skips go straight back to the pool."""
+    pool = FramePool()
+    sampler = AdaptiveSampler(min_fps=0, motion_threshold=255, scene_threshold=1.1)
+
+    frames = list(VideoProcessor().iter_frames(sample_video, fps=10, mode="adaptive", sampler=sampler, buffers=pool))
+
+    assert [frame_idx for frame_idx, _, _ in frames] == [0]
+    assert sampler.skipped == 34
+    assert pool.allocations == 2
+
+
+def test_iter_frames_missing_file():
+    """Test that a missing video fails before iteration starts."""
+    with pytest.raises(FileNotFoundError):
+        VideoProcessor().iter_frames("/nonexistent/video.mp4")
+
+
+def test_extract_frames_matches_iter_frames(sample_video):
+    """Test that extract_frames returns the same frames as iter_frames."""
+    processor = VideoProcessor()
+
+    frames = processor.extract_frames(sample_video, fps=2)
+
+    assert len(frames) == len(list(processor.iter_frames(sample_video, fps=2)))
+
+
+@pytest.mark.parametrize("mode", ["read", "grab", "seek", "auto"])
+def test_iter_frames_sampling_modes_agree(sample_video, mode):
+    """Test that every sampling mode yields the same frames."""
+    expected = list(VideoProcessor().iter_frames(sample_video, fps=1, mode="read"))
+
+    frames = list(VideoProcessor().iter_frames(sample_video, fps=1, mode=mode))
+
+    assert [frame_idx for frame_idx, _, _ in frames] == [frame_idx for frame_idx, _, _ in expected]
+    for (_, _, frame), (_, _, expected_frame) in zip(frames, expected):
+        assert np.array_equal(frame, expected_frame)
+
+
+def test_iter_frames_unknown_mode(sample_video):
+    """Test that an unknown sampling mode is rejected."""
+    with pytest.raises(ValueError):
+        VideoProcessor().iter_frames(sample_video, mode="bogus")
+
+
+@pytest.mark.parametrize("mode", ["grab", "seek"])
+def test_iter_frames_frame_range(sample_video, mode):
+    """Test that a frame range samples the same absolute frames as a full pass."""
+    frames = list(VideoProcessor().iter_frames(sample_video, fps=1, mode=mode, start_frame=5, end_frame=30))
+
+    assert [frame_idx for frame_idx, _, _ in frames] == [10, 20]
+    assert [timestamp for _, timestamp, _ in frames] == pytest.approx([1.0, 2.0])
+
+
+def test_plan_segments_cover_full_pass(sample_video):
+    """Test that processing every segment samples exactly the frames of one pass."""
+    processor = VideoProcessor()
+    segments = processor.plan_segments(sample_video, fps=1, segment_seconds=1.5)
+
+    assert [(segment.start_frame, segment.end_frame) for segment in segments] == [(0, 10), (10, 20), (20, 30), (30, None)]
+
+    full_pass = [(frame_idx, timestamp) for frame_idx, timestamp, _ in processor.iter_frames(sample_video, fps=1)]
+    segmented = []
+    for segment in segments:
+        for frame_idx, timestamp, _ in processor.iter_frames(
+            sample_video, fps=1, start_frame=segment.start_frame, end_frame=segment.end_frame
+        ):
+            assert timestamp >= segment.start_time
+            assert segment.end_time is None or timestamp < segment.end_time
+            segmented.append((frame_idx, timestamp))
+
+    assert segmented == full_pass
+
+
+def test_plan_segments_disabled(sample_video):
+    """Test that a non-positive segment length yields a single segment."""
+    segments = VideoProcessor().plan_segments(sample_video, fps=1, segment_seconds=0)
+
+    assert segments == [(0, None, 0.0, None)]
+
+
+class NoFrameRateCapture:
+    """VideoCapture wrapper reporting a frame rate of 0, as some streams do."""
+
+    def __init__(self, capture_class, *args):
+        self.capture = capture_class(*args)
+
+    def get(self, prop):
+        return 0.0 if prop == cv2.CAP_PROP_FPS else self.capture.get(prop)
+
+    def __getattr__(self, name):
+        return getattr(self.capture, name)
+
+
+def test_plan_segments_without_frame_rate(sample_video, monkeypatch):
+    """Test that a video reporting fps=0 falls back to one segment and no event window."""
+    capture_class = cv2.VideoCapture
+    monkeypatch.setattr(cv2, "VideoCapture", lambda *args: NoFrameRateCapture(capture_class, *args))
+    processor = VideoProcessor()
+
+    assert processor.get_video_info(sample_video)["duration"] == 0.0
+    assert processor.plan_segments(sample_video, fps=1, segment_seconds=1.0) == [(0, None, 0.0, None)]
+    window, backfill = processor.plan_event_segments(
+        sample_video, event_time=0.0, window_seconds=0.5, window_fps=5, fps=1, segment_seconds=1.0
+    )
+    assert window == []
+    assert backfill == [(0, None, 0.0, None)]
+
+
+def test_plan_event_segments_window_dense_rest_single_pass(sample_video):
+    """Test that the event window is sampled densely and the rest like one full pass."""
+    processor = VideoProcessor()
+    window, backfill = processor.plan_event_segments(
+        sample_video, event_time=1.7, window_seconds=0.5, window_fps=5, fps=1, segment_seconds=1.0
+    )
+
+    assert [(segment.start_frame, segment.end_frame) for segment in window] == [(10, 20), (20, 30)]
+    assert [(segment.start_frame, segment.end_frame) for segment in backfill] == [(0, 10), (30, None)]
+
+    sampled = {}
+    for segments, fps in ((window, 5), (backfill, 1)):
+        for segment in segments:
+            for frame_idx, timestamp, _ in processor.iter_frames(
+                sample_video, fps=fps, start_frame=segment.start_frame, end_frame=segment.end_frame
+            ):
+                # Time bounds must not overlap, or a retried segment deletes another's rows
+                assert timestamp >= segment.start_time
+                assert segment.end_time is None or timestamp < segment.end_time
+                sampled[frame_idx] = fps
+
+    assert sorted(sampled) == [0, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 30]
+
+
+def test_plan_event_segments_event_outside_video(sample_video):
+    """Test that an event time past the end still yields a window inside the video."""
+    window, backfill = VideoProcessor().plan_event_segments(
+        sample_video, event_time=60.0, window_seconds=1.0, window_fps=5, fps=1, segment_seconds=0
+    )
+
+    assert [(segment.start_frame, segment.end_frame) for segment in window] == [(30, None)]
+    assert [(segment.start_frame, segment.end_frame) for segment in backfill] == [(0, 30)]
+
+
+def test_iter_frames_adaptive_keeps_changed_frames(sample_video):
+    """Test that adaptive sampling skips candidates too similar to the last kept frame."""
+    sampler = AdaptiveSampler(min_fps=0, motion_threshold=7.5, scene_threshold=2.0)
+
+    frames = list(VideoProcessor().iter_frames(sample_video, fps=10, mode="adaptive", sampler=sampler))
+
+    # Brightness rises by 5 per frame, so every second frame differs enough
+    assert [frame_idx for frame_idx, _, _ in frames] == list(range(0, 35, 2))
+    assert (sampler.kept, sampler.skipped) == (18, 17)